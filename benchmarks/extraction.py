@@ -0,0 +1,69 @@
+"""Job-card parsing cost: per-element round trips versus one page.evaluate.
+
+Loads the static LinkedIn results fixture (25 cards) and parses it both
+ways: the old loop issuing query_selector/inner_text/get_attribute per
+field, and the portal's ExtractionSpec run through extract_cards.
+Requires a Playwright Chromium install.
+
+    PYTHONPATH=src python benchmarks/extraction.py [ITERATIONS]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from playwright.async_api import async_playwright
+
+from mjas.portals.extraction import extract_cards
+from mjas.portals.linkedin import LinkedInPortal
+
+FIXTURE = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "linkedin_search.html"
+
+
+async def parse_per_element(page) -> list:
+    """The pre-ExtractionSpec LinkedIn loop: 4 lookups and 4 reads per card."""
+    results = []
+    for card in (await page.query_selector_all("li.jobs-search-results__list-item"))[:25]:
+        title_elem = await card.query_selector("h3.base-search-card__title")
+        company_elem = await card.query_selector("h4.base-search-card__subtitle")
+        loc_elem = await card.query_selector("span.job-search-card__location")
+        link_elem = await card.query_selector("a.base-card__full-link")
+        results.append({
+            "title": await title_elem.inner_text(),
+            "company": await company_elem.inner_text(),
+            "location": await loc_elem.inner_text(),
+            "url": await link_elem.get_attribute("href"),
+        })
+    return results
+
+
+async def time_it(fn, page, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        cards = await fn(page)
+    assert len(cards) == 25
+    return (time.perf_counter() - start) / iterations
+
+
+async def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    spec = LinkedInPortal.DEFAULT_CONFIG.extraction
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        page = await browser.new_page()
+        await page.set_content(FIXTURE.read_text())
+
+        before = await time_it(parse_per_element, page, iterations)
+        after = await time_it(lambda p: extract_cards(p, spec), page, iterations)
+        await browser.close()
+
+    print(f"25-card results page, {iterations} iterations")
+    print(f"  per-element round trips : {before * 1000:7.2f} ms/page")
+    print(f"  single page.evaluate    : {after * 1000:7.2f} ms/page")
+    print(f"  speedup                 : {before / after:7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
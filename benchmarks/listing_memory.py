@@ -0,0 +1,74 @@
+"""Measure per-listing memory for JobListing before and after slotting.
+
+Builds N listings the way a portal search does (portal and priority
+strings created at runtime, as they would be after parsing a page) and
+reports traced bytes per instance.
+
+    PYTHONPATH=src python benchmarks/listing_memory.py [N]
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from mjas.portals.base import JobListing
+
+
+@dataclass
+class LegacyJobListing:
+    """JobListing as it was before slots: a __dict__ and an eager metadata dict."""
+    job_id: str
+    title: str
+    company: str
+    location: str
+    url: str
+    portal: str
+    description: Optional[str] = None
+    salary_range: Optional[str] = None
+    posted_date: Optional[datetime] = None
+    score: int = 0
+    priority: str = "MEDIUM"
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def build(cls, n: int) -> list:
+    portals = ["linkedin", "indeed", "wellfound", "naukri"]
+    listings = []
+    for i in range(n):
+        listings.append(cls(
+            job_id=f"li-{i}",
+            title=f"AI Engineer {i}",
+            company=f"Company {i % 500}",
+            location="Remote",
+            url=f"https://example.com/jobs/{i}",
+            # Fresh string objects, like text pulled out of a page
+            portal="".join(portals[i % len(portals)]),
+            priority="".join("HIGH" if i % 3 == 0 else "MEDIUM"),
+            score=65 + i % 35,
+        ))
+    return listings
+
+
+def measure(cls, n: int) -> float:
+    tracemalloc.start()
+    listings = build(cls, n)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del listings
+    return current / n
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    before = measure(LegacyJobListing, n)
+    after = measure(JobListing, n)
+    print(f"{n} listings")
+    print(f"  plain dataclass : {before:7.1f} bytes/listing")
+    print(f"  slotted         : {after:7.1f} bytes/listing")
+    print(f"  saved           : {before - after:7.1f} bytes/listing ({1 - after / before:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Per-operation page overhead: new_page/close versus PagePool.
+
+Each iteration opens a page, loads a small search-result-sized document
+and gives the page back, which is the page lifecycle of one portal
+search. Requires a Playwright Chromium install (``playwright install
+chromium``).
+
+    PYTHONPATH=src python benchmarks/page_pool.py [ITERATIONS]
+"""
+
+import asyncio
+import sys
+import time
+from urllib.parse import quote
+
+from playwright.async_api import async_playwright
+
+from mjas.portals.page_pool import PagePool
+
+CARDS = "".join(
+    f'<div class="job-card"><a href="/jobs/{i}">AI Engineer {i}</a>'
+    f'<span class="company">Company {i}</span></div>'
+    for i in range(25)
+)
+PAGE_URL = "data:text/html," + quote(f"<html><body>{CARDS}</body></html>")
+
+
+async def per_op_new_page(context, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        page = await context.new_page()
+        try:
+            await page.goto(PAGE_URL)
+            await page.query_selector_all(".job-card")
+        finally:
+            await page.close()
+    return (time.perf_counter() - start) / iterations
+
+
+async def per_op_pool(context, iterations: int) -> float:
+    pool = PagePool(context)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        page = await pool.acquire()
+        try:
+            await page.goto(PAGE_URL)
+            await page.query_selector_all(".job-card")
+        finally:
+            await pool.release(page)
+    elapsed = time.perf_counter() - start
+    await pool.close()
+    return elapsed / iterations
+
+
+async def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        context = await browser.new_context()
+
+        # Warm up the renderer so neither variant pays first-launch cost
+        await per_op_new_page(context, 3)
+
+        before = await per_op_new_page(context, iterations)
+        after = await per_op_pool(context, iterations)
+        await browser.close()
+
+    print(f"{iterations} searches")
+    print(f"  new_page/close : {before * 1000:7.2f} ms/search")
+    print(f"  PagePool       : {after * 1000:7.2f} ms/search")
+    print(f"  saved          : {(before - after) * 1000:7.2f} ms/search")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
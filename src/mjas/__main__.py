@@ -3,11 +3,19 @@
 import argparse
 import asyncio
 import logging
+import os
 import sys
+from dataclasses import replace
 from pathlib import Path
 
-from mjas.core.database import Database
-from mjas.core.swarm import SwarmConfig, SwarmOrchestrator
+from mjas.core.backend import default_node_id, keep_alive
+from mjas.core.database import Database, JobStatus, STORAGE_PROFILES
+from mjas.core.queue_server import DEFAULT_PORT, serve
+from mjas.core.remote_backend import RemoteBackend
+from mjas.core.retention import ArchiveStore, RetentionPolicy
+from mjas.core.migrations import MIGRATIONS
+from mjas.core.sharding import ShardSpec, ShardSupervisor, shard_portals, shared_storage
+from mjas.core.swarm import SwarmConfig, SwarmOrchestrator, resolve_portals
 from mjas.core.session_manager import SessionManager
 from mjas.portals.base import CandidateProfile
 from mjas.portals.registry import (
@@ -75,16 +83,28 @@ async def cmd_run(args):
     """Run full cycle."""
     setup_logging(args.verbose)
 
-    db = Database()
+    if args.queue_url:
+        if args.processes > 1:
+            print("ERROR: --processes cannot be combined with --queue-url; run more nodes instead.")
+            return 1
+        return await run_node(args)
+
+    db = Database(storage=STORAGE_PROFILES[args.storage])
     await db.init()
 
     session_mgr = SessionManager()
     profile = load_candidate_profile()
     config = SwarmConfig(
         headless=not args.visible,
-        daily_application_target=args.target
+        daily_application_target=args.target,
+        pipelined=args.pipelined
     )
 
+    if args.processes > 1:
+        # Migrations ran above, once, before any shard opens the database
+        await db.close()
+        return await run_sharded(args, config, profile)
+
     swarm = SwarmOrchestrator(config, db, profile, session_mgr)
     await swarm.initialize_workers(args.portals, tier=args.tier)
 
@@ -106,6 +126,108 @@ async def cmd_run(args):
     return 0
 
 
+async def run_node(args) -> int:
+    """Run as one node of a multi-machine swarm sharing a queue server."""
+    db = RemoteBackend(args.queue_url, token=args.queue_token)
+    await db.init()
+
+    node_id = args.node_id or default_node_id()
+    requested = resolve_portals(args.portals, args.tier)
+    await db.register_node(node_id, requested)
+    portals = await db.portal_assignment(node_id)
+    print(f"Node {node_id} assigned: {', '.join(portals) or 'nothing'}")
+
+    swarm = SwarmOrchestrator(
+        SwarmConfig(
+            headless=not args.visible,
+            daily_application_target=args.target,
+            pipelined=args.pipelined
+        ),
+        db, load_candidate_profile(), SessionManager()
+    )
+    swarm.assigned_portals = set(portals)
+    heartbeat = None
+    try:
+        if portals:
+            await swarm.initialize_workers(portals)
+        # Portals move between nodes as they join or leave. Started only now,
+        # so a change cannot start a second worker for a portal still starting;
+        # one made meanwhile is applied on the first heartbeat.
+        heartbeat = asyncio.create_task(keep_alive(
+            db, node_id, requested, on_change=swarm.apply_assignment, assigned=portals
+        ))
+        if not swarm.workers and not args.continuous:
+            print("ERROR: No workers initialized on this node.")
+            return 1
+
+        if args.continuous:
+            await swarm.continuous_mode(interval_minutes=args.interval)
+        else:
+            stats = await swarm.run_full_cycle()
+            print("\n=== Results ===")
+            print(f"Jobs discovered: {stats['research']}")
+            print(f"Jobs applied: {stats['applied']}")
+            print(f"Total in shared queue: {stats.get('total_jobs', 0)}")
+        return 0
+    finally:
+        if heartbeat is not None:
+            heartbeat.cancel()
+        await swarm.shutdown()
+        try:
+            await db.deregister_node(node_id)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Could not deregister node {node_id}: {e}")
+        await db.close()
+
+
+async def cmd_serve_queue(args):
+    """Serve the local database as a job queue shared by several nodes."""
+    setup_logging(args.verbose)
+
+    db = Database(storage=STORAGE_PROFILES[args.storage])
+    await db.init()
+    runner = await serve(db, host=args.host, port=args.port, token=args.token)
+    print(f"Serving {db.db_path} on http://{args.host}:{args.port} (Ctrl+C to stop)")
+    try:
+        while True:
+            await asyncio.sleep(60)
+            # Jobs leased by nodes that died mid-application
+            await db.reap_expired_leases()
+    finally:
+        await runner.cleanup()
+        await db.close()
+
+
+async def run_sharded(args, config: SwarmConfig, profile: CandidateProfile) -> int:
+    """Run the portals split across ``args.processes`` shard processes."""
+    groups = shard_portals(resolve_portals(args.portals, args.tier), args.processes)
+    storage = shared_storage(STORAGE_PROFILES[args.storage])
+    specs = [
+        ShardSpec(
+            shard_id=index,
+            portals=portals,
+            # Retention and compaction run in one shard only
+            config=config if index == 0 else replace(config, retention=None),
+            profile=profile,
+            storage=storage,
+            continuous=args.continuous,
+            interval_minutes=args.interval,
+            verbose=args.verbose,
+        )
+        for index, portals in enumerate(groups)
+    ]
+    print(f"Running {len(specs)} shards: " + "; ".join(", ".join(g) for g in groups))
+
+    totals = await ShardSupervisor(specs).run()
+    print("\n=== Results ===")
+    print(f"Jobs discovered: {totals['research']}")
+    print(f"Jobs applied: {totals['applied']}")
+    print(f"Total in database: {totals['total_jobs']}")
+    if totals["restarts"]:
+        print(f"Shard restarts: {totals['restarts']}")
+    return 0
+
+
 async def cmd_list_portals(args):
     """List available job portals."""
     print("\n=== MJAS Job Portals ===\n")
@@ -144,8 +266,15 @@ async def cmd_list_portals(args):
 
 async def cmd_stats(args):
     """Show statistics."""
-    db = Database()
+    db = Database(read_only=True)
+    if not db.db_path.exists():
+        print("No database found. Run 'python -m mjas setup' first.")
+        return 1
     await db.init()
+    if await db.migrate(dry_run=True):
+        print("Database schema is out of date. Run 'python -m mjas db migrate' first.")
+        await db.close()
+        return 1
 
     stats = await db.get_stats()
     portal_stats = await db.get_portal_stats()
@@ -167,6 +296,89 @@ async def cmd_stats(args):
     return 0
 
 
+async def cmd_search(args):
+    """Full-text search over tracked jobs."""
+    db = Database(read_only=True)
+    if not db.db_path.exists():
+        print("No database found. Run 'python -m mjas setup' first.")
+        return 1
+    await db.init()
+
+    status = JobStatus(args.status) if args.status else None
+    results = await db.search_jobs(args.text, status=status, portal=args.portal, limit=args.limit)
+
+    if not results:
+        print("No matching jobs.")
+    for job in results:
+        print(f"[{job['score']:>3}] {job['status']:<9} {job['portal']:<14} "
+              f"{job['title']} @ {job['company']}")
+        print(f"      {job['url']}")
+
+    await db.close()
+    return 0
+
+
+async def cmd_db(args):
+    """Database maintenance commands."""
+    if args.db_command == 'migrate':
+        db = Database(read_only=args.dry_run)
+        if args.dry_run and not db.db_path.exists():
+            # Opening would create the file; report what a first run would apply
+            print(f"Database: {db.db_path} (does not exist yet)")
+            print("Pending migrations:")
+            for migration in MIGRATIONS:
+                print(f"  {migration.version:03d} {migration.name}")
+            return 0
+
+        await db.init(migrate=False)
+        version = await db.schema_version()
+        pending = await db.migrate(dry_run=True)
+
+        print(f"Database: {db.db_path} (schema version {version})")
+        if not pending:
+            print("Schema is up to date.")
+        elif args.dry_run:
+            print("Pending migrations:")
+            for migration in pending:
+                print(f"  {migration.version:03d} {migration.name}")
+        else:
+            applied = await db.migrate(progress=print)
+            print(f"Applied {len(applied)} migration(s); now at version {await db.schema_version()}.")
+
+        await db.close()
+        return 0
+
+    if args.db_command == 'compact':
+        db = Database()
+        await db.init()
+        if not args.no_archive:
+            policy = RetentionPolicy(job_days=args.job_days, application_days=args.application_days)
+            async with ArchiveStore(Path(args.archive)) as archive:
+                retained = await db.archive_expired(archive, policy)
+            print(f"Archived {retained.jobs_archived} jobs and "
+                  f"{retained.applications_archived} application attempts to {args.archive}")
+
+        report = await db.compact()
+        if report.full_vacuum:
+            print("Ran a full VACUUM to enable incremental compaction.")
+        print(f"Database size: {report.bytes_before:,} -> {report.bytes_after:,} bytes "
+              f"({report.bytes_reclaimed:,} reclaimed)")
+        await db.close()
+        return 0
+
+    if args.db_command == 'rebuild-stats':
+        db = Database()
+        await db.init()
+        await db.rebuild_stats()
+        stats = await db.get_stats()
+        print(f"Rebuilt portal stats: {stats['total_jobs']} jobs across "
+              f"{len(await db.get_portal_stats())} portal(s).")
+        await db.close()
+        return 0
+
+    return 1
+
+
 async def cmd_setup_sessions(args):
     """Interactive session setup with Google Sign-In."""
     from playwright.async_api import async_playwright
@@ -234,7 +446,7 @@ async def cmd_setup_sessions(args):
                         asyncio.get_event_loop().run_in_executor(None, input),
                         timeout=300  # 5 minutes
                     )
-                except asyncio.TimeoutError:
+                except TimeoutError:
                     print(f"\n[{portal}] Timeout - skipping.")
                     await context.close()
                     continue
@@ -275,7 +487,15 @@ Examples:
   python -m mjas run                      # Run one full cycle
   python -m mjas run --continuous         # Run continuously
   python -m mjas run --visible            # Show browser window
+  python -m mjas run --pipelined          # Apply while searches are still running
+  python -m mjas run --processes 4        # Shard portals across 4 processes
+  python -m mjas serve-queue --host 0.0.0.0  # Share this database with other nodes
+  python -m mjas run --queue-url http://queue-host:8765  # Run as a node
   python -m mjas stats                    # Show statistics
+  python -m mjas search "langgraph remote" # Full-text search over jobs
+  python -m mjas db migrate --dry-run     # Show pending schema migrations
+  python -m mjas db compact               # Archive old rows, reclaim space
+  python -m mjas db rebuild-stats         # Recompute drifted stats counters
         """
     )
 
@@ -290,13 +510,59 @@ Examples:
     run_parser.add_argument('--tier', type=int, choices=[1, 2, 3], help='Portal tier (1=major, 2=secondary, 3=specialized)')
     run_parser.add_argument('--visible', action='store_true', help='Show browser window')
     run_parser.add_argument('--continuous', action='store_true', help='Run continuously')
-    run_parser.add_argument('--interval', type=int, default=120, help='Minutes between cycles')
+    run_parser.add_argument('--interval', type=int, default=120,
+                            help='Default minutes between a portal\'s searches (and applications)')
     run_parser.add_argument('--target', type=int, default=200, help='Daily application target')
+    run_parser.add_argument('--pipelined', action='store_true',
+                            help='Apply to jobs as searches find them instead of after research')
+    run_parser.add_argument('--processes', type=int, default=1,
+                            help='Split portals across this many processes, one browser each')
+    run_parser.add_argument('--storage', choices=sorted(STORAGE_PROFILES), default='default',
+                            help='SQLite storage profile (production = WAL + single writer)')
+    run_parser.add_argument('--queue-url', help='Use a shared queue server instead of the local database')
+    run_parser.add_argument('--queue-token', default=os.environ.get('MJAS_QUEUE_TOKEN'),
+                            help='Queue server token (default: $MJAS_QUEUE_TOKEN)')
+    run_parser.add_argument('--node-id', help='This node\'s name on the queue server (default: hostname)')
     run_parser.add_argument('-v', '--verbose', action='store_true')
 
+    # Queue server command
+    serve_parser = subparsers.add_parser('serve-queue', help='Share the job queue with other nodes')
+    serve_parser.add_argument('--host', default='127.0.0.1', help='Address to bind')
+    serve_parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Port to listen on')
+    serve_parser.add_argument('--token', default=os.environ.get('MJAS_QUEUE_TOKEN'),
+                              help='Token nodes must present (default: $MJAS_QUEUE_TOKEN)')
+    serve_parser.add_argument('--storage', choices=sorted(STORAGE_PROFILES), default='production',
+                              help='SQLite storage profile')
+    serve_parser.add_argument('-v', '--verbose', action='store_true')
+
     # Stats command
     subparsers.add_parser('stats', help='Show statistics')
 
+    # Search command
+    search_parser = subparsers.add_parser('search', help='Full-text search over tracked jobs')
+    search_parser.add_argument('text', help='Words to match in title, company or description')
+    search_parser.add_argument('--status', choices=[s.value for s in JobStatus], help='Only jobs with this status')
+    search_parser.add_argument('--portal', help='Only jobs from this portal')
+    search_parser.add_argument('--limit', type=int, default=20, help='Maximum results')
+
+    # Database maintenance commands
+    db_parser = subparsers.add_parser('db', help='Database maintenance')
+    db_subparsers = db_parser.add_subparsers(dest='db_command', required=True)
+    migrate_parser = db_subparsers.add_parser('migrate', help='Apply pending schema migrations')
+    migrate_parser.add_argument('--dry-run', action='store_true', help='Only list pending migrations')
+    compact_parser = db_subparsers.add_parser(
+        'compact', help='Archive expired rows and reclaim free space'
+    )
+    compact_parser.add_argument('--job-days', type=int, default=30,
+                                help='Archive failed/skipped jobs untouched for this many days')
+    compact_parser.add_argument('--application-days', type=int, default=90,
+                                help='Archive application attempts older than this many days')
+    compact_parser.add_argument('--archive', default='data/mjas-archive.db',
+                                help='Archive database path')
+    compact_parser.add_argument('--no-archive', action='store_true',
+                                help='Only vacuum, do not archive any rows')
+    db_subparsers.add_parser('rebuild-stats', help='Recompute portal statistics counters from scratch')
+
     # List portals command
     subparsers.add_parser('list-portals', help='List available job portals')
 
@@ -319,9 +585,12 @@ Examples:
     handlers = {
         'setup': cmd_setup,
         'run': cmd_run,
+        'serve-queue': cmd_serve_queue,
         'stats': cmd_stats,
         'list-portals': cmd_list_portals,
         'setup-sessions': cmd_setup_sessions,
+        'search': cmd_search,
+        'db': cmd_db,
     }
 
     handler = handlers.get(args.command)
@@ -4,14 +4,22 @@ This module contains the foundational classes and utilities that power
 the MJAS job application automation system.
 """
 
-from mjas.core.database import Database, JobStatus
+from mjas.core.backend import QueueBackend
+from mjas.core.browser_pool import BrowserPool
+from mjas.core.database import Database, JobRow, JobStatus, StorageProfile
+from mjas.core.scheduler import TaskScheduler
 from mjas.core.swarm import SwarmOrchestrator, SwarmConfig
 from mjas.core.worker import PortalWorker
 from mjas.core.session_manager import SessionManager
 
 __all__ = [
+    "BrowserPool",
+    "QueueBackend",
     "Database",
+    "JobRow",
     "JobStatus",
+    "StorageProfile",
+    "TaskScheduler",
     "SwarmOrchestrator",
     "SwarmConfig",
     "PortalWorker",
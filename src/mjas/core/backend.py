@@ -0,0 +1,239 @@
+"""The job queue and storage interface shared by workers and the swarm.
+
+Workers only need a handful of operations: queue new listings, claim
+jobs under a lease, record outcomes and release what they did not get
+to. :class:`QueueBackend` names that surface so the swarm can run against
+the local SQLite :class:`~mjas.core.database.Database` (the default) or a
+:class:`~mjas.core.remote_backend.RemoteBackend` that talks to a queue
+server shared by several machines.
+
+Nodes running against a shared queue register with it and heartbeat.
+Each portal is assigned to exactly one live node, so two machines do not
+search the same portal with the same account; job claims stay leased on
+top of that, so even overlapping nodes never apply to the same job twice.
+"""
+
+import asyncio
+import hashlib
+import logging
+import socket
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+)
+
+if TYPE_CHECKING:
+    from mjas.core.database import JobStatus
+    from mjas.portals.base import JobListing
+
+logger = logging.getLogger(__name__)
+
+# A node that has not heartbeated for this long loses its portals
+NODE_TTL_SECONDS = 300
+
+
+class BackendError(RuntimeError):
+    """Raised when a queue backend cannot complete a request."""
+
+
+def default_node_id() -> str:
+    """Identify this machine as a swarm node."""
+    return socket.gethostname()
+
+
+def assign_portals(nodes: Mapping[str, Sequence[str]]) -> Dict[str, List[str]]:
+    """Give each portal to one of the nodes that asked for it.
+
+    Uses rendezvous hashing: every (node, portal) pair gets a stable
+    pseudo-random weight and the heaviest node wins. The result depends
+    only on the set of nodes, not on registration order, and a node
+    joining or leaving only moves the portals it wins or held.
+
+    Args:
+        nodes: Node id to the portals that node is able to run.
+
+    Returns:
+        Node id to its assigned portals, in the node's requested order.
+    """
+    wanted: Dict[str, List[str]] = {}
+    for node_id, portals in nodes.items():
+        for portal in portals:
+            wanted.setdefault(portal, []).append(node_id)
+
+    owner = {
+        portal: max(candidates, key=lambda node_id: _weight(node_id, portal))
+        for portal, candidates in wanted.items()
+    }
+    return {
+        node_id: [portal for portal in portals if owner[portal] == node_id]
+        for node_id, portals in nodes.items()
+    }
+
+
+def _weight(node_id: str, portal: str) -> int:
+    digest = hashlib.sha256(f"{node_id}\0{portal}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class QueueBackend(ABC):
+    """Job queue, application log and node registry used by a swarm."""
+
+    @abstractmethod
+    async def init(self) -> None:
+        """Open the backend."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Flush pending work and release connections."""
+
+    # -- Jobs ----------------------------------------------------------------
+
+    @abstractmethod
+    async def insert_jobs_bulk(
+        self,
+        listings: Iterable["JobListing"],
+        status: "JobStatus"
+    ) -> List[str]:
+        """Queue listings; returns the ids that were new."""
+
+    @abstractmethod
+    async def claim_jobs(
+        self,
+        portal: str,
+        n: int,
+        lease_seconds: float,
+        owner: Optional[str] = None,
+        job_ids: Optional[Iterable[str]] = None
+    ) -> List[Dict]:
+        """Atomically lease up to ``n`` queued jobs for ``portal``."""
+
+    @abstractmethod
+    async def release_jobs(self, job_ids: Iterable[str], owner: Optional[str] = None) -> int:
+        """Return jobs leased by ``owner`` to the queue."""
+
+    @abstractmethod
+    async def reap_expired_leases(self, now: Optional[datetime] = None) -> int:
+        """Re-queue jobs whose lease has expired."""
+
+    @abstractmethod
+    async def update_job_status(
+        self,
+        job_id: str,
+        status: "JobStatus",
+        notes: Optional[str] = None,
+        screenshot_path: Optional[str] = None
+    ) -> None:
+        """Record a job's new status."""
+
+    @abstractmethod
+    async def log_application_attempt(
+        self,
+        job_id: str,
+        success: bool,
+        error_message: Optional[str] = None,
+        screenshot_path: Optional[str] = None,
+        form_data: Optional[Dict] = None,
+        response_time_ms: Optional[int] = None
+    ) -> None:
+        """Record one application attempt."""
+
+    @abstractmethod
+    async def get_stats(self) -> Dict:
+        """Queue-wide job counts."""
+
+    # -- Search yield --------------------------------------------------------
+
+    @abstractmethod
+    async def record_search_yield(
+        self,
+        portal: str,
+        keyword: str,
+        location: str,
+        new_jobs: int
+    ) -> None:
+        """Record how many new jobs one search found."""
+
+    @abstractmethod
+    async def get_search_yields(self, portals: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Yield history per (portal, keyword, location)."""
+
+    # -- Continuous-mode schedule ----------------------------------------------
+
+    @abstractmethod
+    async def get_portal_schedule(self) -> List[Dict]:
+        """Saved due times, one row per (portal, kind)."""
+
+    @abstractmethod
+    async def set_portal_schedule(self, portal: str, kind: str, next_run_at: datetime) -> None:
+        """Save when ``portal``'s next ``kind`` run is due."""
+
+    # -- Nodes ---------------------------------------------------------------
+
+    @abstractmethod
+    async def register_node(self, node_id: str, portals: Sequence[str]) -> None:
+        """Announce a node and the portals it can run (re-registering replaces them)."""
+
+    @abstractmethod
+    async def heartbeat_node(self, node_id: str) -> bool:
+        """Mark a node alive. Returns False if it is not registered."""
+
+    @abstractmethod
+    async def deregister_node(self, node_id: str) -> None:
+        """Remove a node so its portals move to the others."""
+
+    @abstractmethod
+    async def active_nodes(self, ttl_seconds: float = NODE_TTL_SECONDS) -> Dict[str, List[str]]:
+        """Nodes seen within ``ttl_seconds``, with the portals each can run."""
+
+    async def portal_assignment(
+        self,
+        node_id: str,
+        ttl_seconds: float = NODE_TTL_SECONDS
+    ) -> List[str]:
+        """The portals ``node_id`` should run among the live nodes."""
+        return assign_portals(await self.active_nodes(ttl_seconds)).get(node_id, [])
+
+
+async def keep_alive(
+    backend: QueueBackend,
+    node_id: str,
+    portals: Sequence[str],
+    interval_seconds: float = NODE_TTL_SECONDS / 5,
+    on_change: Optional[Callable[[List[str]], Awaitable[None]]] = None,
+    assigned: Optional[List[str]] = None
+) -> None:
+    """Heartbeat ``node_id`` until cancelled.
+
+    Re-registers if the server forgot the node (e.g. it was restarted) and
+    checks the portal assignment, which changes as nodes join or leave.
+    A new assignment is passed to ``on_change`` (e.g.
+    :meth:`SwarmOrchestrator.apply_assignment
+    <mjas.core.swarm.SwarmOrchestrator.apply_assignment>`); if that fails
+    it is retried on the next heartbeat.
+
+    ``assigned`` is the assignment the caller is already running (default:
+    the current one), so a change made before the first heartbeat is
+    still reported.
+    """
+    if assigned is None:
+        assigned = await backend.portal_assignment(node_id)
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            if not await backend.heartbeat_node(node_id):
+                await backend.register_node(node_id, portals)
+            current = await backend.portal_assignment(node_id)
+        except Exception as e:
+            logger.warning(f"Heartbeat for node {node_id} failed: {e}")
+            continue
+        if current == assigned:
+            continue
+        logger.info(f"Portal assignment for node {node_id} changed: {assigned} -> {current}")
+        if on_change is not None:
+            try:
+                await on_change(current)
+            except Exception as e:
+                logger.error(f"Could not apply portal assignment for node {node_id}: {e}")
+                continue
+        assigned = current
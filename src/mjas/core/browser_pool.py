@@ -0,0 +1,115 @@
+"""Shared Playwright driver and browser processes for portal workers."""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """One Playwright driver and a few Chromium processes shared by all workers.
+
+    Each worker gets its own ``BrowserContext``, which isolates cookies and
+    storage just like a separate browser would, at a fraction of the
+    memory and startup cost. A new browser is launched only when every
+    running one already hosts ``contexts_per_browser`` contexts. A browser
+    that crashes or disconnects is dropped with its contexts, so the next
+    request launches a replacement instead of counting against
+    ``max_browsers``.
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        max_browsers: int = 1,
+        contexts_per_browser: int = 16,
+        launch_options: Optional[Dict[str, Any]] = None
+    ):
+        self.headless = headless
+        self.max_browsers = max_browsers
+        self.contexts_per_browser = contexts_per_browser
+        self.launch_options = launch_options or {}
+        self.playwright: Optional[Playwright] = None
+        self._browsers: List[Browser] = []
+        self._contexts: Dict[Browser, List[BrowserContext]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def browser_count(self) -> int:
+        return len(self._browsers)
+
+    @property
+    def context_count(self) -> int:
+        return sum(len(contexts) for contexts in self._contexts.values())
+
+    async def start(self) -> None:
+        """Start the Playwright driver. Browsers launch on first use."""
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+
+    async def new_context(self, **options) -> BrowserContext:
+        """Create an isolated context on the least loaded browser.
+
+        Accepts the same keyword arguments as ``Browser.new_context``,
+        e.g. ``storage_state`` to restore a saved session.
+        """
+        async with self._lock:
+            if self.playwright is None:
+                await self.start()
+            browser = await self._pick_browser()
+            context = await browser.new_context(**options)
+            self._contexts[browser].append(context)
+
+        context.on("close", lambda _: self._forget(browser, context))
+        return context
+
+    async def _pick_browser(self) -> Browser:
+        for browser in [b for b in self._browsers if not b.is_connected()]:
+            self._drop(browser)
+        candidates = [
+            b for b in self._browsers if len(self._contexts[b]) < self.contexts_per_browser
+        ]
+        if candidates:
+            return min(candidates, key=lambda b: len(self._contexts[b]))
+
+        if len(self._browsers) < self.max_browsers:
+            browser = await self.playwright.chromium.launch(
+                headless=self.headless, **self.launch_options
+            )
+            self._browsers.append(browser)
+            self._contexts[browser] = []
+            browser.on("disconnected", lambda _: self._drop(browser))
+            logger.info(f"Launched browser {len(self._browsers)}/{self.max_browsers}")
+            return browser
+
+        # Every browser is full: overcommit the least loaded one rather than fail
+        if not self._browsers:
+            raise RuntimeError("No connected browsers left in the pool")
+        return min(self._browsers, key=lambda b: len(self._contexts[b]))
+
+    def _drop(self, browser: Browser) -> None:
+        if browser in self._browsers:
+            self._browsers.remove(browser)
+            lost = self._contexts.pop(browser, [])
+            logger.warning(f"Browser disconnected; dropped it and {len(lost)} contexts")
+
+    def _forget(self, browser: Browser, context: BrowserContext) -> None:
+        contexts = self._contexts.get(browser)
+        if contexts and context in contexts:
+            contexts.remove(context)
+
+    async def close(self) -> None:
+        """Close every browser and stop the driver."""
+        for browser in self._browsers:
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {e}")
+        self._browsers.clear()
+        self._contexts.clear()
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
@@ -0,0 +1,143 @@
+"""Per-portal timing of searches and applications in continuous mode.
+
+Continuous mode used to run a full cycle over every portal and then
+sleep one global interval, so each portal waited for the slowest one and
+shared its cadence. Here every (portal, kind) pair, where kind is
+``search`` or ``apply``, has its own interval from the portal's
+:class:`~mjas.portals.base.Cadence` and its next due time in a heap;
+whatever is due runs, and the swarm sleeps until the earliest next one.
+
+Due times are saved through the queue backend as they are set, so a
+restarted swarm picks up the schedule instead of searching everything at
+once again.
+"""
+
+import heapq
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from mjas.core.backend import QueueBackend
+from mjas.portals.base import Cadence
+
+logger = logging.getLogger(__name__)
+
+RUN_KINDS = ("search", "apply")
+
+
+def resolve_cadence(cadence: Cadence, default_minutes: float) -> Cadence:
+    """``cadence`` with unset intervals filled in from ``default_minutes``."""
+    return Cadence(
+        search_minutes=cadence.search_minutes or default_minutes,
+        apply_minutes=cadence.apply_minutes or default_minutes,
+        jitter=cadence.jitter,
+    )
+
+
+def _as_datetime(value: Any) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+class CadenceScheduler:
+    """A heap of (due time, portal, kind) with intervals per portal.
+
+    Args:
+        cadences: Each portal's resolved :class:`Cadence`.
+        backend: Where due times are loaded from and saved to.
+    """
+
+    def __init__(
+        self,
+        cadences: Dict[str, Cadence],
+        backend: QueueBackend,
+        rng: Optional[random.Random] = None
+    ):
+        self.cadences = cadences
+        self.backend = backend
+        self.rng = rng or random.Random()
+        self._heap: List[Tuple[datetime, str, str]] = []
+
+    def interval(self, portal: str, kind: str) -> timedelta:
+        cadence = self.cadences[portal]
+        minutes = cadence.search_minutes if kind == "search" else cadence.apply_minutes
+        return timedelta(minutes=minutes)
+
+    async def load(self, now: Optional[datetime] = None) -> None:
+        """Seed the heap from saved due times; anything never scheduled is due now.
+
+        A saved time further out than one interval (the interval was
+        shortened since) is pulled in to one interval from now.
+        """
+        now = now or datetime.now()
+        saved = {
+            (row["portal"], row["kind"]): _as_datetime(row["next_run_at"])
+            for row in await self.backend.get_portal_schedule()
+        }
+        self._heap = []
+        for portal in self.cadences:
+            for kind in RUN_KINDS:
+                due = min(saved.get((portal, kind), now), now + self.interval(portal, kind))
+                self._heap.append((due, portal, kind))
+        heapq.heapify(self._heap)
+
+        resumed = sum(1 for _, portal, kind in self._heap if (portal, kind) in saved)
+        logger.info(f"Cadence: resumed {resumed} of {len(self._heap)} saved due times")
+
+    def add(self, portal: str, cadence: Cadence, now: Optional[datetime] = None) -> None:
+        """Start scheduling ``portal``, with both kinds of run due at ``now``."""
+        now = now or datetime.now()
+        self.cadences[portal] = cadence
+        for kind in RUN_KINDS:
+            heapq.heappush(self._heap, (now, portal, kind))
+
+    def discard(self, portal: str) -> None:
+        """Stop scheduling ``portal``."""
+        self.cadences.pop(portal, None)
+        self._heap = [entry for entry in self._heap if entry[1] != portal]
+        heapq.heapify(self._heap)
+
+    def next_due(self) -> Optional[datetime]:
+        """When the earliest run is due, or None if nothing is scheduled."""
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[Tuple[str, str]]:
+        """Remove and return every (portal, kind) due by ``now``, earliest first.
+
+        Each one must be put back with :meth:`reschedule`.
+        """
+        now = now or datetime.now()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, portal, kind = heapq.heappop(self._heap)
+            due.append((portal, kind))
+        return due
+
+    def reschedule(
+        self,
+        portal: str,
+        kind: str,
+        now: Optional[datetime] = None
+    ) -> datetime:
+        """Schedule the next ``kind`` run one jittered interval after ``now``.
+
+        Only the heap changes; persist the time with :meth:`save`.
+        """
+        now = now or datetime.now()
+        jitter = self.cadences[portal].jitter
+        due = now + self.interval(portal, kind) * (1 + self.rng.uniform(-jitter, jitter))
+        heapq.heappush(self._heap, (due, portal, kind))
+        return due
+
+    async def save(self, portal: str, kind: str, due: datetime) -> bool:
+        """Save a due time set by :meth:`reschedule`.
+
+        Best effort: a failure is logged and the in-memory schedule still
+        holds, so only a restart before the next save loses the time.
+        """
+        try:
+            await self.backend.set_portal_schedule(portal, kind, due)
+        except Exception as e:
+            logger.warning(f"Cadence: could not save {portal} {kind} due time: {e}")
+            return False
+        return True
@@ -1,12 +1,109 @@
 """SQLite database for job tracking and state management."""
 
+import asyncio
+import logging
+import os
+import re
+import socket
+import sys
+from collections import namedtuple
 import aiosqlite
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import List, Dict, Optional
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, List, Dict, Iterable, Mapping, Optional, Sequence,
+    Tuple, TYPE_CHECKING,
+)
 from dataclasses import dataclass
 
+from mjas.core import migrations
+from mjas.core.backend import NODE_TTL_SECONDS, QueueBackend
+from mjas.core.retention import ArchiveStore, CompactionReport, RetentionPolicy, RetentionReport
+
+if TYPE_CHECKING:
+    from mjas.portals.base import JobListing
+
+logger = logging.getLogger(__name__)
+
+WriteOp = Callable[[aiosqlite.Connection], Awaitable[Any]]
+
+
+# Numeric form of the priority label so queue ordering can use an index
+PRIORITY_RANKS: Dict[str, int] = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
+
+# Queue order shared by every "next jobs to work on" query. It matches the
+# trailing columns of idx_jobs_queue / idx_jobs_priority, so SQLite walks
+# the index instead of sorting.
+QUEUE_ORDER = "priority_rank DESC, score DESC, created_at"
+
+PRIORITY_QUEUE_SQL = f"""
+    SELECT * FROM jobs
+    WHERE status = 'queued' AND score >= ?
+    ORDER BY {QUEUE_ORDER}
+    LIMIT ?
+"""
+
+
+# Weight of the latest search in a combination's recent_yield average
+YIELD_SMOOTHING = 0.3
+
+
+def priority_rank(priority: Optional[str]) -> int:
+    """Map a priority label to its sort rank (unknown labels rank lowest)."""
+    return PRIORITY_RANKS.get(priority or "", 1)
+
+# Columns of the jobs table at the latest schema version, in table order
+JOB_COLUMNS: Tuple[str, ...] = (
+    "job_id", "title", "company", "portal", "url", "location", "salary_range",
+    "description", "score", "priority", "status", "created_at", "updated_at",
+    "applied_at", "notes", "screenshot_path", "lease_owner", "lease_expires_at",
+    "priority_rank",
+)
+
+# Tuple-backed job record for streaming passes; no per-row dict
+JobRow = namedtuple("JobRow", JOB_COLUMNS)
+
+
+def jobs_by_status_query(
+    status: "JobStatus",
+    limit: int,
+    portal: Optional[str] = None
+) -> Tuple[str, List[Any]]:
+    """Build the query used by :meth:`Database.get_jobs_by_status`."""
+    query = "SELECT * FROM jobs WHERE status = ?"
+    params: List[Any] = [status.value]
+
+    if portal:
+        query += " AND portal = ?"
+        params.append(portal)
+
+    query += f" ORDER BY {QUEUE_ORDER} LIMIT ?"
+    params.append(limit)
+    return query, params
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching every word.
+
+    Each word is quoted so punctuation and FTS operators in user input are
+    treated literally; a trailing ``*`` keeps its prefix-match meaning.
+    """
+    terms = []
+    for word in text.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*")
+        if not re.search(r"\w", word):
+            continue
+        term = '"' + word.replace('"', '""') + '"'
+        terms.append(term + "*" if prefix else term)
+    return " ".join(terms)
+
+
+def default_lease_owner() -> str:
+    """Identify this process as a lease holder (``host:pid``)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
 
 class JobStatus(str, Enum):
     DISCOVERED = "discovered"
@@ -18,8 +115,16 @@ class JobStatus(str, Enum):
     INTERVIEW = "interview"
 
 
-@dataclass
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """SQLite stores CURRENT_TIMESTAMP as text; accept that or a datetime."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+@dataclass(frozen=True, slots=True)
 class ApplicationRecord:
+    """Immutable snapshot of a tracked job."""
     job_id: str
     title: str
     company: str
@@ -32,69 +137,260 @@ class ApplicationRecord:
     applied_at: Optional[datetime] = None
     notes: Optional[str] = None
 
+    def __post_init__(self):
+        object.__setattr__(self, "portal", sys.intern(self.portal))
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "ApplicationRecord":
+        """Build a record from a ``jobs`` row (dict or ``sqlite3.Row``)."""
+        return cls(
+            job_id=row["job_id"],
+            title=row["title"],
+            company=row["company"],
+            portal=row["portal"],
+            url=row["url"],
+            score=row["score"] or 0,
+            status=JobStatus(row["status"]),
+            created_at=_parse_timestamp(row["created_at"]),
+            updated_at=_parse_timestamp(row["updated_at"]),
+            applied_at=_parse_timestamp(row["applied_at"]),
+            notes=row["notes"],
+        )
+
+    def to_row(self) -> Dict[str, Any]:
+        """Column values for this record as stored in ``jobs``."""
+        return {
+            "job_id": self.job_id,
+            "title": self.title,
+            "company": self.company,
+            "portal": self.portal,
+            "url": self.url,
+            "score": self.score,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "applied_at": self.applied_at,
+            "notes": self.notes,
+        }
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """SQLite tuning applied when the database connection is opened.
+
+    ``None`` leaves the corresponding SQLite default in place.
+    """
+    journal_mode: Optional[str] = None
+    synchronous: Optional[str] = None
+    mmap_size: Optional[int] = None
+    cache_size_kib: Optional[int] = None
+    busy_timeout_ms: Optional[int] = None
+    writer_queue: bool = False  # Funnel all writes through one batching task
+    max_write_batch: int = 256
 
-class Database:
-    """Async SQLite database manager."""
 
-    def __init__(self, db_path: Path = Path("data/mjas.db")):
+DEFAULT_STORAGE = StorageProfile()
+
+PRODUCTION_STORAGE = StorageProfile(
+    journal_mode="WAL",
+    synchronous="NORMAL",
+    mmap_size=256 * 1024 * 1024,
+    cache_size_kib=64 * 1024,
+    busy_timeout_ms=30_000,
+    writer_queue=True,
+)
+
+STORAGE_PROFILES: Dict[str, StorageProfile] = {
+    "default": DEFAULT_STORAGE,
+    "production": PRODUCTION_STORAGE,
+}
+
+
+JOB_INSERT_COLUMNS = (
+    "job_id", "title", "company", "portal", "url", "score", "priority", "priority_rank",
+    "location", "description", "salary_range", "status",
+)
+# Rows per multi-row INSERT, within SQLite's default limit of 999 parameters
+INSERT_CHUNK_ROWS = 999 // len(JOB_INSERT_COLUMNS)
+
+
+class Database(QueueBackend):
+    """Async SQLite database manager; the default :class:`QueueBackend`."""
+
+    def __init__(
+        self,
+        db_path: Path = Path("data/mjas.db"),
+        storage: StorageProfile = DEFAULT_STORAGE,
+        read_only: bool = False
+    ):
         self.db_path = db_path
+        self.storage = storage
+        self.read_only = read_only
         self._conn: Optional[aiosqlite.Connection] = None
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
 
-    async def init(self) -> None:
-        """Initialize database and create tables."""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = await aiosqlite.connect(self.db_path)
+    async def init(
+        self,
+        migrate: bool = True,
+        progress: Optional[migrations.ProgressCallback] = None
+    ) -> None:
+        """Open the database and bring its schema up to date.
+
+        A read-only database opens the existing file without touching the
+        schema, so it never competes with a running swarm for the write lock.
+
+        Args:
+            migrate: Apply pending schema migrations. Disable to inspect a
+                database as-is, e.g. for ``mjas db migrate --dry-run``.
+            progress: Receives progress lines from long-running migrations.
+        """
+        if self.read_only:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            self._conn = await aiosqlite.connect(uri, uri=True)
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = await aiosqlite.connect(self.db_path)
         self._conn.row_factory = aiosqlite.Row
-        await self._create_tables()
-
-    async def _create_tables(self) -> None:
-        """Create database schema."""
-        await self._conn.executescript("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                job_id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                company TEXT NOT NULL,
-                portal TEXT NOT NULL,
-                url TEXT NOT NULL,
-                location TEXT,
-                salary_range TEXT,
-                description TEXT,
-                score INTEGER DEFAULT 0,
-                priority TEXT DEFAULT 'MEDIUM',
-                status TEXT DEFAULT 'discovered',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                applied_at TIMESTAMP,
-                notes TEXT,
-                screenshot_path TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS applications (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id TEXT NOT NULL,
-                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                success BOOLEAN NOT NULL,
-                error_message TEXT,
-                screenshot_path TEXT,
-                form_data TEXT,
-                FOREIGN KEY (job_id) REFERENCES jobs(job_id)
-            );
-
-            CREATE TABLE IF NOT EXISTS portal_stats (
-                portal TEXT PRIMARY KEY,
-                total_attempts INTEGER DEFAULT 0,
-                successful_applications INTEGER DEFAULT 0,
-                failed_applications INTEGER DEFAULT 0,
-                last_attempt_at TIMESTAMP,
-                avg_response_time_ms INTEGER
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
-            CREATE INDEX IF NOT EXISTS idx_jobs_portal ON jobs(portal);
-            CREATE INDEX IF NOT EXISTS idx_jobs_score ON jobs(score DESC);
-            CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at);
-        """)
-        await self._conn.commit()
+        await self._apply_pragmas()
+
+        if self.read_only:
+            return
+
+        if migrate:
+            await self.migrate(progress=progress)
+
+        if self.storage.writer_queue:
+            self._write_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def migrate(
+        self,
+        dry_run: bool = False,
+        progress: Optional[migrations.ProgressCallback] = None
+    ) -> List[migrations.Migration]:
+        """Apply pending schema migrations.
+
+        Returns:
+            The migrations applied, or pending ones when ``dry_run`` is set.
+        """
+        return await migrations.apply_migrations(self._conn, progress=progress, dry_run=dry_run)
+
+    async def schema_version(self) -> int:
+        """Current schema version of the open database."""
+        return await migrations.current_version(self._conn)
+
+    async def _apply_pragmas(self) -> None:
+        """Apply the storage profile to the open connection."""
+        profile = self.storage
+        pragmas = []
+        if not self.read_only:
+            # Only takes effect on a new file (or after a full VACUUM); lets
+            # compact() return freed pages without rewriting the database.
+            pragmas.append("auto_vacuum = INCREMENTAL")
+        if profile.busy_timeout_ms is not None:
+            pragmas.append(f"busy_timeout = {int(profile.busy_timeout_ms)}")
+        if profile.journal_mode and not self.read_only:
+            pragmas.append(f"journal_mode = {profile.journal_mode}")
+        if profile.synchronous:
+            pragmas.append(f"synchronous = {profile.synchronous}")
+        if profile.mmap_size is not None:
+            pragmas.append(f"mmap_size = {int(profile.mmap_size)}")
+        if profile.cache_size_kib is not None:
+            # Negative cache_size is interpreted by SQLite as KiB
+            pragmas.append(f"cache_size = -{int(profile.cache_size_kib)}")
+
+        for pragma in pragmas:
+            await self._conn.execute(f"PRAGMA {pragma}")
+
+    async def _write(self, op: WriteOp) -> Any:
+        """Run a write operation and commit it.
+
+        With the writer queue enabled the operation is handed to the writer
+        task, which groups everything queued by concurrent callers into one
+        transaction. Otherwise the operation runs and commits immediately.
+        """
+        if self._write_queue is None:
+            async with self._write_lock:
+                # IMMEDIATE takes the write lock up front, so concurrent
+                # processes wait on busy_timeout instead of failing mid-way.
+                await self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    result = await op(self._conn)
+                except Exception:
+                    await self._conn.rollback()
+                    raise
+                await self._conn.commit()
+                return result
+
+        if self._writer_task is None or self._writer_task.done():
+            raise RuntimeError("Database writer is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        self._write_queue.put_nowait((op, future))
+        return await future
+
+    async def _writer_loop(self) -> None:
+        """Drain the write queue, committing each drained batch once."""
+        queue = self._write_queue
+        stopping = False
+        while not stopping:
+            item = await queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            while len(batch) < self.storage.max_write_batch:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._run_write_batch(batch)
+
+    async def _run_write_batch(self, batch: List[Tuple[WriteOp, asyncio.Future]]) -> None:
+        """Execute queued writes in one transaction.
+
+        Each operation runs under its own savepoint so a failing write is
+        rolled back and reported to its caller without affecting the rest
+        of the batch.
+        """
+        outcomes = []
+        try:
+            if not self._conn.in_transaction:
+                await self._conn.execute("BEGIN IMMEDIATE")
+            for op, future in batch:
+                await self._conn.execute("SAVEPOINT write_op")
+                try:
+                    result = await op(self._conn)
+                except Exception as e:
+                    await self._conn.execute("ROLLBACK TO write_op")
+                    await self._conn.execute("RELEASE write_op")
+                    outcomes.append((future, None, e))
+                else:
+                    await self._conn.execute("RELEASE write_op")
+                    outcomes.append((future, result, None))
+            await self._conn.commit()
+        except Exception as e:
+            logger.error(f"Write batch of {len(batch)} failed: {e}")
+            try:
+                await self._conn.rollback()
+            except Exception:
+                pass
+            outcomes = [(future, None, e) for _, future in batch]
+
+        for future, result, error in outcomes:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
 
     async def insert_job(
         self,
@@ -109,12 +405,59 @@ class Database:
         description: Optional[str] = None
     ) -> None:
         """Insert a new job discovery."""
-        await self._conn.execute("""
+        await self._write(lambda conn: conn.execute("""
             INSERT OR IGNORE INTO jobs
-            (job_id, title, company, portal, url, score, priority, location, description)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (job_id, title, company, portal, url, score, priority, location, description))
-        await self._conn.commit()
+            (job_id, title, company, portal, url, score, priority, priority_rank,
+             location, description)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (job_id, title, company, portal, url, score, priority, priority_rank(priority),
+              location, description)))
+
+    async def insert_jobs_bulk(
+        self,
+        listings: Iterable["JobListing"],
+        status: JobStatus = JobStatus.QUEUED
+    ) -> List[str]:
+        """Insert a batch of listings in a single transaction.
+
+        Each listing's ``score`` and ``priority`` are stored as-is and the
+        initial status is written in the same statement, so a whole search
+        result costs one commit instead of two per row.
+
+        Returns:
+            IDs of the jobs that were newly inserted, in input order.
+            Listings already present in the database are left untouched.
+        """
+        rows = {}
+        for listing in listings:
+            rows.setdefault(listing.job_id, listing)
+        if not rows:
+            return []
+
+        async def op(conn: aiosqlite.Connection) -> List[str]:
+            inserted = set()
+            listings = list(rows.values())
+            for start in range(0, len(listings), INSERT_CHUNK_ROWS):
+                chunk = listings[start:start + INSERT_CHUNK_ROWS]
+                values = ", ".join([f"({', '.join('?' * len(JOB_INSERT_COLUMNS))})"] * len(chunk))
+                params = []
+                for job in chunk:
+                    row = {**job.to_row(), "priority_rank": priority_rank(job.priority),
+                           "status": status.value}
+                    params.extend(row[column] for column in JOB_INSERT_COLUMNS)
+                # The rows RETURNING reports are exactly the ones this statement
+                # inserted, even with another writer racing on the same ids
+                async with conn.execute(f"""
+                    INSERT INTO jobs ({', '.join(JOB_INSERT_COLUMNS)})
+                    VALUES {values}
+                    ON CONFLICT (job_id) DO NOTHING
+                    RETURNING job_id
+                """, params) as cursor:
+                    inserted.update(row[0] for row in await cursor.fetchall())
+            # RETURNING order is unspecified; restore input order
+            return [job_id for job_id in rows if job_id in inserted]
+
+        return await self._write(op)
 
     async def update_job_status(
         self,
@@ -123,16 +466,127 @@ class Database:
         notes: Optional[str] = None,
         screenshot_path: Optional[str] = None
     ) -> None:
-        """Update job status."""
+        """Update job status.
+
+        Moving a job out of APPLYING releases any lease held on it.
+        """
         applied_at = datetime.now() if status == JobStatus.APPLIED else None
+        keep_lease = status == JobStatus.APPLYING
 
-        await self._conn.execute("""
+        await self._write(lambda conn: conn.execute("""
             UPDATE jobs
             SET status = ?, notes = ?, updated_at = ?, applied_at = ?,
-                screenshot_path = COALESCE(?, screenshot_path)
+                screenshot_path = COALESCE(?, screenshot_path),
+                lease_owner = CASE WHEN ? THEN lease_owner END,
+                lease_expires_at = CASE WHEN ? THEN lease_expires_at END
             WHERE job_id = ?
-        """, (status.value, notes, datetime.now(), applied_at, screenshot_path, job_id))
-        await self._conn.commit()
+        """, (status.value, notes, datetime.now(), applied_at, screenshot_path,
+              keep_lease, keep_lease, job_id)))
+
+    async def claim_jobs(
+        self,
+        portal: str,
+        n: int,
+        lease_seconds: float,
+        owner: Optional[str] = None,
+        job_ids: Optional[Iterable[str]] = None
+    ) -> List[Dict]:
+        """Atomically claim up to ``n`` queued jobs for a portal.
+
+        Selection and the move to APPLYING happen in one
+        ``UPDATE ... RETURNING`` statement, so two workers or processes can
+        never claim the same job. Each claimed row records the lease owner
+        and an expiry after which :meth:`reap_expired_leases` returns it to
+        the queue.
+
+        Args:
+            job_ids: Only consider these jobs, e.g. ones a search just
+                queued; any that are no longer queued are skipped.
+
+        Returns:
+            The claimed jobs, best first.
+        """
+        if n <= 0:
+            return []
+
+        owner = owner or default_lease_owner()
+        now = datetime.now()
+        expires_at = now + timedelta(seconds=lease_seconds)
+
+        id_filter = ""
+        id_params: List[str] = []
+        if job_ids is not None:
+            id_params = list(job_ids)
+            if not id_params:
+                return []
+            id_filter = f"AND job_id IN ({', '.join('?' for _ in id_params)})"
+
+        async def op(conn: aiosqlite.Connection) -> List[Dict]:
+            async with conn.execute(f"""
+                UPDATE jobs
+                SET status = 'applying', lease_owner = ?, lease_expires_at = ?, updated_at = ?
+                WHERE job_id IN (
+                    SELECT job_id FROM jobs
+                    WHERE status = 'queued' AND portal = ? {id_filter}
+                    ORDER BY {QUEUE_ORDER}
+                    LIMIT ?
+                )
+                RETURNING *
+            """, (owner, expires_at, now, portal, *id_params, n)) as cursor:
+                return [dict(row) for row in await cursor.fetchall()]
+
+        jobs = await self._write(op)
+        # RETURNING order is unspecified; restore queue order
+        jobs.sort(key=lambda job: (
+            -(job["priority_rank"] or 0), -(job["score"] or 0), job["created_at"] or ""
+        ))
+        return jobs
+
+    async def release_jobs(self, job_ids: Iterable[str], owner: Optional[str] = None) -> int:
+        """Return claimed jobs to the queue before their lease expires.
+
+        Only jobs still APPLYING under ``owner`` are released.
+
+        Returns:
+            Number of jobs released.
+        """
+        job_ids = list(job_ids)
+        if not job_ids:
+            return 0
+        owner = owner or default_lease_owner()
+
+        async def op(conn: aiosqlite.Connection) -> int:
+            cursor = await conn.executemany("""
+                UPDATE jobs
+                SET status = 'queued', lease_owner = NULL, lease_expires_at = NULL,
+                    updated_at = ?
+                WHERE job_id = ? AND status = 'applying' AND lease_owner = ?
+            """, [(datetime.now(), job_id, owner) for job_id in job_ids])
+            return cursor.rowcount
+
+        return await self._write(op)
+
+    async def reap_expired_leases(self, now: Optional[datetime] = None) -> int:
+        """Return APPLYING jobs whose lease has expired to the queue.
+
+        Returns:
+            Number of jobs re-queued.
+        """
+        now = now or datetime.now()
+
+        async def op(conn: aiosqlite.Connection) -> int:
+            cursor = await conn.execute("""
+                UPDATE jobs
+                SET status = 'queued', lease_owner = NULL, lease_expires_at = NULL,
+                    updated_at = ?
+                WHERE status = 'applying' AND lease_expires_at < ?
+            """, (now, now))
+            return cursor.rowcount
+
+        reaped = await self._write(op)
+        if reaped:
+            logger.warning(f"Re-queued {reaped} jobs with expired leases")
+        return reaped
 
     async def get_job(self, job_id: str) -> Optional[Dict]:
         """Get job by ID."""
@@ -148,88 +602,421 @@ class Database:
         limit: int = 100,
         portal: Optional[str] = None
     ) -> List[Dict]:
-        """Get jobs by status, optionally filtered by portal."""
-        query = "SELECT * FROM jobs WHERE status = ?"
-        params = [status.value]
+        """Get jobs by status in queue order, optionally filtered by portal."""
+        query, params = jobs_by_status_query(status, limit, portal)
+        async with self._conn.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+
+    async def get_priority_queue(self, min_score: int = 65, limit: int = 50) -> List[Dict]:
+        """Get high-priority jobs ready for application."""
+        async with self._conn.execute(PRIORITY_QUEUE_SQL, (min_score, limit)) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+
+    async def iter_jobs(
+        self,
+        status: Optional[JobStatus] = None,
+        portal: Optional[str] = None,
+        batch_size: int = 500,
+        columns: Optional[Sequence[str]] = None,
+        record: Callable[..., Any] = dict
+    ) -> AsyncIterator[Any]:
+        """Stream jobs in rowid order, ``batch_size`` rows per query.
+
+        Each batch is a separate keyset query (``rowid > last``), so no read
+        transaction stays open between batches and memory is bounded by the
+        batch rather than the table. Rows inserted while iterating may or
+        may not be seen; rows are never yielded twice.
+
+        Args:
+            status: Only yield jobs in this status.
+            portal: Only yield jobs from this portal.
+            batch_size: Rows fetched per query.
+            columns: Columns to select, defaulting to :data:`JOB_COLUMNS`.
+            record: How each row is yielded: ``dict`` (default), ``tuple``
+                for bare value tuples, or any callable taking the column
+                values positionally, such as :class:`JobRow`.
+        """
+        columns = tuple(columns or JOB_COLUMNS)
+        unknown = set(columns) - set(JOB_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown job columns: {sorted(unknown)}")
+
+        # The unary + keeps SQLite walking the table in rowid order instead
+        # of switching to the status index and sorting every batch.
+        query = f"SELECT rowid, {', '.join(columns)} FROM jobs WHERE rowid > ?"
+        filters: List[Any] = []
+        if status:
+            query += " AND +status = ?"
+            filters.append(status.value)
+        if portal:
+            query += " AND +portal = ?"
+            filters.append(portal)
+        query += " ORDER BY rowid LIMIT ?"
+
+        last_rowid = 0
+        while True:
+            async with self._conn.execute(query, [last_rowid, *filters, batch_size]) as cursor:
+                rows = await cursor.fetchall()
+            if not rows:
+                return
+
+            last_rowid = rows[-1][0]
+            for row in rows:
+                values = row[1:]
+                if record is dict:
+                    yield dict(zip(columns, values))
+                elif record is tuple:
+                    yield values
+                else:
+                    yield record(*values)
+
+            if len(rows) < batch_size:
+                return
+
+    async def search_jobs(
+        self,
+        text: str,
+        status: Optional[JobStatus] = None,
+        portal: Optional[str] = None,
+        limit: int = 20
+    ) -> List[Dict]:
+        """Full-text search over job titles, companies and descriptions.
+
+        Results are ranked by BM25, weighting title matches above company
+        and description matches, and carry the score in a ``rank`` column
+        (lower is better).
+        """
+        match = fts_query(text)
+        if not match:
+            return []
 
+        query = """
+            SELECT jobs.*, bm25(jobs_fts, 10.0, 3.0, 1.0) AS rank
+            FROM jobs_fts
+            JOIN jobs ON jobs.rowid = jobs_fts.rowid
+            WHERE jobs_fts MATCH ?
+        """
+        params: List[Any] = [match]
+
+        if status:
+            query += " AND jobs.status = ?"
+            params.append(status.value)
         if portal:
-            query += " AND portal = ?"
+            query += " AND jobs.portal = ?"
             params.append(portal)
 
-        query += " ORDER BY score DESC, created_at DESC LIMIT ?"
+        query += " ORDER BY rank LIMIT ?"
         params.append(limit)
 
         async with self._conn.execute(query, params) as cursor:
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
 
-    async def get_priority_queue(self, min_score: int = 65, limit: int = 50) -> List[Dict]:
-        """Get high-priority jobs ready for application."""
-        async with self._conn.execute("""
-            SELECT * FROM jobs
-            WHERE status = 'queued' AND score >= ?
-            ORDER BY
-                CASE priority
-                    WHEN 'HIGH' THEN 3
-                    WHEN 'MEDIUM' THEN 2
-                    ELSE 1
-                END DESC,
-                score DESC,
-                created_at ASC
-            LIMIT ?
-        """, (min_score, limit)) as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
-
     async def log_application_attempt(
         self,
         job_id: str,
         success: bool,
         error_message: Optional[str] = None,
         screenshot_path: Optional[str] = None,
-        form_data: Optional[Dict] = None
+        form_data: Optional[Dict] = None,
+        response_time_ms: Optional[int] = None
     ) -> None:
-        """Log an application attempt."""
+        """Log an application attempt.
+
+        ``response_time_ms`` feeds the portal's ``avg_response_time_ms``.
+        """
         import json
-        await self._conn.execute("""
+        await self._write(lambda conn: conn.execute("""
             INSERT INTO applications
-            (job_id, success, error_message, screenshot_path, form_data)
-            VALUES (?, ?, ?, ?, ?)
+            (job_id, success, error_message, screenshot_path, form_data, response_time_ms)
+            VALUES (?, ?, ?, ?, ?, ?)
         """, (job_id, success, error_message, screenshot_path,
-              json.dumps(form_data) if form_data else None))
-        await self._conn.commit()
+              json.dumps(form_data) if form_data else None, response_time_ms)))
 
     async def get_stats(self) -> Dict:
-        """Get system statistics."""
+        """Get system statistics.
+
+        Sums the trigger-maintained per-portal counters, so the cost is
+        proportional to the number of portals rather than jobs.
+        """
         async with self._conn.execute("""
             SELECT
-                COUNT(*) as total_jobs,
-                SUM(CASE WHEN status = 'applied' THEN 1 ELSE 0 END) as applied,
-                SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                SUM(CASE WHEN status = 'queued' THEN 1 ELSE 0 END) as queued,
-                AVG(score) as avg_score
-            FROM jobs
+                COALESCE(SUM(jobs_total), 0) as total_jobs,
+                COALESCE(SUM(jobs_applied), 0) as applied,
+                COALESCE(SUM(jobs_failed), 0) as failed,
+                COALESCE(SUM(jobs_queued), 0) as queued,
+                CASE WHEN SUM(jobs_total) > 0
+                     THEN SUM(score_sum) * 1.0 / SUM(jobs_total)
+                END as avg_score
+            FROM portal_stats
         """) as cursor:
             row = await cursor.fetchone()
             return dict(row) if row else {}
 
+    async def record_search_yield(
+        self,
+        portal: str,
+        keyword: str,
+        location: str,
+        new_jobs: int
+    ) -> None:
+        """Record how many new jobs one search found.
+
+        ``recent_yield`` is an exponential moving average of new jobs per
+        search (weight :data:`YIELD_SMOOTHING` on the latest), and
+        ``empty_streak`` counts consecutive searches that found nothing.
+        """
+        await self._write(lambda conn: conn.execute("""
+            INSERT INTO search_yield
+            (portal, keyword, location, searches, new_jobs, recent_yield, empty_streak,
+             last_searched_at)
+            VALUES (:portal, :keyword, :location, 1, :new_jobs, :new_jobs, :new_jobs = 0, :now)
+            ON CONFLICT (portal, keyword, location) DO UPDATE SET
+                searches = searches + 1,
+                new_jobs = new_jobs + excluded.new_jobs,
+                recent_yield = recent_yield + :alpha * (excluded.new_jobs - recent_yield),
+                empty_streak = CASE WHEN excluded.new_jobs > 0 THEN 0 ELSE empty_streak + 1 END,
+                last_searched_at = excluded.last_searched_at
+        """, {"portal": portal, "keyword": keyword, "location": location,
+              "new_jobs": new_jobs, "now": datetime.now(), "alpha": YIELD_SMOOTHING}))
+
+    async def get_search_yields(self, portals: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Yield history per (portal, keyword, location), optionally for some portals."""
+        query = "SELECT * FROM search_yield"
+        params: List[Any] = []
+        if portals is not None:
+            params = list(portals)
+            if not params:
+                return []
+            query += f" WHERE portal IN ({', '.join('?' for _ in params)})"
+        async with self._conn.execute(query, params) as cursor:
+            return [dict(row) for row in await cursor.fetchall()]
+
+    async def get_portal_schedule(self) -> List[Dict]:
+        """Saved continuous-mode due times, one row per (portal, kind)."""
+        async with self._conn.execute("SELECT * FROM portal_schedule") as cursor:
+            return [dict(row) for row in await cursor.fetchall()]
+
+    async def set_portal_schedule(self, portal: str, kind: str, next_run_at: datetime) -> None:
+        """Save when ``portal``'s next ``kind`` run (search or apply) is due."""
+        await self._write(lambda conn: conn.execute("""
+            INSERT INTO portal_schedule (portal, kind, next_run_at) VALUES (?, ?, ?)
+            ON CONFLICT (portal, kind) DO UPDATE SET next_run_at = excluded.next_run_at
+        """, (portal, kind, next_run_at)))
+
+    async def register_node(self, node_id: str, portals: Sequence[str]) -> None:
+        """Announce a node and the portals it can run (re-registering replaces them)."""
+        import json
+        await self._write(lambda conn: conn.execute("""
+            INSERT INTO nodes (node_id, portals, last_seen_at) VALUES (?, ?, ?)
+            ON CONFLICT (node_id) DO UPDATE
+            SET portals = excluded.portals, last_seen_at = excluded.last_seen_at
+        """, (node_id, json.dumps(list(portals)), datetime.now())))
+
+    async def heartbeat_node(self, node_id: str) -> bool:
+        """Mark a node alive. Returns False if it is not registered."""
+        async def op(conn: aiosqlite.Connection) -> bool:
+            cursor = await conn.execute(
+                "UPDATE nodes SET last_seen_at = ? WHERE node_id = ?", (datetime.now(), node_id)
+            )
+            return cursor.rowcount > 0
+
+        return await self._write(op)
+
+    async def deregister_node(self, node_id: str) -> None:
+        """Remove a node so its portals move to the others."""
+        await self._write(
+            lambda conn: conn.execute("DELETE FROM nodes WHERE node_id = ?", (node_id,))
+        )
+
+    async def active_nodes(
+        self,
+        ttl_seconds: float = NODE_TTL_SECONDS,
+        now: Optional[datetime] = None
+    ) -> Dict[str, List[str]]:
+        """Nodes seen within ``ttl_seconds``, with the portals each can run."""
+        import json
+        cutoff = (now or datetime.now()) - timedelta(seconds=ttl_seconds)
+        async with self._conn.execute(
+            "SELECT node_id, portals FROM nodes WHERE last_seen_at >= ? ORDER BY node_id",
+            (cutoff,)
+        ) as cursor:
+            return {row["node_id"]: json.loads(row["portals"]) for row in await cursor.fetchall()}
+
     async def get_portal_stats(self) -> List[Dict]:
-        """Get per-portal statistics."""
+        """Get per-portal statistics from the maintained counters."""
         async with self._conn.execute("""
             SELECT
                 portal,
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'applied' THEN 1 ELSE 0 END) as applied,
-                SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                AVG(score) as avg_score
-            FROM jobs
-            GROUP BY portal
+                jobs_total as total,
+                jobs_applied as applied,
+                jobs_failed as failed,
+                jobs_queued as queued,
+                CASE WHEN jobs_total > 0 THEN score_sum * 1.0 / jobs_total END as avg_score,
+                total_attempts,
+                successful_applications,
+                failed_applications,
+                last_attempt_at,
+                avg_response_time_ms
+            FROM portal_stats
+            WHERE jobs_total > 0 OR total_attempts > 0
             ORDER BY applied DESC
         """) as cursor:
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
 
+    async def rebuild_stats(self) -> None:
+        """Recompute all portal_stats counters from scratch.
+
+        Use when the counters are suspected to have drifted, e.g. after
+        rows were edited with triggers disabled.
+        """
+        await self._write(
+            lambda conn: migrations.execute_script(conn, migrations.REBUILD_PORTAL_STATS_SQL)
+        )
+
+    async def archive_expired(
+        self,
+        archive: ArchiveStore,
+        policy: Optional[RetentionPolicy] = None,
+        now: Optional[datetime] = None
+    ) -> RetentionReport:
+        """Move expired rows into ``archive`` and delete them here.
+
+        Old application attempts go first, then FAILED/SKIPPED jobs past
+        the retention window together with all of their attempts, so no
+        attempt is left pointing at a job that is no longer in ``jobs``.
+        """
+        policy = policy or RetentionPolicy()
+        report = RetentionReport()
+
+        app_cutoff = policy.application_cutoff(now)
+        last_id = 0
+        while True:
+            async with self._conn.execute("""
+                SELECT * FROM applications WHERE id > ? AND applied_at < ?
+                ORDER BY id LIMIT ?
+            """, (last_id, app_cutoff, policy.batch_size)) as cursor:
+                apps = [dict(row) for row in await cursor.fetchall()]
+            if not apps:
+                break
+            last_id = apps[-1]["id"]
+
+            await archive.store([], apps)
+            app_ids = [app["id"] for app in apps]
+            await self._write(lambda conn, ids=app_ids: conn.execute(
+                f"DELETE FROM applications WHERE id IN ({', '.join('?' * len(ids))})", ids
+            ))
+            report.applications_archived += len(apps)
+
+        job_cutoff = policy.job_cutoff(now)
+        statuses = list(policy.job_statuses)
+        status_marks = ", ".join("?" * len(statuses))
+        last_rowid = 0
+        while True:
+            # +status keeps the scan in rowid order rather than sorting each batch
+            async with self._conn.execute(f"""
+                SELECT rowid, * FROM jobs
+                WHERE rowid > ? AND +status IN ({status_marks}) AND updated_at < ?
+                ORDER BY rowid LIMIT ?
+            """, (last_rowid, *statuses, job_cutoff, policy.batch_size)) as cursor:
+                rows = await cursor.fetchall()
+            if not rows:
+                break
+            last_rowid = rows[-1][0]
+            jobs = [dict(zip(row.keys()[1:], tuple(row)[1:])) for row in rows]
+
+            job_ids = [job["job_id"] for job in jobs]
+            job_marks = ", ".join("?" * len(job_ids))
+            async with self._conn.execute(
+                f"SELECT * FROM applications WHERE job_id IN ({job_marks})", job_ids
+            ) as cursor:
+                apps = [dict(row) for row in await cursor.fetchall()]
+
+            await archive.store(jobs, apps)
+
+            async def delete(
+                conn: aiosqlite.Connection, job_ids=job_ids, apps=apps, job_marks=job_marks
+            ) -> int:
+                if apps:
+                    app_ids = [app["id"] for app in apps]
+                    await conn.execute(
+                        f"DELETE FROM applications WHERE id IN ({', '.join('?' * len(app_ids))})",
+                        app_ids
+                    )
+                # Re-check the status so a job re-queued meanwhile stays put
+                cursor = await conn.execute(f"""
+                    DELETE FROM jobs
+                    WHERE job_id IN ({job_marks}) AND status IN ({status_marks}) AND updated_at < ?
+                """, (*job_ids, *statuses, job_cutoff))
+                return cursor.rowcount
+
+            report.jobs_archived += await self._write(delete)
+            report.applications_archived += len(apps)
+
+        if report.jobs_archived or report.applications_archived:
+            logger.info(
+                f"Archived {report.jobs_archived} jobs and "
+                f"{report.applications_archived} application attempts"
+            )
+        return report
+
+    async def compact(self, allow_full_vacuum: bool = True) -> CompactionReport:
+        """Return free pages to the filesystem.
+
+        Databases created before incremental auto-vacuum was enabled need
+        one full ``VACUUM`` to switch modes. That rewrites the file and may
+        renumber ``jobs`` rowids, so the FTS index is rebuilt afterwards.
+        The full vacuum is skipped while the writer queue is running, since
+        it cannot share the connection with an open write transaction.
+        """
+        size_before = await self._database_size()
+
+        async with self._conn.execute("PRAGMA auto_vacuum") as cursor:
+            auto_vacuum = (await cursor.fetchone())[0]
+
+        full_vacuum = auto_vacuum != 2 and allow_full_vacuum and self._writer_task is None
+        if full_vacuum:
+            async with self._write_lock:
+                await self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                await self._conn.execute("VACUUM")
+            await self._write(lambda conn: conn.execute(
+                "INSERT INTO jobs_fts(jobs_fts) VALUES('rebuild')"
+            ))
+        elif auto_vacuum == 2:
+            async def incremental_vacuum(conn: aiosqlite.Connection) -> None:
+                # Each step of the pragma frees one page, so drain it
+                async with conn.execute("PRAGMA incremental_vacuum") as cursor:
+                    await cursor.fetchall()
+
+            await self._write(incremental_vacuum)
+        else:
+            logger.warning("Database needs a full VACUUM to enable incremental compaction")
+
+        if self._writer_task is None:
+            async with self._conn.execute("PRAGMA journal_mode") as cursor:
+                if (await cursor.fetchone())[0] == "wal":
+                    await self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        report = CompactionReport(size_before, await self._database_size(), full_vacuum)
+        logger.info(f"Compaction reclaimed {report.bytes_reclaimed} bytes")
+        return report
+
+    async def _database_size(self) -> int:
+        async with self._conn.execute("PRAGMA page_count") as cursor:
+            page_count = (await cursor.fetchone())[0]
+        async with self._conn.execute("PRAGMA page_size") as cursor:
+            page_size = (await cursor.fetchone())[0]
+        return page_count * page_size
+
     async def close(self) -> None:
-        """Close database connection."""
+        """Flush pending writes and close database connection."""
+        if self._writer_task:
+            self._write_queue.put_nowait(None)
+            await self._writer_task
+            self._writer_task = None
+            self._write_queue = None
         if self._conn:
             await self._conn.close()
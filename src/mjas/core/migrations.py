@@ -0,0 +1,509 @@
+"""Versioned schema migrations for the SQLite job database."""
+
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[str], None]
+
+
+class MigrationProgress:
+    """Progress reporter handed to each migration step.
+
+    Steps that loop over rows call :meth:`report` with a done/total count.
+    Single long statements, such as index builds, are covered by a SQLite
+    progress handler that reports elapsed time while the statement runs.
+    """
+
+    def __init__(
+        self,
+        migration: "Migration",
+        callback: Optional[ProgressCallback] = None,
+        interval_seconds: float = 2.0
+    ):
+        self.migration = migration
+        self.callback = callback
+        self.interval_seconds = interval_seconds
+        self.started = time.monotonic()
+        self._last_report = self.started
+
+    def emit(self, message: str) -> None:
+        """Log a message prefixed with the migration it belongs to."""
+        text = f"[{self.migration.version:03d} {self.migration.name}] {message}"
+        logger.info(text)
+        if self.callback:
+            self.callback(text)
+
+    def report(self, done: int, total: int) -> None:
+        """Report row-level progress, throttled to ``interval_seconds``."""
+        now = time.monotonic()
+        if done < total and now - self._last_report < self.interval_seconds:
+            return
+        self._last_report = now
+        percent = 100.0 * done / total if total else 100.0
+        self.emit(f"{done}/{total} rows ({percent:.0f}%)")
+
+    def tick(self) -> int:
+        """SQLite progress handler; returning 0 lets the statement continue."""
+        now = time.monotonic()
+        if now - self._last_report >= self.interval_seconds:
+            self._last_report = now
+            self.emit(f"still running ({now - self.started:.0f}s elapsed)")
+        return 0
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One ordered schema change."""
+    version: int
+    name: str
+    apply: Callable[[aiosqlite.Connection, MigrationProgress], Awaitable[None]]
+
+
+def split_statements(script: str) -> List[str]:
+    """Split a SQL script into complete statements.
+
+    Unlike ``executescript`` this leaves transaction control to the caller,
+    and it keeps trigger bodies (which contain ``;``) in one piece.
+    """
+    statements = []
+    buffer = ""
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            if buffer.strip():
+                statements.append(buffer.strip())
+            buffer = ""
+    if buffer.strip():
+        statements.append(buffer.strip())
+    return statements
+
+
+async def execute_script(conn: aiosqlite.Connection, script: str) -> None:
+    """Run each statement of ``script`` inside the current transaction."""
+    for statement in split_statements(script):
+        await conn.execute(statement)
+
+
+async def add_column(conn: aiosqlite.Connection, table: str, name: str, decl: str) -> bool:
+    """Add a column unless it already exists.
+
+    Returns:
+        True if the column was added.
+    """
+    async with conn.execute(f"PRAGMA table_info({table})") as cursor:
+        present = {row[1] for row in await cursor.fetchall()}
+    if name in present:
+        return False
+    await conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+    return True
+
+
+async def update_in_batches(
+    conn: aiosqlite.Connection,
+    table: str,
+    assignment: str,
+    progress: MigrationProgress,
+    batch_size: int = 5000
+) -> None:
+    """Apply ``UPDATE table SET assignment`` in rowid ranges with progress."""
+    async with conn.execute(f"SELECT COUNT(*), MAX(rowid) FROM {table}") as cursor:
+        total, max_rowid = await cursor.fetchone()
+    if not total:
+        return
+
+    done = 0
+    low = 0
+    while low < max_rowid:
+        high = low + batch_size
+        cursor = await conn.execute(
+            f"UPDATE {table} SET {assignment} WHERE rowid > ? AND rowid <= ?",
+            (low, high)
+        )
+        done += cursor.rowcount
+        progress.report(min(done, total), total)
+        low = high
+
+
+# -- Migration steps --------------------------------------------------------
+
+async def _initial_schema(conn: aiosqlite.Connection, progress: MigrationProgress) -> None:
+    """Original v3.0 tables; a no-op on databases created before versioning."""
+    await execute_script(conn, """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            company TEXT NOT NULL,
+            portal TEXT NOT NULL,
+            url TEXT NOT NULL,
+            location TEXT,
+            salary_range TEXT,
+            description TEXT,
+            score INTEGER DEFAULT 0,
+            priority TEXT DEFAULT 'MEDIUM',
+            status TEXT DEFAULT 'discovered',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            applied_at TIMESTAMP,
+            notes TEXT,
+            screenshot_path TEXT
+        );
+
+        CREATE TABLE IF NOT EXISTS applications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            success BOOLEAN NOT NULL,
+            error_message TEXT,
+            screenshot_path TEXT,
+            form_data TEXT,
+            FOREIGN KEY (job_id) REFERENCES jobs(job_id)
+        );
+
+        CREATE TABLE IF NOT EXISTS portal_stats (
+            portal TEXT PRIMARY KEY,
+            total_attempts INTEGER DEFAULT 0,
+            successful_applications INTEGER DEFAULT 0,
+            failed_applications INTEGER DEFAULT 0,
+            last_attempt_at TIMESTAMP,
+            avg_response_time_ms INTEGER
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+        CREATE INDEX IF NOT EXISTS idx_jobs_portal ON jobs(portal);
+        CREATE INDEX IF NOT EXISTS idx_jobs_score ON jobs(score DESC);
+        CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at);
+    """)
+
+
+async def _job_leases(conn: aiosqlite.Connection, progress: MigrationProgress) -> None:
+    """Lease owner/expiry for atomic job claiming."""
+    await add_column(conn, "jobs", "lease_owner", "TEXT")
+    await add_column(conn, "jobs", "lease_expires_at", "TIMESTAMP")
+    await conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_jobs_lease
+        ON jobs(lease_expires_at) WHERE status = 'applying'
+    """)
+
+
+async def _priority_rank(conn: aiosqlite.Connection, progress: MigrationProgress) -> None:
+    """Integer priority rank and the index-ordered queue indexes."""
+    if await add_column(conn, "jobs", "priority_rank", "INTEGER DEFAULT 2"):
+        await update_in_batches(conn, "jobs", """priority_rank = CASE priority
+            WHEN 'HIGH' THEN 3
+            WHEN 'MEDIUM' THEN 2
+            ELSE 1
+        END""", progress)
+
+    # Both indexes have status as their prefix and supersede idx_jobs_status.
+    # job_id at the end makes the claim_jobs subquery covering.
+    await execute_script(conn, """
+        CREATE INDEX IF NOT EXISTS idx_jobs_queue
+        ON jobs(status, portal, priority_rank DESC, score DESC, created_at, job_id);
+        CREATE INDEX IF NOT EXISTS idx_jobs_priority
+        ON jobs(status, priority_rank DESC, score DESC, created_at, job_id);
+        DROP INDEX IF EXISTS idx_jobs_status;
+    """)
+
+
+async def _jobs_fts(conn: aiosqlite.Connection, progress: MigrationProgress) -> None:
+    """FTS5 index over job title, company and description.
+
+    External-content table: the text lives only in ``jobs`` and the index
+    is kept in sync by triggers, keyed on the jobs rowid.
+    """
+    await execute_script(conn, """
+        CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+            title, company, description,
+            content = 'jobs',
+            tokenize = 'porter unicode61'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+            INSERT INTO jobs_fts (rowid, title, company, description)
+            VALUES (new.rowid, new.title, new.company, new.description);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+            VALUES ('delete', old.rowid, old.title, old.company, old.description);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_update
+        AFTER UPDATE OF title, company, description ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+            VALUES ('delete', old.rowid, old.title, old.company, old.description);
+            INSERT INTO jobs_fts (rowid, title, company, description)
+            VALUES (new.rowid, new.title, new.company, new.description);
+        END;
+    """)
+    # Index rows that predate the table; one statement, reported by tick()
+    await conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+
+
+# Recompute every portal_stats counter from the jobs and applications tables.
+# Shared by the migration backfill and Database.rebuild_stats().
+REBUILD_PORTAL_STATS_SQL = """
+    DELETE FROM portal_stats;
+
+    INSERT INTO portal_stats
+        (portal, jobs_total, jobs_queued, jobs_applied, jobs_failed, score_sum)
+    SELECT portal, COUNT(*), SUM(status = 'queued'), SUM(status = 'applied'),
+           SUM(status = 'failed'), COALESCE(SUM(score), 0)
+    FROM jobs
+    GROUP BY portal;
+
+    INSERT OR IGNORE INTO portal_stats (portal)
+    SELECT DISTINCT jobs.portal FROM applications JOIN jobs ON jobs.job_id = applications.job_id;
+
+    UPDATE portal_stats SET
+        (total_attempts, successful_applications, failed_applications, last_attempt_at,
+         response_time_total_ms, response_time_samples) = (
+            SELECT COUNT(*), COALESCE(SUM(a.success != 0), 0), COALESCE(SUM(a.success = 0), 0),
+                   MAX(a.applied_at), COALESCE(SUM(a.response_time_ms), 0),
+                   COUNT(a.response_time_ms)
+            FROM applications a JOIN jobs j ON j.job_id = a.job_id
+            WHERE j.portal = portal_stats.portal
+        );
+
+    UPDATE portal_stats SET avg_response_time_ms = CASE
+        WHEN response_time_samples > 0 THEN response_time_total_ms / response_time_samples
+    END;
+"""
+
+
+async def _portal_stats_counters(conn: aiosqlite.Connection, progress: MigrationProgress) -> None:
+    """Trigger-maintained per-portal counters so stats reads skip table scans.
+
+    Job counters mirror the current contents of ``jobs``; attempt counters
+    mirror ``applications``. Both move with inserts, status changes and
+    deletes, so archiving rows keeps them consistent with a rebuild.
+    """
+    for name in ("jobs_total", "jobs_queued", "jobs_applied", "jobs_failed", "score_sum",
+                 "response_time_total_ms", "response_time_samples"):
+        await add_column(conn, "portal_stats", name, "INTEGER NOT NULL DEFAULT 0")
+    await add_column(conn, "applications", "response_time_ms", "INTEGER")
+
+    await execute_script(conn, """
+        CREATE TRIGGER IF NOT EXISTS portal_stats_job_insert AFTER INSERT ON jobs BEGIN
+            INSERT OR IGNORE INTO portal_stats (portal) VALUES (new.portal);
+            UPDATE portal_stats SET
+                jobs_total = jobs_total + 1,
+                jobs_queued = jobs_queued + (new.status = 'queued'),
+                jobs_applied = jobs_applied + (new.status = 'applied'),
+                jobs_failed = jobs_failed + (new.status = 'failed'),
+                score_sum = score_sum + COALESCE(new.score, 0)
+            WHERE portal = new.portal;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS portal_stats_job_update
+        AFTER UPDATE OF status, score, portal ON jobs
+        WHEN old.status IS NOT new.status
+          OR old.score IS NOT new.score
+          OR old.portal IS NOT new.portal
+        BEGIN
+            UPDATE portal_stats SET
+                jobs_total = jobs_total - 1,
+                jobs_queued = jobs_queued - (old.status = 'queued'),
+                jobs_applied = jobs_applied - (old.status = 'applied'),
+                jobs_failed = jobs_failed - (old.status = 'failed'),
+                score_sum = score_sum - COALESCE(old.score, 0)
+            WHERE portal = old.portal;
+            INSERT OR IGNORE INTO portal_stats (portal) VALUES (new.portal);
+            UPDATE portal_stats SET
+                jobs_total = jobs_total + 1,
+                jobs_queued = jobs_queued + (new.status = 'queued'),
+                jobs_applied = jobs_applied + (new.status = 'applied'),
+                jobs_failed = jobs_failed + (new.status = 'failed'),
+                score_sum = score_sum + COALESCE(new.score, 0)
+            WHERE portal = new.portal;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS portal_stats_job_delete AFTER DELETE ON jobs BEGIN
+            UPDATE portal_stats SET
+                jobs_total = jobs_total - 1,
+                jobs_queued = jobs_queued - (old.status = 'queued'),
+                jobs_applied = jobs_applied - (old.status = 'applied'),
+                jobs_failed = jobs_failed - (old.status = 'failed'),
+                score_sum = score_sum - COALESCE(old.score, 0)
+            WHERE portal = old.portal;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS portal_stats_attempt_insert AFTER INSERT ON applications BEGIN
+            INSERT OR IGNORE INTO portal_stats (portal)
+            SELECT portal FROM jobs WHERE job_id = new.job_id;
+            UPDATE portal_stats SET
+                total_attempts = COALESCE(total_attempts, 0) + 1,
+                successful_applications = COALESCE(successful_applications, 0) + (new.success != 0),
+                failed_applications = COALESCE(failed_applications, 0) + (new.success = 0),
+                last_attempt_at = new.applied_at,
+                response_time_total_ms = response_time_total_ms + COALESCE(new.response_time_ms, 0),
+                response_time_samples = response_time_samples + (new.response_time_ms IS NOT NULL),
+                avg_response_time_ms = CASE
+                    WHEN new.response_time_ms IS NULL THEN avg_response_time_ms
+                    ELSE (response_time_total_ms + new.response_time_ms) / (response_time_samples + 1)
+                END
+            WHERE portal = (SELECT portal FROM jobs WHERE job_id = new.job_id);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS portal_stats_attempt_delete AFTER DELETE ON applications BEGIN
+            UPDATE portal_stats SET
+                total_attempts = total_attempts - 1,
+                successful_applications = successful_applications - (old.success != 0),
+                failed_applications = failed_applications - (old.success = 0),
+                response_time_total_ms = response_time_total_ms - COALESCE(old.response_time_ms, 0),
+                response_time_samples = response_time_samples - (old.response_time_ms IS NOT NULL),
+                avg_response_time_ms = CASE
+                    WHEN old.response_time_ms IS NULL THEN avg_response_time_ms
+                    WHEN response_time_samples > 1
+                    THEN (response_time_total_ms - old.response_time_ms) / (response_time_samples - 1)
+                END
+            WHERE portal = (SELECT portal FROM jobs WHERE job_id = old.job_id);
+        END;
+    """)
+    await execute_script(conn, REBUILD_PORTAL_STATS_SQL)
+
+
+async def _applications_job_index(conn: aiosqlite.Connection, progress: MigrationProgress) -> None:
+    """Index attempts by job so retention can archive a job with its attempts."""
+    await conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_applications_job ON applications(job_id)"
+    )
+
+
+async def _nodes(conn: aiosqlite.Connection, progress: MigrationProgress) -> None:
+    """Registry of swarm nodes sharing this queue, for portal assignment."""
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS nodes (
+            node_id TEXT PRIMARY KEY,
+            portals TEXT NOT NULL,
+            registered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_seen_at TIMESTAMP NOT NULL
+        )
+    """)
+
+
+async def _search_yield(conn: aiosqlite.Connection, progress: MigrationProgress) -> None:
+    """New jobs found per (portal, keyword, location), for planning searches."""
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS search_yield (
+            portal TEXT NOT NULL,
+            keyword TEXT NOT NULL,
+            location TEXT NOT NULL,
+            searches INTEGER NOT NULL DEFAULT 0,
+            new_jobs INTEGER NOT NULL DEFAULT 0,
+            recent_yield REAL NOT NULL DEFAULT 0,
+            empty_streak INTEGER NOT NULL DEFAULT 0,
+            last_searched_at TIMESTAMP,
+            PRIMARY KEY (portal, keyword, location)
+        )
+    """)
+
+
+async def _portal_schedule(conn: aiosqlite.Connection, progress: MigrationProgress) -> None:
+    """Next due time of each portal's searches and applications in continuous mode."""
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS portal_schedule (
+            portal TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            next_run_at TIMESTAMP NOT NULL,
+            PRIMARY KEY (portal, kind)
+        )
+    """)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "initial_schema", _initial_schema),
+    Migration(2, "job_leases", _job_leases),
+    Migration(3, "priority_rank", _priority_rank),
+    Migration(4, "jobs_fts", _jobs_fts),
+    Migration(5, "portal_stats_counters", _portal_stats_counters),
+    Migration(6, "applications_job_index", _applications_job_index),
+    Migration(7, "nodes", _nodes),
+    Migration(8, "search_yield", _search_yield),
+    Migration(9, "portal_schedule", _portal_schedule),
+]
+
+
+# -- Runner -----------------------------------------------------------------
+
+async def current_version(conn: aiosqlite.Connection) -> int:
+    """Highest applied migration version (0 for an unversioned database)."""
+    async with conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+    ) as cursor:
+        if await cursor.fetchone() is None:
+            return 0
+    async with conn.execute("SELECT MAX(version) FROM schema_version") as cursor:
+        row = await cursor.fetchone()
+        return row[0] or 0
+
+
+async def pending_migrations(conn: aiosqlite.Connection) -> List[Migration]:
+    """Migrations not yet applied to this database, in order."""
+    version = await current_version(conn)
+    return [m for m in MIGRATIONS if m.version > version]
+
+
+async def apply_migrations(
+    conn: aiosqlite.Connection,
+    progress: Optional[ProgressCallback] = None,
+    dry_run: bool = False
+) -> List[Migration]:
+    """Bring the database up to the latest schema version.
+
+    Each migration runs in its own ``BEGIN IMMEDIATE`` transaction together
+    with its ``schema_version`` row, so an interrupted run resumes at the
+    first step that did not commit. The version is read again once the
+    write lock is held, so a step another process applied in the meantime
+    is skipped rather than run twice.
+
+    Returns:
+        The migrations that were applied (or would be, with ``dry_run``).
+    """
+    pending = await pending_migrations(conn)
+    if dry_run or not pending:
+        return pending
+
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    await conn.commit()
+
+    applied = []
+    for migration in pending:
+        await conn.execute("BEGIN IMMEDIATE")
+        if await current_version(conn) >= migration.version:
+            await conn.rollback()
+            logger.info(f"Migration {migration.version} ({migration.name}) already applied")
+            continue
+        reporter = MigrationProgress(migration, progress)
+        reporter.emit("applying")
+        await conn.set_progress_handler(reporter.tick, 100_000)
+        try:
+            await migration.apply(conn, reporter)
+            await conn.execute(
+                "INSERT INTO schema_version (version, name) VALUES (?, ?)",
+                (migration.version, migration.name)
+            )
+            await conn.commit()
+        except Exception:
+            await conn.rollback()
+            logger.error(f"Migration {migration.version} ({migration.name}) failed")
+            raise
+        finally:
+            await conn.set_progress_handler(None, 0)
+        reporter.emit(f"done in {time.monotonic() - reporter.started:.1f}s")
+        applied.append(migration)
+
+    return applied
@@ -0,0 +1,124 @@
+"""HTTP front end that lets swarm nodes on several machines share one queue.
+
+The server wraps a local :class:`~mjas.core.database.Database` and exposes
+the :class:`~mjas.core.backend.QueueBackend` operations as JSON RPC calls:
+``POST /rpc/<method>`` with the keyword arguments as the body. Claims
+still run as one ``UPDATE ... RETURNING`` on the server's database, so
+concurrent nodes can never lease the same job.
+
+Run it with ``python -m mjas serve-queue`` and point nodes at it with
+``python -m mjas run --queue-url http://host:8765``.
+"""
+
+import hmac
+import json
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from aiohttp import web
+
+from mjas.core.backend import QueueBackend
+from mjas.core.database import JobStatus
+from mjas.portals.base import JobListing
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+
+
+def _listings(rows: Any) -> list:
+    return [JobListing.from_row(row) for row in rows]
+
+
+# Remote methods and how to turn their JSON arguments back into Python values
+ARGUMENT_DECODERS: Dict[str, Dict[str, Callable[[Any], Any]]] = {
+    "insert_jobs_bulk": {"listings": _listings, "status": JobStatus},
+    "claim_jobs": {},
+    "release_jobs": {},
+    "reap_expired_leases": {"now": datetime.fromisoformat},
+    "update_job_status": {"status": JobStatus},
+    "log_application_attempt": {},
+    "get_stats": {},
+    "record_search_yield": {},
+    "get_search_yields": {},
+    "get_portal_schedule": {},
+    "set_portal_schedule": {"next_run_at": datetime.fromisoformat},
+    "register_node": {},
+    "heartbeat_node": {},
+    "deregister_node": {},
+    "active_nodes": {},
+    "portal_assignment": {},
+}
+
+
+def encode(value: Any) -> str:
+    """JSON for a response; datetimes and enums become strings."""
+    return json.dumps(value, default=str)
+
+
+def create_app(backend: QueueBackend, token: Optional[str] = None) -> web.Application:
+    """Build the queue server application around ``backend``.
+
+    Args:
+        token: Shared secret nodes must send as ``Authorization: Bearer``.
+            Without one the server accepts any caller, so only bind it to
+            a trusted network.
+    """
+
+    async def rpc(request: web.Request) -> web.Response:
+        if token is not None:
+            supplied = request.headers.get("Authorization", "")
+            if not hmac.compare_digest(supplied, f"Bearer {token}"):
+                return web.json_response({"error": "unauthorized"}, status=401)
+
+        method = request.match_info["method"]
+        decoders = ARGUMENT_DECODERS.get(method)
+        if decoders is None:
+            return web.json_response({"error": f"unknown method {method}"}, status=404)
+
+        try:
+            kwargs = await request.json()
+            if not isinstance(kwargs, dict):
+                raise ValueError("arguments must be a JSON object")
+            for name, decode in decoders.items():
+                if kwargs.get(name) is not None:
+                    kwargs[name] = decode(kwargs[name])
+        except (ValueError, KeyError, TypeError) as e:
+            return web.json_response({"error": f"bad arguments: {e}"}, status=400)
+
+        try:
+            result = await getattr(backend, method)(**kwargs)
+        except TypeError as e:
+            return web.json_response({"error": f"bad arguments: {e}"}, status=400)
+        except Exception as e:
+            logger.exception(f"Queue server: {method} failed")
+            return web.json_response({"error": str(e)}, status=500)
+        return web.json_response({"result": result}, dumps=encode)
+
+    async def health(request: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_post("/rpc/{method}", rpc)
+    app.router.add_get("/health", health)
+    return app
+
+
+async def serve(
+    backend: QueueBackend,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    token: Optional[str] = None
+) -> web.AppRunner:
+    """Start serving ``backend`` in the running loop.
+
+    Returns:
+        The runner; ``await runner.cleanup()`` stops the server. With
+        ``port=0`` the bound port is in ``runner.addresses``.
+    """
+    runner = web.AppRunner(create_app(backend, token), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logger.info(f"Queue server listening on {runner.addresses}")
+    return runner
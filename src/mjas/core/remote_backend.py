@@ -0,0 +1,173 @@
+"""Client for a queue server shared by several swarm nodes."""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import aiohttp
+
+from mjas.core.backend import NODE_TTL_SECONDS, BackendError, QueueBackend
+from mjas.core.database import JobStatus
+from mjas.portals.base import JobListing
+
+logger = logging.getLogger(__name__)
+
+
+class RemoteBackend(QueueBackend):
+    """A :class:`QueueBackend` served by :mod:`mjas.core.queue_server`.
+
+    Every call is one HTTP request; the server runs it against its own
+    database, so leases and claims behave exactly as they do locally.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token: Optional[str] = None,
+        timeout_seconds: float = 30.0
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.timeout_seconds = timeout_seconds
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def init(self) -> None:
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        self._session = aiohttp.ClientSession(
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
+        )
+        await self._call("get_stats")  # Fail fast on a wrong URL or token
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _call(self, method: str, **kwargs: Any) -> Any:
+        if self._session is None:
+            raise BackendError("RemoteBackend is not initialized")
+        try:
+            async with self._session.post(
+                f"{self.base_url}/rpc/{method}", json=kwargs
+            ) as response:
+                body = await response.json(content_type=None)
+        except (aiohttp.ClientError, TimeoutError, ValueError) as e:
+            raise BackendError(f"{method}: {e}") from e
+        if response.status != 200:
+            raise BackendError(f"{method}: {body.get('error', response.status)}")
+        return body["result"]
+
+    # -- Jobs ----------------------------------------------------------------
+
+    async def insert_jobs_bulk(
+        self,
+        listings: Iterable[JobListing],
+        status: JobStatus = JobStatus.QUEUED
+    ) -> List[str]:
+        rows = [listing.to_row() for listing in listings]
+        if not rows:
+            return []
+        return await self._call("insert_jobs_bulk", listings=rows, status=status.value)
+
+    async def claim_jobs(
+        self,
+        portal: str,
+        n: int,
+        lease_seconds: float,
+        owner: Optional[str] = None,
+        job_ids: Optional[Iterable[str]] = None
+    ) -> List[Dict]:
+        return await self._call(
+            "claim_jobs", portal=portal, n=n, lease_seconds=lease_seconds, owner=owner,
+            job_ids=None if job_ids is None else list(job_ids)
+        )
+
+    async def release_jobs(self, job_ids: Iterable[str], owner: Optional[str] = None) -> int:
+        job_ids = list(job_ids)
+        if not job_ids:
+            return 0
+        return await self._call("release_jobs", job_ids=job_ids, owner=owner)
+
+    async def reap_expired_leases(self, now: Optional[datetime] = None) -> int:
+        return await self._call("reap_expired_leases", now=now.isoformat() if now else None)
+
+    async def update_job_status(
+        self,
+        job_id: str,
+        status: JobStatus,
+        notes: Optional[str] = None,
+        screenshot_path: Optional[str] = None
+    ) -> None:
+        await self._call(
+            "update_job_status", job_id=job_id, status=status.value, notes=notes,
+            screenshot_path=screenshot_path
+        )
+
+    async def log_application_attempt(
+        self,
+        job_id: str,
+        success: bool,
+        error_message: Optional[str] = None,
+        screenshot_path: Optional[str] = None,
+        form_data: Optional[Dict] = None,
+        response_time_ms: Optional[int] = None
+    ) -> None:
+        await self._call(
+            "log_application_attempt", job_id=job_id, success=success,
+            error_message=error_message, screenshot_path=screenshot_path,
+            form_data=form_data, response_time_ms=response_time_ms
+        )
+
+    async def get_stats(self) -> Dict:
+        return await self._call("get_stats")
+
+    # -- Search yield --------------------------------------------------------
+
+    async def record_search_yield(
+        self,
+        portal: str,
+        keyword: str,
+        location: str,
+        new_jobs: int
+    ) -> None:
+        await self._call(
+            "record_search_yield", portal=portal, keyword=keyword, location=location,
+            new_jobs=new_jobs
+        )
+
+    async def get_search_yields(self, portals: Optional[Iterable[str]] = None) -> List[Dict]:
+        return await self._call(
+            "get_search_yields", portals=None if portals is None else list(portals)
+        )
+
+    # -- Continuous-mode schedule ----------------------------------------------
+
+    async def get_portal_schedule(self) -> List[Dict]:
+        return await self._call("get_portal_schedule")
+
+    async def set_portal_schedule(self, portal: str, kind: str, next_run_at: datetime) -> None:
+        await self._call(
+            "set_portal_schedule", portal=portal, kind=kind, next_run_at=next_run_at.isoformat()
+        )
+
+    # -- Nodes ---------------------------------------------------------------
+
+    async def register_node(self, node_id: str, portals: Sequence[str]) -> None:
+        await self._call("register_node", node_id=node_id, portals=list(portals))
+
+    async def heartbeat_node(self, node_id: str) -> bool:
+        return await self._call("heartbeat_node", node_id=node_id)
+
+    async def deregister_node(self, node_id: str) -> None:
+        await self._call("deregister_node", node_id=node_id)
+
+    async def active_nodes(self, ttl_seconds: float = NODE_TTL_SECONDS) -> Dict[str, List[str]]:
+        return await self._call("active_nodes", ttl_seconds=ttl_seconds)
+
+    async def portal_assignment(
+        self,
+        node_id: str,
+        ttl_seconds: float = NODE_TTL_SECONDS
+    ) -> List[str]:
+        return await self._call("portal_assignment", node_id=node_id, ttl_seconds=ttl_seconds)
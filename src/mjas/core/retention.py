@@ -0,0 +1,164 @@
+"""Retention: move old rows out of the hot database into a compressed archive.
+
+FAILED and SKIPPED jobs past a retention window, and application attempts
+past a longer horizon, are copied into a separate SQLite archive file and
+then deleted from ``data/mjas.db``. Each archived row is stored as a
+zlib-compressed JSON payload alongside a few columns for lookup, so the
+bulky ``description`` and ``form_data`` text shrinks considerably.
+
+Rows are written to the archive and committed there before they are
+deleted from the hot database; an interruption in between leaves a row in
+both places, and the next run simply archives it again.
+"""
+
+import json
+import logging
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS archived_jobs (
+        job_id TEXT PRIMARY KEY,
+        portal TEXT NOT NULL,
+        status TEXT NOT NULL,
+        updated_at TIMESTAMP,
+        archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        payload BLOB NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS archived_applications (
+        id INTEGER PRIMARY KEY,
+        job_id TEXT NOT NULL,
+        applied_at TIMESTAMP,
+        archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        payload BLOB NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_archived_applications_job
+    ON archived_applications(job_id);
+"""
+
+
+def pack(row: Mapping[str, Any]) -> bytes:
+    """Compress a row into an archive payload."""
+    return zlib.compress(json.dumps(dict(row), default=str).encode("utf-8"))
+
+
+def unpack(payload: bytes) -> Dict[str, Any]:
+    """Inverse of :func:`pack`."""
+    return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """How long rows stay in the hot database."""
+    job_days: int = 30  # FAILED/SKIPPED jobs untouched this long are archived
+    application_days: int = 90  # Attempts older than this are archived
+    job_statuses: Tuple[str, ...] = ("failed", "skipped")
+    batch_size: int = 1000
+
+    def job_cutoff(self, now: Optional[datetime] = None) -> datetime:
+        return (now or datetime.now()) - timedelta(days=self.job_days)
+
+    def application_cutoff(self, now: Optional[datetime] = None) -> datetime:
+        return (now or datetime.now()) - timedelta(days=self.application_days)
+
+
+@dataclass
+class RetentionReport:
+    """Rows moved by one retention pass."""
+    jobs_archived: int = 0
+    applications_archived: int = 0
+
+
+@dataclass
+class CompactionReport:
+    """Database size before and after a vacuum."""
+    bytes_before: int
+    bytes_after: int
+    full_vacuum: bool = False
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+class ArchiveStore:
+    """Compressed archive of rows removed from the hot database."""
+
+    def __init__(self, db_path: Path = Path("data/mjas-archive.db")):
+        self.db_path = db_path
+        self._conn: Optional[aiosqlite.Connection] = None
+
+    async def open(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = await aiosqlite.connect(self.db_path)
+        self._conn.row_factory = aiosqlite.Row
+        await self._conn.executescript(ARCHIVE_SCHEMA)
+        await self._conn.commit()
+
+    async def close(self) -> None:
+        if self._conn:
+            await self._conn.close()
+            self._conn = None
+
+    async def __aenter__(self) -> "ArchiveStore":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def store(
+        self,
+        jobs: List[Mapping[str, Any]],
+        applications: List[Mapping[str, Any]]
+    ) -> None:
+        """Write job and application rows in one committed transaction."""
+        await self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            await self._conn.executemany("""
+                INSERT OR REPLACE INTO archived_jobs (job_id, portal, status, updated_at, payload)
+                VALUES (?, ?, ?, ?, ?)
+            """, [(job["job_id"], job["portal"], job["status"], job["updated_at"], pack(job))
+                  for job in jobs])
+            await self._conn.executemany("""
+                INSERT OR REPLACE INTO archived_applications (id, job_id, applied_at, payload)
+                VALUES (?, ?, ?, ?)
+            """, [(app["id"], app["job_id"], app["applied_at"], pack(app))
+                  for app in applications])
+        except Exception:
+            await self._conn.rollback()
+            raise
+        await self._conn.commit()
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Look up an archived job, with its archived attempts under ``applications``."""
+        async with self._conn.execute(
+            "SELECT payload FROM archived_jobs WHERE job_id = ?", (job_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+
+        job = unpack(row["payload"])
+        async with self._conn.execute(
+            "SELECT payload FROM archived_applications WHERE job_id = ? ORDER BY id", (job_id,)
+        ) as cursor:
+            job["applications"] = [unpack(r["payload"]) for r in await cursor.fetchall()]
+        return job
+
+    async def counts(self) -> Dict[str, int]:
+        """Number of archived jobs and applications."""
+        async with self._conn.execute("""
+            SELECT (SELECT COUNT(*) FROM archived_jobs) AS jobs,
+                   (SELECT COUNT(*) FROM archived_applications) AS applications
+        """) as cursor:
+            return dict(await cursor.fetchone())
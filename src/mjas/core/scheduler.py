@@ -0,0 +1,200 @@
+"""Bounded, fair scheduling of browser work across portals."""
+
+import asyncio
+import logging
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Hashable, Iterable, List, Optional,
+    Set, Tuple
+)
+
+logger = logging.getLogger(__name__)
+
+# (portal, coroutine factory, browser key)
+ScheduledTask = Tuple[str, Callable[[], Awaitable[Any]], Optional[Hashable]]
+
+
+class SchedulerClosedError(RuntimeError):
+    """Raised when work is submitted to a scheduler that has been closed."""
+
+
+class TaskScheduler:
+    """Limits how much page work runs at once, and shares it fairly.
+
+    Work runs inside a *slot*. A slot is granted only while fewer than
+    ``max_concurrent`` slots are held overall, fewer than ``per_portal``
+    by the same portal and, when ``per_browser`` is set, fewer than
+    ``per_browser`` on the same browser. Waiting requests are queued per
+    portal and granted round-robin across portals, so one portal with many
+    searches cannot starve the others.
+
+    :meth:`close` cancels everything still queued or running through
+    :meth:`run_all`, for a prompt shutdown.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 4,
+        per_portal: int = 2,
+        per_browser: Optional[int] = None,
+        portal_delay: Optional[Callable[[str], float]] = None
+    ):
+        self.max_concurrent = max(1, max_concurrent)
+        self.per_portal = max(1, per_portal)
+        self.per_browser = per_browser
+        self.portal_delay = portal_delay
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self._queues: Dict[str, Deque[Tuple[Optional[Hashable], asyncio.Future]]] = {}
+        self._rotation: Deque[str] = deque()  # Portals with queued requests, next first
+        self._active = 0
+        self._by_portal: Counter = Counter()
+        self._by_browser: Counter = Counter()
+        self._tasks: Set[asyncio.Task] = set()
+        self._closed = False
+        self.peak_active = 0
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return sum(len(q) for q in self._queues.values())
+
+    @asynccontextmanager
+    async def slot(self, portal: str, browser: Optional[Hashable] = None) -> AsyncIterator[None]:
+        """Hold one unit of capacity for ``portal`` (on ``browser``) while inside the block."""
+        if self._closed:
+            raise SchedulerClosedError("Scheduler is closed")
+
+        waiter = asyncio.get_running_loop().create_future()
+        if portal not in self._queues or not self._queues[portal]:
+            self._rotation.append(portal)
+        self._queues.setdefault(portal, deque()).append((browser, waiter))
+        self._dispatch()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted in the same loop iteration we were cancelled in
+                self._release(portal, browser)
+            raise
+
+        try:
+            yield
+        finally:
+            self._release(portal, browser)
+
+    async def run(
+        self,
+        portal: str,
+        factory: Callable[[], Awaitable[Any]],
+        browser: Optional[Hashable] = None
+    ) -> Any:
+        """Await ``factory()`` inside a slot."""
+        async with self.slot(portal, browser):
+            return await factory()
+
+    async def run_all(self, tasks: Iterable[ScheduledTask]) -> List[Any]:
+        """Run every ``(portal, factory, browser)`` and collect results in order.
+
+        Like ``asyncio.gather(..., return_exceptions=True)``: a failing task
+        yields its exception instead of aborting the others.
+        """
+        running = []
+        for portal, factory, browser in tasks:
+            task = asyncio.ensure_future(self.run(portal, factory, browser))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            running.append(task)
+        return await asyncio.gather(*running, return_exceptions=True)
+
+    def spawn(self, coro: Awaitable[Any]) -> asyncio.Task:
+        """Track a task that takes its own slots, so :meth:`close` can cancel it."""
+        if self._closed:
+            raise SchedulerClosedError("Scheduler is closed")
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def close(self) -> None:
+        """Cancel queued and tracked work and wait for it to unwind."""
+        self._closed = True
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        for queue in self._queues.values():
+            while queue:
+                _, waiter = queue.popleft()
+                waiter.cancel()
+        self._rotation.clear()
+
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info(f"Scheduler closed, cancelled {len(tasks)} task(s)")
+
+    def _dispatch(self) -> None:
+        """Grant slots to queued requests, round-robin over portals."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        while self._active < self.max_concurrent and self._rotation:
+            granted = False
+            soonest: Optional[float] = None
+            for _ in range(len(self._rotation)):
+                portal = self._rotation[0]
+                self._rotation.rotate(-1)  # Whoever is served moves to the back
+                delay = self.portal_delay(portal) if self.portal_delay else 0.0
+                if delay > 0:
+                    soonest = delay if soonest is None else min(soonest, delay)
+                    continue
+                if self._grant_next(portal):
+                    granted = True
+                    break
+            if not granted:
+                if soonest is not None and not self._closed:
+                    self._wakeup = asyncio.get_running_loop().call_later(soonest, self._dispatch)
+                return
+
+    def _grant_next(self, portal: str) -> bool:
+        queue = self._queues[portal]
+        while queue and queue[0][1].cancelled():
+            queue.popleft()
+        if not queue:
+            self._rotation.remove(portal)
+            return False
+        if self._by_portal[portal] >= self.per_portal:
+            return False
+
+        browser, waiter = queue[0]
+        if (
+            self.per_browser is not None
+            and browser is not None
+            and self._by_browser[browser] >= self.per_browser
+        ):
+            return False
+
+        queue.popleft()
+        if not queue:
+            self._rotation.remove(portal)
+        self._active += 1
+        self.peak_active = max(self.peak_active, self._active)
+        self._by_portal[portal] += 1
+        if browser is not None:
+            self._by_browser[browser] += 1
+        waiter.set_result(None)
+        return True
+
+    def _release(self, portal: str, browser: Optional[Hashable]) -> None:
+        self._active -= 1
+        self._by_portal[portal] -= 1
+        if browser is not None:
+            self._by_browser[browser] -= 1
+        self._dispatch()
@@ -0,0 +1,83 @@
+"""Choose which (portal, keyword, location) searches to run each cycle.
+
+Running the full ``keywords x locations x portals`` product every cycle
+spends most page loads on combinations that stopped finding new jobs
+days ago. Each search's new-job count is recorded in ``search_yield``
+(see :meth:`Database.record_search_yield
+<mjas.core.database.Database.record_search_yield>`), and the planner
+decides each combination on its own recent yield.
+
+A combination's weight is its recent yield plus an exploration bonus that
+halves (by default) with every consecutive empty search. It is searched
+with probability ``weight / yield_threshold``, capped at 1: anything
+finding at least ``yield_threshold`` new jobs per search runs every
+cycle however many such combinations there are, dead ones run
+occasionally, and none are dropped for good. Combinations with no
+history are always searched.
+"""
+
+import random
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# (portal, keyword, location)
+SearchKey = Tuple[str, str, str]
+
+
+class SearchPlanner:
+    """Picks a yield-weighted subset of searches for one cycle.
+
+    Args:
+        yield_threshold: Weight, in new jobs per search, at or above which a
+            combination is searched every cycle.
+        exploration_weight: Bonus weight of a combination that has never
+            come back empty, in new jobs per search.
+        exploration_decay: Factor applied to the bonus per consecutive
+            empty search.
+        min_weight: Floor so no combination's chance reaches zero.
+    """
+
+    def __init__(
+        self,
+        yield_threshold: float = 2.0,
+        exploration_weight: float = 1.0,
+        exploration_decay: float = 0.5,
+        min_weight: float = 0.02,
+        rng: Optional[random.Random] = None
+    ):
+        self.yield_threshold = max(yield_threshold, 1e-6)
+        self.exploration_weight = exploration_weight
+        self.exploration_decay = exploration_decay
+        self.min_weight = min_weight
+        self.rng = rng or random.Random()
+
+    def weight(self, history: Mapping) -> float:
+        """Weight of a combination with this ``search_yield`` row."""
+        bonus = self.exploration_weight * self.exploration_decay ** history["empty_streak"]
+        return max(history["recent_yield"] + bonus, self.min_weight)
+
+    def plan(
+        self,
+        candidates: Sequence[SearchKey],
+        history: Iterable[Mapping]
+    ) -> List[SearchKey]:
+        """Choose this cycle's searches from ``candidates``.
+
+        Args:
+            candidates: Every combination that could be searched.
+            history: ``search_yield`` rows for (some of) them.
+
+        Returns:
+            The chosen combinations, most promising first.
+        """
+        rows: Dict[SearchKey, Mapping] = {
+            (row["portal"], row["keyword"], row["location"]): row for row in history
+        }
+        unseen = [key for key in candidates if key not in rows]
+        weights = {key: self.weight(rows[key]) for key in candidates if key in rows}
+
+        chosen = [
+            key for key, weight in weights.items()
+            if self.rng.random() < min(1.0, weight / self.yield_threshold)
+        ]
+        chosen.sort(key=lambda key: weights[key], reverse=True)
+        return unseen + chosen
@@ -0,0 +1,222 @@
+"""Run the swarm as several processes, each owning a shard of the portals.
+
+One asyncio loop drives every worker on a single core: Playwright IPC,
+JSON decoding, scoring and SQLite calls all share it. With ``--processes
+N`` the portal list is split into N shards, and each shard runs a full
+:class:`SwarmOrchestrator` with its own event loop and browser in a child
+process. A :class:`ShardSupervisor` in the parent collects per-cycle
+stats from the shards and restarts any that crash.
+
+All shards share ``data/mjas.db``. They open it in WAL mode with a busy
+timeout, and job claims are atomic ``UPDATE ... RETURNING`` statements
+leased to ``host:pid``, so shards never claim the same job and a crashed
+shard's jobs return to the queue once their leases expire.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import queue
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from mjas.core.database import Database, StorageProfile
+from mjas.core.session_manager import SessionManager
+from mjas.core.swarm import SwarmConfig, SwarmOrchestrator
+from mjas.portals.base import CandidateProfile
+
+logger = logging.getLogger(__name__)
+
+
+def shard_portals(portals: List[str], shards: int) -> List[List[str]]:
+    """Deal portals round-robin into at most ``shards`` non-empty groups.
+
+    Portal lists are ordered by importance, so dealing them out spreads the
+    busiest portals across processes instead of packing them into one.
+    """
+    shards = max(1, min(shards, len(portals)))
+    groups: List[List[str]] = [[] for _ in range(shards)]
+    for index, portal in enumerate(portals):
+        groups[index % shards].append(portal)
+    return groups
+
+
+def shared_storage(profile: StorageProfile) -> StorageProfile:
+    """``profile`` adjusted for several processes writing one database file."""
+    return replace(
+        profile,
+        journal_mode=profile.journal_mode or "WAL",
+        busy_timeout_ms=profile.busy_timeout_ms or 30_000,
+    )
+
+
+@dataclass
+class ShardSpec:
+    """Everything a shard process needs; sent to the child, so it must pickle."""
+    shard_id: int
+    portals: List[str]
+    config: SwarmConfig
+    profile: CandidateProfile
+    storage: StorageProfile
+    db_path: Path = Path("data/mjas.db")
+    continuous: bool = False
+    interval_minutes: int = 120
+    verbose: bool = False
+
+
+@dataclass
+class ShardState:
+    """The supervisor's view of one shard."""
+    spec: ShardSpec
+    process: Optional[multiprocessing.process.BaseProcess] = None
+    restarts: int = 0
+    finished: bool = False
+    cycles: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def run_shard(spec: ShardSpec, events: Any) -> None:
+    """Child process entry point: run one shard's swarm on a fresh event loop."""
+    logging.basicConfig(
+        level=logging.DEBUG if spec.verbose else logging.INFO,
+        format=f"%(asctime)s - shard{spec.shard_id} - %(name)s - %(levelname)s - %(message)s",
+    )
+    asyncio.run(_shard_main(spec, events))
+
+
+async def _shard_main(spec: ShardSpec, events: Any) -> None:
+    db = Database(spec.db_path, storage=spec.storage)
+    await db.init()
+    swarm = SwarmOrchestrator(spec.config, db, spec.profile, SessionManager())
+
+    def report(stats: Dict[str, Any]) -> None:
+        events.put({"shard": spec.shard_id, "stats": stats})
+
+    try:
+        await swarm.initialize_workers(spec.portals)
+        if not swarm.workers:
+            logger.error(f"Shard {spec.shard_id}: no workers started for {spec.portals}")
+            return
+        if spec.continuous:
+            await swarm.continuous_mode(spec.interval_minutes, on_cycle=report)
+        else:
+            report(await swarm.run_full_cycle())
+    finally:
+        await swarm.shutdown()
+        await db.close()
+
+
+class ShardSupervisor:
+    """Starts shard processes, gathers their cycle stats and restarts crashes.
+
+    A shard that exits with a non-zero code is restarted after
+    ``restart_delay_seconds``, at most ``max_restarts`` times. A clean exit
+    (a single cycle finished, or no workers could start) is final.
+    """
+
+    POLL_SECONDS = 0.5
+
+    def __init__(
+        self,
+        specs: List[ShardSpec],
+        max_restarts: int = 3,
+        restart_delay_seconds: float = 5.0,
+        target: Callable[[ShardSpec, Any], None] = run_shard
+    ):
+        # Spawn rather than fork: children must not inherit the parent's
+        # event loop, SQLite connections or Playwright driver
+        self._mp = multiprocessing.get_context("spawn")
+        self.events = self._mp.Queue()
+        self.shards = [ShardState(spec) for spec in specs]
+        self.max_restarts = max_restarts
+        self.restart_delay_seconds = restart_delay_seconds
+        self.target = target
+        self._restart_at: Dict[int, float] = {}
+
+    def _start(self, shard: ShardState) -> None:
+        shard.process = self._mp.Process(
+            target=self.target,
+            args=(shard.spec, self.events),
+            name=f"mjas-shard-{shard.spec.shard_id}",
+        )
+        shard.process.start()
+        logger.info(
+            f"Shard {shard.spec.shard_id} started (pid {shard.process.pid}): "
+            f"{', '.join(shard.spec.portals)}"
+        )
+
+    async def run(self) -> Dict[str, Any]:
+        """Run until every shard has finished for good. Returns :meth:`totals`."""
+        for shard in self.shards:
+            self._start(shard)
+        try:
+            while not all(shard.finished for shard in self.shards):
+                self._drain_events()
+                self._check_processes()
+                await asyncio.sleep(self.POLL_SECONDS)
+            self._drain_events()
+        finally:
+            self.stop()
+        return self.totals()
+
+    def _drain_events(self) -> None:
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                return
+            shard = self.shards[event["shard"]]
+            shard.cycles.append(event["stats"])
+            stats = event["stats"]
+            logger.info(
+                f"Shard {event['shard']} cycle: {stats.get('research', 0)} found, "
+                f"{stats.get('applied', 0)} applied"
+            )
+
+    def _check_processes(self) -> None:
+        now = time.monotonic()
+        for index, shard in enumerate(self.shards):
+            if shard.finished:
+                continue
+            if index in self._restart_at:
+                if now >= self._restart_at[index]:
+                    del self._restart_at[index]
+                    self._start(shard)
+                continue
+            if shard.process is None or shard.process.is_alive():
+                continue
+
+            exitcode = shard.process.exitcode
+            if exitcode == 0:
+                shard.finished = True
+            elif shard.restarts < self.max_restarts:
+                shard.restarts += 1
+                logger.warning(
+                    f"Shard {shard.spec.shard_id} exited with code {exitcode}, restarting "
+                    f"({shard.restarts}/{self.max_restarts})"
+                )
+                self._restart_at[index] = now + self.restart_delay_seconds
+            else:
+                logger.error(f"Shard {shard.spec.shard_id} exited with code {exitcode}, giving up")
+                shard.finished = True
+
+    def stop(self) -> None:
+        """Terminate shards that are still running."""
+        for shard in self.shards:
+            if shard.process is not None and shard.process.is_alive():
+                shard.process.terminate()
+        for shard in self.shards:
+            if shard.process is not None:
+                shard.process.join(timeout=10)
+
+    def totals(self) -> Dict[str, Any]:
+        """Sum the cycle stats reported by every shard."""
+        cycles = [stats for shard in self.shards for stats in shard.cycles]
+        return {
+            "research": sum(stats.get("research", 0) for stats in cycles),
+            "applied": sum(stats.get("applied", 0) for stats in cycles),
+            "cycles": len(cycles),
+            "restarts": sum(shard.restarts for shard in self.shards),
+            "total_jobs": max((stats.get("total_jobs", 0) for stats in cycles), default=0),
+        }
@@ -2,13 +2,22 @@
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional
+import time
+from collections import deque
+from functools import partial
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
+from mjas.core.backend import QueueBackend
+from mjas.core.browser_pool import BrowserPool
+from mjas.core.cadence import CadenceScheduler, resolve_cadence
 from mjas.core.database import Database
+from mjas.core.retention import ArchiveStore, RetentionPolicy
+from mjas.core.scheduler import TaskScheduler
+from mjas.core.search_planner import SearchKey, SearchPlanner
 from mjas.core.session_manager import SessionManager
-from mjas.portals.base import CandidateProfile
+from mjas.portals.base import Cadence, CandidateProfile
 from mjas.portals.registry import get_portal, TIER_1_PORTALS, TIER_2_PORTALS, TIER_3_PORTALS
 from mjas.core.worker import PortalWorker
 
@@ -19,11 +28,23 @@ logger = logging.getLogger(__name__)
 class SwarmConfig:
     """Configuration for the job application swarm."""
     headless: bool = True
-    max_concurrent_workers: int = 4
+    max_concurrent_workers: int = 4  # Searches/applications with a page open at once
+    max_tasks_per_portal: int = 2
+    max_tasks_per_browser: Optional[int] = None  # Only matters with max_browsers > 1
+    max_browsers: int = 1  # Chromium processes shared by all workers
     search_keywords: List[str] = None
     search_locations: List[str] = None
     min_job_score: int = 65
     daily_application_target: int = 200
+    retention: Optional[RetentionPolicy] = None  # None keeps every row in the hot DB
+    maintenance_interval_hours: float = 24.0
+    prefetch_next_job: bool = True  # Load the next job page during rate-limit pauses
+    pipelined: bool = False  # Apply to jobs as searches find them, without the phase barrier
+    pipeline_buffer: int = 20  # Job ids a portal's searches may run ahead of its applier
+    adaptive_search: bool = True  # Spend searches in proportion to recent new-job yield
+    search_yield_threshold: float = 2.0  # New jobs per search at which a combination always runs
+    startup_concurrency: int = 4  # Workers starting (launching, logging in) at once
+    worker_start_timeout_seconds: float = 90.0
 
     def __post_init__(self):
         if self.search_keywords is None:
@@ -38,13 +59,33 @@ class SwarmConfig:
             self.search_locations = ["Remote", "India"]
 
 
+def resolve_portals(portals: Optional[List[str]] = None, tier: Optional[int] = None) -> List[str]:
+    """The portals to run: ``portals`` if given, else the tier's list (tier 1 by default)."""
+    if portals is not None:
+        return list(portals)
+    if tier == 2:
+        return list(TIER_2_PORTALS)
+    if tier == 3:
+        return list(TIER_3_PORTALS)
+    return list(TIER_1_PORTALS)
+
+
+@dataclass
+class WorkerStartup:
+    """How one worker's startup went."""
+    portal: str
+    started: bool
+    seconds: float
+    error: Optional[str] = None
+
+
 class SwarmOrchestrator:
     """Orchestrates multiple portal workers for maximum throughput."""
 
     def __init__(
         self,
         config: SwarmConfig,
-        database: Database,
+        database: QueueBackend,
         profile: CandidateProfile,
         session_manager: Optional[SessionManager] = None
     ):
@@ -53,26 +94,87 @@ class SwarmOrchestrator:
         self.profile = profile
         self.session_manager = session_manager or SessionManager()
         self.workers: Dict[str, PortalWorker] = {}
+        self.browser_pool = BrowserPool(
+            headless=config.headless, max_browsers=config.max_browsers
+        )
+        self.scheduler = TaskScheduler(
+            max_concurrent=config.max_concurrent_workers,
+            per_portal=config.max_tasks_per_portal,
+            per_browser=config.max_tasks_per_browser,
+            portal_delay=self._portal_delay
+        )
+        self.planner = SearchPlanner(yield_threshold=config.search_yield_threshold)
+        self.startup_report: List[WorkerStartup] = []
+        self.last_plan: List[SearchKey] = []
+        self._searches_skipped = 0
         self._running = False
+        self._wakeup: Optional[asyncio.Event] = None
+        self._last_maintenance: Optional[datetime] = None
+        self._portal_locks: Dict[str, asyncio.Lock] = {}  # One run at a time per portal
+        # Portals this node owns in a multi-node swarm (see apply_assignment);
+        # None runs every worker
+        self.assigned_portals: Optional[Set[str]] = None
+
+    def _portal_delay(self, portal: str) -> float:
+        """Seconds until ``portal``'s rate limiter allows another page load."""
+        worker = self.workers.get(portal)
+        return worker.portal.rate_limiter.delay() if worker is not None else 0.0
+
+    def token_availability(self) -> Dict[str, float]:
+        """Navigation tokens each portal has in hand right now."""
+        return {
+            name: worker.portal.rate_limiter.available()
+            for name, worker in self.workers.items()
+        }
 
-    async def initialize_workers(self, portals: Optional[List[str]] = None, tier: Optional[int] = None) -> None:
+    async def initialize_workers(
+        self,
+        portals: Optional[List[str]] = None,
+        tier: Optional[int] = None
+    ) -> List[WorkerStartup]:
         """Initialize workers for specified portals.
 
+        Up to ``config.startup_concurrency`` workers start at once, each
+        bounded by ``config.worker_start_timeout_seconds``.
+
         Args:
             portals: Specific list of portal names, or None for default
             tier: Portal tier to use (1, 2, or 3). Ignored if portals is specified.
-        """
-        if portals is None:
-            if tier == 1:
-                portals = TIER_1_PORTALS
-            elif tier == 2:
-                portals = TIER_2_PORTALS
-            elif tier == 3:
-                portals = TIER_3_PORTALS
-            else:
-                portals = TIER_1_PORTALS  # Default to tier 1
 
-        for portal_name in portals:
+        Returns:
+            One :class:`WorkerStartup` per portal, also kept as ``startup_report``.
+        """
+        portals = resolve_portals(portals, tier)
+
+        # Start workers concurrently so one slow login does not hold up the rest
+        slots = asyncio.Semaphore(max(1, self.config.startup_concurrency))
+        results = await asyncio.gather(
+            *(self._start_worker(name, slots) for name in portals)
+        )
+
+        self.startup_report = []
+        for startup, worker in results:
+            self.startup_report.append(startup)
+            if worker is not None:
+                self.workers[startup.portal] = worker
+
+        started = sum(1 for s in self.startup_report if s.started)
+        logger.info(f"Started {started}/{len(self.startup_report)} workers")
+        for startup in self.startup_report:
+            status = "ok" if startup.started else f"failed ({startup.error})"
+            logger.info(f"  {startup.portal}: {status} in {startup.seconds:.1f}s")
+        return self.startup_report
+
+    async def _start_worker(
+        self,
+        portal_name: str,
+        slots: asyncio.Semaphore
+    ) -> Tuple[WorkerStartup, Optional[PortalWorker]]:
+        """Create and start one worker, within ``worker_start_timeout_seconds``."""
+        async with slots:
+            started_at = time.monotonic()
+            worker = None
+            error = None
             try:
                 portal = get_portal(portal_name, {})
                 worker = PortalWorker(
@@ -80,31 +182,101 @@ class SwarmOrchestrator:
                     database=self.db,
                     profile=self.profile,
                     headless=self.config.headless,
-                    session_manager=self.session_manager
+                    session_manager=self.session_manager,
+                    browser_pool=self.browser_pool,
+                    prefetch=self.config.prefetch_next_job,
+                    scheduler=self.scheduler
                 )
-
-                success = await worker.start()
-                if success:
-                    self.workers[portal_name] = worker
+                if await asyncio.wait_for(
+                    worker.start(), timeout=self.config.worker_start_timeout_seconds
+                ):
                     logger.info(f"Worker {portal_name} initialized")
                 else:
-                    logger.error(f"Failed to initialize {portal_name}")
-
+                    error = "start failed"
+            except TimeoutError:
+                error = f"timed out after {self.config.worker_start_timeout_seconds:.0f}s"
             except Exception as e:
-                logger.error(f"Error initializing {portal_name}: {e}")
+                error = str(e)
+
+            if error is not None:
+                logger.error(f"Failed to initialize {portal_name}: {error}")
+                if worker is not None:
+                    # Release its context so the shared browser does not accumulate them
+                    try:
+                        await worker.stop()
+                    except Exception as e:
+                        logger.debug(f"Error stopping {portal_name}: {e}")
+                worker = None
+
+            elapsed = time.monotonic() - started_at
+            return WorkerStartup(portal_name, error is None, elapsed, error), worker
+
+    def owns(self, name: str) -> bool:
+        """Whether this node should still run ``name`` (always, outside a multi-node swarm)."""
+        return self.assigned_portals is None or name in self.assigned_portals
+
+    async def apply_assignment(self, portals: List[str]) -> None:
+        """Start workers for portals this node gained and stop those it lost.
+
+        Searches for a lost portal are skipped from now on; its worker is
+        stopped once any run it is in the middle of has finished.
+        """
+        self.assigned_portals = set(portals)
+        for name in [n for n in self.workers if not self.owns(n)]:
+            async with self._portal_locks.setdefault(name, asyncio.Lock()):
+                worker = self.workers.pop(name, None)
+                if worker is not None:
+                    logger.info(f"Stopping {name}: assigned to another node")
+                    await worker.stop()
+
+        gained = [name for name in portals if name not in self.workers]
+        if gained:
+            logger.info(f"Starting newly assigned portals: {', '.join(gained)}")
+            startups = await self.initialize_workers(gained)
+            for name in [s.portal for s in startups if s.started and not self.owns(s.portal)]:
+                # Lost again while starting
+                await self.workers.pop(name).stop()
+        if self._wakeup is not None:
+            self._wakeup.set()  # Let continuous mode pick up the new portals
+
+    async def plan_searches(self, portals: Optional[List[str]] = None) -> List[SearchKey]:
+        """The (portal, keyword, location) searches to run this cycle.
+
+        Every combination without ``config.adaptive_search``; otherwise the
+        :class:`SearchPlanner`'s pick of them by recent yield.
+
+        Args:
+            portals: Plan for these portals only (default: every worker).
+        """
+        portals = [name for name in (self.workers if portals is None else portals) if self.owns(name)]
+        candidates = [
+            (name, keyword, location)
+            for name in portals
+            for keyword in self.config.search_keywords
+            for location in self.config.search_locations
+        ]
+        plan = candidates
+        if self.config.adaptive_search:
+            history = await self.db.get_search_yields(portals)
+            plan = self.planner.plan(candidates, history)
+            logger.info(f"Search plan: {len(plan)} of {len(candidates)} searches")
+
+        self.last_plan = plan
+        self._searches_skipped = len(candidates) - len(plan)
+        return plan
 
     async def run_research_phase(self) -> int:
         """Run research across all workers. Returns total jobs found."""
         logger.info("=== RESEARCH PHASE ===")
 
+        # Queued per portal and started as scheduler slots free up
         tasks = []
-        for name, worker in self.workers.items():
-            for keyword in self.config.search_keywords:
-                for location in self.config.search_locations:
-                    task = worker.search_and_queue(keyword, location)
-                    tasks.append(task)
+        for name, keyword, location in await self.plan_searches():
+            worker = self.workers[name]
+            search = partial(worker.search_and_queue, keyword, location)
+            tasks.append((name, search, worker.browser_key))
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await self.scheduler.run_all(tasks)
         total = sum(r for r in results if isinstance(r, int))
 
         logger.info(f"Research complete: {total} jobs added to queue")
@@ -114,9 +286,13 @@ class SwarmOrchestrator:
         """Run application phase across all workers. Returns total applied."""
         logger.info("=== APPLICATION PHASE ===")
 
-        # Run workers in parallel
+        # Recover jobs abandoned by crashed workers or processes
+        await self.db.reap_expired_leases()
+
+        # Run workers in parallel; each application takes a scheduler slot,
+        # the rate-limit pauses between them do not
         tasks = [
-            worker.run_cycle()
+            self.scheduler.spawn(worker.run_cycle())
             for worker in self.workers.values()
         ]
 
@@ -126,22 +302,128 @@ class SwarmOrchestrator:
         logger.info(f"Application phase complete: {total} jobs applied")
         return total
 
+    async def run_pipelined_phase(self) -> Tuple[int, int]:
+        """Research and apply at once, each portal applying as its searches queue jobs.
+
+        Returns:
+            (jobs found, jobs applied)
+        """
+        logger.info("=== PIPELINED RESEARCH + APPLICATION ===")
+        await self.db.reap_expired_leases()
+
+        searches: Dict[str, List[Tuple[str, str]]] = {name: [] for name in self.workers}
+        for name, keyword, location in await self.plan_searches():
+            searches[name].append((keyword, location))
+
+        results = await asyncio.gather(*(
+            self.scheduler.spawn(self._run_portal_pipeline(name, worker, searches[name]))
+            for name, worker in self.workers.items()
+        ), return_exceptions=True)
+
+        for name, result in zip(self.workers, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Pipeline for {name} failed: {result}")
+        found = sum(r[0] for r in results if isinstance(r, tuple))
+        applied = sum(r[1] for r in results if isinstance(r, tuple))
+        logger.info(f"Pipelined phase complete: {found} jobs found, {applied} applied")
+        return found, applied
+
+    async def _run_portal_pipeline(
+        self,
+        name: str,
+        worker: PortalWorker,
+        searches: List[Tuple[str, str]]
+    ) -> Tuple[int, int]:
+        """One portal's searches feeding its applier through a bounded channel."""
+        channel: asyncio.Queue = asyncio.Queue(maxsize=max(1, self.config.pipeline_buffer))
+        producer = asyncio.ensure_future(self._search_into(name, worker, searches, channel))
+        try:
+            applied = await worker.apply_stream(channel)
+        except BaseException:
+            producer.cancel()
+            raise
+        found = await producer
+
+        # Jobs left queued by earlier cycles, as the batch mode would pick them
+        applied += await worker.run_cycle()
+        return found, applied
+
+    async def _search_into(
+        self,
+        name: str,
+        worker: PortalWorker,
+        searches: List[Tuple[str, str]],
+        channel: asyncio.Queue
+    ) -> int:
+        """Run a portal's (keyword, location) searches through the scheduler, streaming new job ids.
+
+        Up to ``config.max_tasks_per_portal`` searches run at once. Each
+        search lane hands its results to ``channel`` before starting its
+        next search, so while the buffer is full no further searches start
+        until the applier catches up. Ends the stream with ``None``.
+        """
+        pending = deque(searches)
+        found = 0
+
+        async def lane() -> None:
+            nonlocal found
+            while pending:
+                keyword, location = pending.popleft()
+                try:
+                    job_ids = await self.scheduler.run(
+                        name, partial(worker.search_and_queue_ids, keyword, location),
+                        worker.browser_key
+                    )
+                except Exception as e:
+                    logger.error(f"{name}: Search failed: {e}")
+                    continue
+                found += len(job_ids)
+                for job_id in job_ids:
+                    await channel.put(job_id)
+
+        lanes = max(1, min(self.config.max_tasks_per_portal, len(searches)))
+        await asyncio.gather(*(lane() for _ in range(lanes)))
+        await channel.put(None)
+        return found
+
     async def run_full_cycle(self) -> Dict[str, int]:
-        """Run complete research + application cycle."""
+        """Run complete research + application cycle.
+
+        With ``config.pipelined`` both run together (see
+        :meth:`run_pipelined_phase`); otherwise research finishes first.
+        """
         stats = {
             "research": 0,
             "applied": 0,
             "timestamp": datetime.now().isoformat()
         }
+        cycle_started = time.monotonic()
+        for worker in self.workers.values():
+            worker.first_attempt_at = None
 
-        # Research phase
-        stats["research"] = await self.run_research_phase()
+        if self.config.pipelined:
+            stats["research"], stats["applied"] = await self.run_pipelined_phase()
+        else:
+            # Research phase
+            stats["research"] = await self.run_research_phase()
 
-        # Brief pause between phases
-        await asyncio.sleep(5)
+            # Brief pause between phases
+            await asyncio.sleep(5)
 
-        # Application phase
-        stats["applied"] = await self.run_application_phase()
+            # Application phase
+            stats["applied"] = await self.run_application_phase()
+
+        stats["cycle_seconds"] = round(time.monotonic() - cycle_started, 1)
+        stats["searches"] = len(self.last_plan)
+        stats["searches_skipped"] = self._searches_skipped
+        first_attempts = [
+            w.first_attempt_at for w in self.workers.values() if w.first_attempt_at is not None
+        ]
+        if first_attempts:
+            stats["first_application_seconds"] = round(min(first_attempts) - cycle_started, 1)
+
+        stats.update(self.take_telemetry(self.workers))
+        logger.debug(f"Navigation tokens available: {self.token_availability()}")
 
         # Get final stats
         db_stats = await self.db.get_stats()
@@ -149,32 +431,203 @@ class SwarmOrchestrator:
 
         return stats
 
-    async def continuous_mode(self, interval_minutes: int = 120) -> None:
-        """Run continuously with specified interval."""
-        self._running = True
+    def take_telemetry(self, names: Iterable[str]) -> Dict[str, float]:
+        """Collect and reset the named workers' counters since the last call.
+
+        Covers bandwidth saved by resource blocking, wall-clock saved by
+        event-driven waits over the fixed delays, and time navigations
+        spent waiting on the per-portal token buckets.
+        """
+        workers = {name: self.workers[name] for name in names}
+        blocked = [worker.resource_blocker.take_stats() for worker in workers.values()]
+
+        wait_seconds_saved = 0.0
+        for name, worker in workers.items():
+            timings = worker.portal.step_timings.take()
+            for step, step_stats in timings.items():
+                logger.debug(
+                    f"{name} {step}: {step_stats['count']} waits, "
+                    f"{step_stats['elapsed']:.1f}s of {step_stats['fallback']:.1f}s"
+                )
+            wait_seconds_saved += sum(s["saved"] for s in timings.values())
+
+        return {
+            "blocked_requests": sum(b["blocked_requests"] for b in blocked),
+            "bytes_saved": sum(b["bytes_saved"] for b in blocked),
+            "wait_seconds_saved": round(wait_seconds_saved, 1),
+            "rate_limit_wait_seconds": round(sum(
+                worker.portal.rate_limiter.take_waited() for worker in workers.values()
+            ), 1),
+        }
+
+    async def run_maintenance(self) -> None:
+        """Archive expired rows and compact the database, if retention is on.
+
+        Only a local database is maintained here; a shared queue is
+        maintained on the queue server's host.
+        """
+        if self.config.retention is None or not isinstance(self.db, Database):
+            return
+
+        async with ArchiveStore() as archive:
+            retained = await self.db.archive_expired(archive, self.config.retention)
+        # Incremental only: a full VACUUM would stall the running swarm
+        compacted = await self.db.compact(allow_full_vacuum=False)
+        self._last_maintenance = datetime.now()
+        logger.info(
+            f"Maintenance: archived {retained.jobs_archived} jobs, "
+            f"{retained.applications_archived} attempts; "
+            f"reclaimed {compacted.bytes_reclaimed} bytes"
+        )
+
+    def maintenance_due(self) -> bool:
+        """Whether the retention interval has elapsed since the last run."""
+        if self.config.retention is None:
+            return False
+        if self._last_maintenance is None:
+            return True
+        interval = timedelta(hours=self.config.maintenance_interval_hours)
+        return datetime.now() - self._last_maintenance >= interval
+
+    def cadence_for(self, name: str, default_minutes: float) -> Cadence:
+        """``name``'s cadence, with unset intervals at ``default_minutes``."""
+        return resolve_cadence(self.workers[name].portal.config.cadence, default_minutes)
+
+    async def run_portal_searches(self, name: str) -> int:
+        """Run one portal's planned searches. Returns jobs found."""
+        worker = self.workers[name]
+        results = await self.scheduler.run_all(
+            (name, partial(worker.search_and_queue, keyword, location), worker.browser_key)
+            for _, keyword, location in await self.plan_searches([name])
+        )
+        return sum(r for r in results if isinstance(r, int))
+
+    async def run_portal_applications(self, name: str) -> int:
+        """Apply to one portal's queued jobs. Returns jobs applied."""
+        await self.db.reap_expired_leases()
+        return await self.workers[name].run_cycle()
+
+    async def _run_due(self, name: str, kind: str) -> Dict:
+        """Run one due search or apply pass and summarize it like a cycle.
+
+        A portal's search and apply runs share its browser context, so they
+        take turns on a per-portal lock rather than overlapping.
+        """
+        stats = {
+            "portal": name,
+            "kind": kind,
+            "research": 0,
+            "applied": 0,
+            "timestamp": datetime.now().isoformat()
+        }
+        lock = self._portal_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            if name not in self.workers:
+                logger.info(f"Skipping {name} {kind}: no longer assigned to this node")
+                return stats
+            if kind == "search":
+                stats["research"] = await self.run_portal_searches(name)
+            else:
+                stats["applied"] = await self.run_portal_applications(name)
+            stats.update(self.take_telemetry([name]))
+        stats.update(await self.db.get_stats())
+        return stats
 
-        logger.info(f"Starting continuous mode (interval: {interval_minutes}min)")
+    async def continuous_mode(
+        self,
+        interval_minutes: int = 120,
+        on_cycle: Optional[Callable[[Dict], None]] = None
+    ) -> None:
+        """Run each portal's searches and applications on its own cadence.
+
+        Portals' :class:`~mjas.portals.base.Cadence` intervals (defaulting
+        to ``interval_minutes``) are kept in a :class:`CadenceScheduler`;
+        a run starts as soon as it is due, with no barrier between portals.
+        A run still going when it comes due again is skipped that time.
+
+        ``on_cycle`` receives the stats of each finished run, e.g. to report
+        them to a supervising process.
+        """
+        self._running = True
+        self._wakeup = asyncio.Event()
+        cadence = CadenceScheduler(
+            {name: self.cadence_for(name, interval_minutes) for name in self.workers}, self.db
+        )
+        await cadence.load()
+        running: Dict[asyncio.Task, Tuple[str, str]] = {}
+
+        logger.info(f"Starting continuous mode (default interval: {interval_minutes}min)")
+        for name in self.workers:
+            c = cadence.cadences[name]
+            logger.info(f"  {name}: search every {c.search_minutes:g}min, "
+                        f"apply every {c.apply_minutes:g}min")
 
         while self._running:
             try:
-                stats = await self.run_full_cycle()
-                logger.info(f"Cycle complete: {stats}")
-
-                # Wait for next cycle
-                logger.info(f"Sleeping for {interval_minutes} minutes...")
-                await asyncio.sleep(interval_minutes * 60)
+                now = datetime.now()
+                self._wakeup.clear()
+                # Follow workers started or stopped by apply_assignment
+                for name in self.workers.keys() - cadence.cadences.keys():
+                    cadence.add(name, self.cadence_for(name, interval_minutes), now)
+                for name in cadence.cadences.keys() - self.workers.keys():
+                    cadence.discard(name)
+                # Put the whole batch back in the heap before any I/O, so a
+                # failed save cannot drop the entries after it
+                rescheduled = [
+                    (name, kind, cadence.reschedule(name, kind, now))
+                    for name, kind in cadence.pop_due(now)
+                ]
+                for name, kind, _ in rescheduled:
+                    if (name, kind) in running.values():
+                        logger.info(f"{name} {kind} still running, skipping this turn")
+                        continue
+                    running[self.scheduler.spawn(self._run_due(name, kind))] = (name, kind)
+                for name, kind, due in rescheduled:
+                    await cadence.save(name, kind, due)
+
+                next_due = cadence.next_due()
+                timeout = max(0.0, (next_due - datetime.now()).total_seconds()) if next_due else None
+                wakeup = asyncio.ensure_future(self._wakeup.wait())
+                done, _ = await asyncio.wait(
+                    [*running, wakeup], timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                wakeup.cancel()
+
+                for task in done:
+                    if task not in running:
+                        continue
+                    name, kind = running.pop(task)
+                    if task.cancelled():
+                        continue
+                    if task.exception() is not None:
+                        logger.error(f"{name} {kind} failed: {task.exception()}")
+                        continue
+                    stats = task.result()
+                    logger.info(f"{name} {kind} complete: {stats}")
+                    if on_cycle is not None:
+                        on_cycle(stats)
+
+                if self.maintenance_due():
+                    await self.run_maintenance()
 
             except Exception as e:
                 logger.error(f"Cycle error: {e}")
                 await asyncio.sleep(60)  # Brief retry on error
 
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
     def stop(self):
         """Signal continuous mode to stop."""
         self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
 
     async def shutdown(self):
         """Shutdown all workers."""
         logger.info("Shutting down swarm...")
+        await self.scheduler.close()
         for worker in self.workers.values():
             await worker.stop()
         self.workers.clear()
+        await self.browser_pool.close()
@@ -2,12 +2,19 @@
 
 import asyncio
 import logging
+import time
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, AsyncContextManager, List, Optional
 from playwright.async_api import async_playwright, BrowserContext
 
 from mjas.portals.base import JobPortal, ApplicationResult, CandidateProfile
-from mjas.core.database import Database, JobStatus
+from mjas.portals.page_pool import PagePool
+from mjas.portals.resource_blocking import ResourceBlocker
+from mjas.core.browser_pool import BrowserPool
+from mjas.core.backend import QueueBackend
+from mjas.core.database import JobStatus, default_lease_owner
+from mjas.core.scheduler import TaskScheduler
 from mjas.core.session_manager import SessionManager
 
 logger = logging.getLogger(__name__)
@@ -16,29 +23,58 @@ logger = logging.getLogger(__name__)
 class PortalWorker:
     """Worker that applies to jobs on a specific portal."""
 
+    CLAIM_BATCH_SIZE = 10
+    # Upper bound on one application's page work, excluding the rate-limit sleep
+    APPLY_TIME_BUDGET_SECONDS = 180
+    # Concurrent pages per context, and uses before a page is recycled
+    MAX_PAGES = 4
+    MAX_PAGE_USES = 25
+    # How long a session check result is trusted before checking again
+    SESSION_CHECK_TTL_SECONDS = 900
+
     def __init__(
         self,
         portal: JobPortal,
-        database: Database,
+        database: QueueBackend,
         profile: CandidateProfile,
         headless: bool = True,
-        session_manager: Optional[SessionManager] = None
+        session_manager: Optional[SessionManager] = None,
+        browser_pool: Optional[BrowserPool] = None,
+        prefetch: bool = True,
+        scheduler: Optional[TaskScheduler] = None
     ):
         self.portal = portal
         self.db = database
         self.profile = profile
         self.headless = headless
         self.session_manager = session_manager
+        self.browser_pool = browser_pool
+        # Load the next job's page during the rate-limit pause
+        self.prefetch = prefetch
+        # Shared limits on concurrent page work; applications take a slot each
+        self.scheduler = scheduler
         self.context: Optional[BrowserContext] = None
+        self.page_pool: Optional[PagePool] = None
+        self.resource_blocker = ResourceBlocker(portal.config.resource_blocking)
         self.playwright = None
         self.browser = None
+        self.first_attempt_at: Optional[float] = None  # time.monotonic() of the first apply
+        self._session_valid = False
+        self._session_checked_at: Optional[float] = None
+        self._session_lock = asyncio.Lock()  # One check or re-login at a time
         self.daily_count = 0
         self.last_reset = datetime.now()
+        self.worker_id = f"{default_lease_owner()}:{portal.config.name}"
 
     async def start(self) -> bool:
-        """Initialize browser and login."""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        """Initialize browser context and login.
+
+        With a ``browser_pool`` the worker only creates a context in the
+        shared browser; otherwise it launches a browser of its own.
+        """
+        if self.browser_pool is None:
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(headless=self.headless)
 
         context_options = {
             "viewport": {"width": 1920, "height": 1080},
@@ -53,11 +89,20 @@ class PortalWorker:
                 logger.info(f"{self.portal.config.name}: Loaded existing session")
                 context_options["storage_state"] = session_data
 
-        self.context = await self.browser.new_context(**context_options)
+        if self.browser_pool is not None:
+            self.context = await self.browser_pool.new_context(**context_options)
+        else:
+            self.context = await self.browser.new_context(**context_options)
+        await self.resource_blocker.install(self.context)
+        self.portal.resource_blocker = self.resource_blocker
+        self.page_pool = PagePool(
+            self.context, max_pages=self.MAX_PAGES, max_uses=self.MAX_PAGE_USES
+        )
+        self.portal.page_pool = self.page_pool
 
         # Check if already logged in from session
         if session_data and self.portal.config.requires_login:
-            if await self.portal.is_logged_in(self.context):
+            if await self.session_valid(session_data):
                 logger.info(f"{self.portal.config.name}: Session is valid, already logged in")
                 return True
             else:
@@ -68,6 +113,7 @@ class PortalWorker:
             if not session_data:
                 logger.warning(f"{self.portal.config.name}: No session found, login required")
             success = await self.portal.login(self.context)
+            self._remember_session(success)
             if not success:
                 logger.error(f"{self.portal.config.name}: Login failed")
                 return False
@@ -75,8 +121,110 @@ class PortalWorker:
         logger.info(f"{self.portal.config.name}: Worker started")
         return True
 
+    @property
+    def browser_key(self) -> Optional[Any]:
+        """The browser hosting this worker's context, for per-browser limits."""
+        return self.context.browser if self.context is not None else None
+
+    def slot(self) -> AsyncContextManager:
+        """A scheduler slot for one unit of page work (a no-op without a scheduler)."""
+        if self.scheduler is None:
+            return nullcontext()
+        return self.scheduler.slot(self.portal.config.name, self.browser_key)
+
+    async def session_valid(self, storage_state: Optional[dict] = None) -> bool:
+        """Whether the portal session is logged in, cached for ``SESSION_CHECK_TTL_SECONDS``.
+
+        See ``JobPortal.check_session`` for the tiers; ``storage_state`` lets
+        the cookie tier read the saved session instead of the live context.
+        """
+        if self._session_fresh():
+            return self._session_valid
+        valid = await self.portal.check_session(self.context, storage_state)
+        self._remember_session(valid)
+        return valid
+
+    async def ensure_session(self) -> bool:
+        """Whether the portal session is logged in, logging in again once if it expired.
+
+        The check shares :meth:`session_valid`'s cache; a failed re-login is
+        cached too, so it is retried at most once per TTL. Callers arriving
+        while another checks or logs in wait for it and reuse its result.
+        """
+        if not self.portal.config.requires_login:
+            return True
+        if self._session_fresh():
+            return self._session_valid
+
+        async with self._session_lock:
+            if self._session_fresh():
+                return self._session_valid  # Checked by whoever held the lock
+            # Cached only once settled, so nobody reads "expired" mid-login
+            if await self.portal.check_session(self.context):
+                self._remember_session(True)
+                return True
+
+            logger.warning(f"{self.portal.config.name}: Session expired, logging in again")
+            try:
+                success = await self.portal.login(self.context)
+            except Exception as e:
+                logger.error(f"{self.portal.config.name}: Re-login error: {e}")
+                success = False
+            self._remember_session(success)
+            if success and self.session_manager:
+                await self.save_session()
+            return success
+
+    def invalidate_session(self) -> None:
+        """Forget the cached session check, e.g. after being logged out."""
+        self._session_checked_at = None
+
+    def _session_fresh(self) -> bool:
+        return (
+            self._session_checked_at is not None
+            and time.monotonic() - self._session_checked_at < self.SESSION_CHECK_TTL_SECONDS
+        )
+
+    def _remember_session(self, valid: bool) -> None:
+        self._session_valid = valid
+        self._session_checked_at = time.monotonic()
+
     async def run_cycle(self) -> int:
         """Process jobs for this portal. Returns number applied."""
+        return await self._claim_and_apply()
+
+    async def apply_stream(self, channel: asyncio.Queue) -> int:
+        """Apply to jobs as their ids arrive on ``channel``, until a ``None``.
+
+        Ids that are ready together are claimed together, up to
+        ``CLAIM_BATCH_SIZE``. Once the daily limit is hit the channel is
+        still drained, so producers never block on a worker that has
+        stopped applying; those jobs simply stay queued.
+
+        Returns:
+            Number applied.
+        """
+        applied = 0
+        closed = False
+        while not closed:
+            job_id = await channel.get()
+            if job_id is None:
+                break
+            job_ids = [job_id]
+            while len(job_ids) < self.CLAIM_BATCH_SIZE:
+                try:
+                    job_id = channel.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if job_id is None:
+                    closed = True
+                    break
+                job_ids.append(job_id)
+            applied += await self._claim_and_apply(job_ids)
+        return applied
+
+    async def _claim_and_apply(self, job_ids: Optional[List[str]] = None) -> int:
+        """Claim a batch (the best queued, or among ``job_ids``) and apply to it."""
         # Reset daily counter if needed
         if datetime.now() - self.last_reset > timedelta(days=1):
             self.daily_count = 0
@@ -87,44 +235,69 @@ class PortalWorker:
             logger.info(f"{self.portal.config.name}: Daily limit reached")
             return 0
 
-        # Get pending jobs for this portal
-        jobs = await self.db.get_jobs_by_status(
-            JobStatus.QUEUED,
-            limit=10,
-            portal=self.portal.config.name
+        # Don't claim (and fail) a batch on a session that has expired. The
+        # check may load pages or log in again, so it counts against the limits
+        async with self.slot():
+            logged_in = await self.ensure_session()
+        if not logged_in:
+            logger.warning(f"{self.portal.config.name}: Not logged in, skipping cycle")
+            return 0
+
+        # Claim pending jobs for this portal (marks them APPLYING under our lease)
+        remaining = self.portal.config.max_applications_per_day - self.daily_count
+        batch_size = min(self.CLAIM_BATCH_SIZE, remaining)
+        jobs = await self.db.claim_jobs(
+            self.portal.config.name,
+            batch_size,
+            lease_seconds=self.lease_seconds(batch_size),
+            owner=self.worker_id,
+            job_ids=job_ids
         )
 
         if not jobs:
             return 0
 
+        handled = set()
+        try:
+            applied = await self._apply_claimed(jobs, handled)
+        finally:
+            await self.portal.discard_prefetched()
+            # Hand back anything we claimed but did not get to
+            unprocessed = [job["job_id"] for job in jobs if job["job_id"] not in handled]
+            if unprocessed:
+                await self.db.release_jobs(unprocessed, owner=self.worker_id)
+
+        return applied
+
+    def lease_seconds(self, batch_size: int) -> float:
+        """Lease long enough to work through a claimed batch sequentially."""
+        _, max_delay = self.portal.config.rate_limit_delay_seconds
+        return batch_size * (max_delay + self.APPLY_TIME_BUDGET_SECONDS)
+
+    async def _apply_claimed(self, jobs: list, handled: set) -> int:
+        """Apply to claimed jobs in order, recording each one touched."""
         applied = 0
-        for job_data in jobs:
+        for index, job_data in enumerate(jobs):
             if self.daily_count >= self.portal.config.max_applications_per_day:
                 break
 
             job_id = job_data["job_id"]
-
-            # Mark as applying
-            await self.db.update_job_status(job_id, JobStatus.APPLYING)
+            handled.add(job_id)
 
             try:
                 # Convert to JobListing
                 from mjas.portals.base import JobListing
-                job = JobListing(
-                    job_id=job_id,
-                    title=job_data["title"],
-                    company=job_data["company"],
-                    location=job_data.get("location", ""),
-                    url=job_data["url"],
-                    portal=job_data["portal"],
-                    score=job_data.get("score", 0),
-                    priority=job_data.get("priority", "MEDIUM")
-                )
+                job = JobListing.from_row(job_data)
 
                 # Apply
-                result, error = await self.portal.apply_to_job(
-                    self.context, job, self.profile
-                )
+                async with self.slot():
+                    started = time.monotonic()
+                    if self.first_attempt_at is None:
+                        self.first_attempt_at = started
+                    result, error = await self.portal.apply_to_job(
+                        self.context, job, self.profile
+                    )
+                elapsed_ms = int((time.monotonic() - started) * 1000)
 
                 # Update status
                 if result == ApplicationResult.SUCCESS:
@@ -132,7 +305,9 @@ class PortalWorker:
                         job_id, JobStatus.APPLIED,
                         notes=f"Applied via {self.portal.config.name}"
                     )
-                    await self.db.log_application_attempt(job_id, True)
+                    await self.db.log_application_attempt(
+                        job_id, True, response_time_ms=elapsed_ms
+                    )
                     applied += 1
                     self.daily_count += 1
 
@@ -152,12 +327,15 @@ class PortalWorker:
                     await self.db.update_job_status(
                         job_id, JobStatus.FAILED, notes=error
                     )
-                    await self.db.log_application_attempt(job_id, False, error)
+                    await self.db.log_application_attempt(
+                        job_id, False, error, response_time_ms=elapsed_ms
+                    )
 
                 # Rate limiting delay
                 delay = self.portal.get_rate_limit_delay()
                 logger.debug(f"Rate limit delay: {delay:.1f}s")
-                await asyncio.sleep(delay)
+                next_job = jobs[index + 1] if index + 1 < len(jobs) else None
+                await self._rate_limit_pause(delay, next_job)
 
             except Exception as e:
                 logger.error(f"Error applying to {job_id}: {e}")
@@ -165,45 +343,79 @@ class PortalWorker:
 
         return applied
 
+    async def _rate_limit_pause(self, delay: float, next_job: Optional[dict]) -> None:
+        """Sleep ``delay`` seconds, loading ``next_job``'s page meanwhile.
+
+        The next application still starts no earlier than ``delay`` after
+        this call; only its navigation moves into the pause.
+        """
+        if not (self.prefetch and next_job and self.portal.prefetches_job_page):
+            await asyncio.sleep(delay)
+            return
+
+        from mjas.portals.base import JobListing
+        job = JobListing.from_row(next_job)
+
+        async def prefetch_job():
+            async with self.slot():
+                await self.portal.prefetch_job_page(self.context, job)
+
+        prefetch = asyncio.ensure_future(prefetch_job())
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            prefetch.cancel()
+            raise
+        try:
+            # Normally long done; a slow load just finishes here instead of in apply
+            await prefetch
+        except Exception as e:
+            logger.debug(f"{self.portal.config.name}: Prefetch failed, will load on apply: {e}")
+
     async def search_and_queue(self, keywords: str, location: str = "Remote") -> int:
         """Search for jobs and add to queue."""
+        return len(await self.search_and_queue_ids(keywords, location))
+
+    async def search_and_queue_ids(self, keywords: str, location: str = "Remote") -> List[str]:
+        """Search for jobs and add to queue, returning the ids newly queued."""
         from mjas.portals.base import JobQuery
 
         query = JobQuery(keywords=keywords, location=location)
 
         try:
-            listings = await self.portal.search_jobs(self.context, query)
+            if not await self.portal.before_search(self.context, self.ensure_session):
+                logger.warning(f"{self.portal.config.name}: Not logged in, skipping search")
+                return []
+            with self.resource_blocker.searching():
+                listings = await self.portal.search_jobs(self.context, query)
 
-            added = 0
+            qualified = []
             for listing in listings:
                 # Score job (simplified scoring)
                 score = self._calculate_score(listing, keywords)
 
                 if score >= 65:
-                    priority = "HIGH" if score >= 85 else "MEDIUM"
-                    await self.db.insert_job(
-                        job_id=listing.job_id,
-                        title=listing.title,
-                        company=listing.company,
-                        portal=listing.portal,
-                        url=listing.url,
-                        score=score,
-                        priority=priority,
-                        location=listing.location,
-                        description=listing.description
-                    )
-                    # Mark as queued
-                    await self.db.update_job_status(
-                        listing.job_id, JobStatus.QUEUED
-                    )
-                    added += 1
-
-            logger.info(f"{self.portal.config.name}: Added {added} jobs to queue")
-            return added
+                    listing.score = score
+                    listing.priority = "HIGH" if score >= 85 else "MEDIUM"
+                    qualified.append(listing)
 
+            # One transaction for the whole result page
+            new_ids = await self.db.insert_jobs_bulk(qualified, status=JobStatus.QUEUED)
         except Exception as e:
             logger.error(f"Search error: {e}")
-            return 0
+            return []
+
+        # Feeds the search planner; failed searches above are not counted.
+        # The jobs are queued already, so a failure here must not lose them.
+        try:
+            await self.db.record_search_yield(
+                self.portal.config.name, keywords, location, len(new_ids)
+            )
+        except Exception as e:
+            logger.warning(f"{self.portal.config.name}: Could not record search yield: {e}")
+
+        logger.info(f"{self.portal.config.name}: Added {len(new_ids)} jobs to queue")
+        return list(new_ids)
 
     def _calculate_score(self, job, keywords: str) -> int:
         """Calculate job match score."""
@@ -230,7 +442,11 @@ class PortalWorker:
         return min(score, 100)
 
     async def stop(self):
-        """Cleanup resources."""
+        """Cleanup resources. A pooled browser is left to its pool."""
+        if self.page_pool:
+            await self.page_pool.close()
+        if self.context and self.browser_pool is not None:
+            await self.context.close()
         if self.browser:
             await self.browser.close()
         if self.playwright:
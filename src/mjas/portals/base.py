@@ -1,11 +1,20 @@
 """Base classes and protocols for job portal implementations."""
 
+import sys
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any, Awaitable, Callable, Mapping
 from datetime import datetime
 from enum import Enum
 
+from mjas.portals.extraction import ExtractionSpec, extract_cards
+from mjas.portals.page_pool import PagePool
+from mjas.portals.rate_limit import RateLimit, TokenBucket
+from mjas.portals.resource_blocking import ResourceBlocker, ResourceBlocking
+from mjas.portals.session_check import SessionCheck, auth_cookies_valid, probe_session
+from mjas.portals.waits import CardCountStable, ForSelector, Sleep, StepTimings, WaitStrategy
+
 
 class ApplicationResult(Enum):
     SUCCESS = "success"
@@ -16,9 +25,36 @@ class ApplicationResult(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+class _LazyDict:
+    """Slot wrapper that allocates the dict on first read.
+
+    Most listings never carry metadata, so storing ``None`` until someone
+    touches it saves an empty dict per instance.
+    """
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, objtype)
+        if value is None:
+            value = {}
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+
+@dataclass(slots=True)
 class JobListing:
-    """Represents a discovered job listing."""
+    """Represents a discovered job listing.
+
+    Slotted so large research sweeps stay small in memory; ``portal`` and
+    ``priority`` are interned since they repeat across every listing.
+    """
     job_id: str
     title: str
     company: str
@@ -30,11 +66,51 @@ class JobListing:
     posted_date: Optional[datetime] = None
     score: int = 0
     priority: str = "MEDIUM"  # HIGH, MEDIUM, LOW
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.portal = sys.intern(self.portal)
+        self.priority = sys.intern(self.priority)
 
     def __hash__(self):
         return hash(self.job_id)
 
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "JobListing":
+        """Build a listing from a ``jobs`` row (dict or ``sqlite3.Row``)."""
+        return cls(
+            job_id=row["job_id"],
+            title=row["title"],
+            company=row["company"],
+            location=row["location"] or "",
+            url=row["url"],
+            portal=row["portal"],
+            description=row["description"],
+            salary_range=row["salary_range"],
+            score=row["score"] or 0,
+            priority=row["priority"] or "MEDIUM",
+        )
+
+    def to_row(self) -> Dict[str, Any]:
+        """Column values for inserting this listing into ``jobs``."""
+        return {
+            "job_id": self.job_id,
+            "title": self.title,
+            "company": self.company,
+            "portal": self.portal,
+            "url": self.url,
+            "location": self.location,
+            "description": self.description,
+            "salary_range": self.salary_range,
+            "score": self.score,
+            "priority": self.priority,
+        }
+
+
+# Dataclass defaults are fixed at class creation, so the lazy wrapper goes
+# on afterwards, around the slot descriptor.
+JobListing.metadata = _LazyDict(JobListing.metadata)
+
 
 @dataclass
 class JobQuery:
@@ -49,6 +125,18 @@ class JobQuery:
     salary_max: Optional[int] = None
 
 
+@dataclass(frozen=True)
+class Cadence:
+    """How often continuous mode searches and applies on a portal.
+
+    ``None`` intervals use the swarm's ``--interval``. Each run is
+    rescheduled ``interval * (1 ± jitter)`` later.
+    """
+    search_minutes: Optional[float] = None
+    apply_minutes: Optional[float] = None
+    jitter: float = 0.1
+
+
 @dataclass
 class PortalConfig:
     """Configuration for a job portal."""
@@ -60,6 +148,12 @@ class PortalConfig:
     supports_easy_apply: bool = False
     captcha_frequency: str = "low"  # low, medium, high
     selectors: Dict[str, str] = field(default_factory=dict)
+    resource_blocking: ResourceBlocking = field(default_factory=ResourceBlocking)
+    extraction: Optional[ExtractionSpec] = None  # Result cards, read in one round trip
+    waits: Dict[str, WaitStrategy] = field(default_factory=dict)  # Per step, see JobPortal.wait_for_step
+    session_check: Optional[SessionCheck] = None  # Cheap tiers before is_logged_in
+    rate_limit: RateLimit = field(default_factory=RateLimit)  # Pacing for JobPortal.goto
+    cadence: Cadence = field(default_factory=Cadence)  # Intervals in continuous mode
 
 
 @dataclass
@@ -103,10 +197,22 @@ class CandidateProfile:
 class JobPortal(ABC):
     """Abstract base class for job portal implementations."""
 
+    # Whether apply_to_job starts by loading the job page, which the worker
+    # can then prefetch during the rate-limit pause (see prefetch_job_page)
+    prefetches_job_page = False
+
     def __init__(self, config: PortalConfig, credentials: Optional[Dict] = None):
         self.config = config
         self.credentials = credentials or {}
         self._session_cookies: Optional[Dict] = None
+        # Set by the worker; when present, pages for its context are reused
+        self.page_pool: Optional[PagePool] = None
+        # Set by the worker; pages acquired during a search are registered with it
+        self.resource_blocker: Optional[ResourceBlocker] = None
+        self.step_timings = StepTimings()
+        self.rate_limiter = TokenBucket.from_limit(config.rate_limit)
+        self._prefetched: Dict[str, Any] = {}  # job_id -> page already showing the job
+        self._handed_out: Dict[Any, str] = {}  # prefetched page -> job_id, until loaded
 
     @abstractmethod
     async def login(self, context: Any) -> bool:
@@ -160,11 +266,145 @@ class JobPortal(ABC):
         """Check if currently logged in."""
         pass
 
-    async def before_search(self, context: Any) -> bool:
-        """Hook called before search - override if needed."""
-        if self.config.requires_login and not await self.is_logged_in(context):
-            return await self.login(context)
-        return True
+    async def check_session(
+        self,
+        context: Any,
+        storage_state: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Check the login cheaply first, rendering a page only as a last resort.
+
+        Tiers, each run only when the previous one is inconclusive:
+
+        1. ``config.session_check.auth_cookies`` in ``storage_state`` (or the
+           context's live cookies): a missing or expired one means logged out.
+        2. ``config.session_check.probe_url`` fetched over HTTP.
+        3. :meth:`is_logged_in`, the full page check.
+        """
+        check = self.config.session_check
+        if check is None:
+            return await self.is_logged_in(context)
+
+        if check.auth_cookies:
+            if storage_state is None:
+                storage_state = {"cookies": await context.cookies()}
+            if not auth_cookies_valid(storage_state, check.auth_cookies):
+                return False
+
+        if check.probe_url:
+            verdict = await probe_session(context, check)
+            if verdict is not None:
+                return verdict
+
+        return await self.is_logged_in(context)
+
+    async def acquire_page(self, context: Any) -> Any:
+        """Get a page on ``context``, from the page pool when it serves that context."""
+        if self.page_pool is not None and self.page_pool.context is context:
+            page = await self.page_pool.acquire()
+        else:
+            page = await context.new_page()
+        if self.resource_blocker is not None:
+            self.resource_blocker.track_page(page)
+        return page
+
+    async def release_page(self, page: Any) -> None:
+        """Hand back a page from :meth:`acquire_page`."""
+        if self.resource_blocker is not None:
+            self.resource_blocker.untrack_page(page)
+        if self.page_pool is not None and page.context is self.page_pool.context:
+            await self.page_pool.release(page)
+        else:
+            await page.close()
+
+    async def goto(self, page: Any, url: str, **kwargs: Any) -> Any:
+        """Navigate ``page`` to ``url`` once the portal's rate limiter allows it.
+
+        Every portal navigation goes through here, so searches, applications
+        and prefetches share one budget of page loads per portal.
+        """
+        await self.rate_limiter.acquire()
+        return await page.goto(url, **kwargs)
+
+    async def acquire_job_page(self, context: Any, job: JobListing) -> Any:
+        """Like :meth:`acquire_page`, but hands out a page prefetched for ``job``."""
+        page = self._prefetched.pop(job.job_id, None)
+        if page is not None and not page.is_closed():
+            self._handed_out[page] = job.job_id
+            return page
+        return await self.acquire_page(context)
+
+    async def load_job_page(self, page: Any, job: JobListing) -> None:
+        """Navigate to ``job.url`` unless the page was prefetched for it."""
+        if self._handed_out.pop(page, None) == job.job_id:
+            return
+        await self.goto(page, job.url, wait_until="domcontentloaded")
+        await self.wait_for_step(page, "job_page", 2)
+
+    async def prefetch_job_page(self, context: Any, job: JobListing) -> None:
+        """Load ``job``'s page into a spare page for a later :meth:`acquire_job_page`."""
+        page = await self.acquire_page(context)
+        try:
+            await self.load_job_page(page, job)
+        except BaseException:
+            await self.release_page(page)
+            raise
+        self._prefetched[job.job_id] = page
+
+    async def discard_prefetched(self) -> None:
+        """Release prefetched pages that were never used."""
+        while self._prefetched:
+            _, page = self._prefetched.popitem()
+            await self.release_page(page)
+
+    async def extract_cards(self, page: Any) -> List[Dict[str, Optional[str]]]:
+        """Read the result cards described by ``config.extraction``."""
+        return await extract_cards(page, self.config.extraction)
+
+    def wait_strategy(self, step: str) -> WaitStrategy:
+        """The strategy for ``step``: declared in ``config.waits``, else a default.
+
+        Without a declaration, ``results`` waits for the first result card and
+        ``scroll`` for the card count to settle (both need ``config.extraction``);
+        any other step falls back to the fixed delay.
+        """
+        if step in self.config.waits:
+            return self.config.waits[step]
+        if self.config.extraction is not None:
+            if step == "results":
+                return ForSelector(self.config.extraction.card_selector)
+            if step == "scroll":
+                return CardCountStable(self.config.extraction.card_selector)
+        return Sleep()
+
+    async def wait_for_step(self, page: Any, step: str, fallback_seconds: float) -> bool:
+        """Wait for ``step`` to be ready, for at most ``fallback_seconds``.
+
+        Returns whether the strategy's condition was met before the timeout.
+        """
+        started = time.monotonic()
+        met = await self.wait_strategy(step).wait(page, fallback_seconds)
+        self.step_timings.record(step, time.monotonic() - started, fallback_seconds, met)
+        return met
+
+    async def before_search(
+        self,
+        context: Any,
+        session_valid: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> bool:
+        """Hook called before search - override if needed.
+
+        Args:
+            context: Playwright browser context
+            session_valid: The worker's cached session check, which also logs
+                in again when the session expired (see
+                ``PortalWorker.ensure_session``). Without it the session is
+                checked here, uncached.
+        """
+        if not self.config.requires_login:
+            return True
+        if session_valid is not None:
+            return await session_valid()
+        return await self.check_session(context) or await self.login(context)
 
     async def after_apply(self, context: Any, job: JobListing, result: ApplicationResult) -> None:
         """Hook called after apply - override for cleanup."""
@@ -1,6 +1,5 @@
 """CareerBuilder job portal implementation."""
 
-import asyncio
 import hashlib
 import logging
 from typing import List, Tuple, Optional
@@ -10,6 +9,8 @@ from mjas.portals.base import (
     JobPortal, PortalConfig, JobListing, JobQuery,
     CandidateProfile, ApplicationResult
 )
+from mjas.portals.extraction import ExtractionSpec, FieldSpec, fields
+from mjas.portals.session_check import SessionCheck
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +30,14 @@ class CareerBuilderPortal(JobPortal):
             "login_password": "input[type='password']",
             "search_keywords": "input[data-testid='search-input']",
             "search_location": "input[data-testid='location-input']",
-            "job_card": "[data-testid='job-card']",
             "apply_button": "button[data-testid='apply-button']",
-        }
+        },
+        extraction=ExtractionSpec(
+            card_selector="[data-testid='job-card']",
+            fields=fields(title=FieldSpec("h2")),
+            limit=20,
+        ),
+        session_check=SessionCheck(probe_url="https://www.careerbuilder.com/profile"),
     )
 
     def __init__(self, credentials: Optional[dict] = None):
@@ -48,9 +54,9 @@ class CareerBuilderPortal(JobPortal):
 
     async def is_logged_in(self, context: BrowserContext) -> bool:
         """Check if logged in to CareerBuilder."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         try:
-            await page.goto("https://www.careerbuilder.com/profile", wait_until="domcontentloaded")
+            await self.goto(page, "https://www.careerbuilder.com/profile", wait_until="domcontentloaded")
             # Check for profile page indicator
             profile_indicator = await page.query_selector("[data-testid='profile-header']") or \
                                await page.query_selector(".profile-container") or \
@@ -60,11 +66,11 @@ class CareerBuilderPortal(JobPortal):
         except:
             return False
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def search_jobs(self, context: BrowserContext, query: JobQuery) -> List[JobListing]:
         """Search CareerBuilder jobs."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         jobs = []
 
         try:
@@ -73,16 +79,13 @@ class CareerBuilderPortal(JobPortal):
             url = f"https://www.careerbuilder.com/jobs?keywords={keywords}&location={location}"
 
             logger.info(f"Searching CareerBuilder: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.goto(page, url, wait_until="domcontentloaded")
+            await self.wait_for_step(page, "results", 2)
 
-            cards = await page.query_selector_all(self.config.selectors["job_card"])
-
-            for card in cards[:20]:
+            for card in await self.extract_cards(page):
                 try:
-                    title_elem = await card.query_selector("h2")
-                    if title_elem:
-                        title = await title_elem.inner_text()
+                    if card["title"] is not None:
+                        title = card["title"]
                         job_id = hashlib.md5(title.encode()).hexdigest()[:12]
 
                         jobs.append(JobListing(
@@ -99,7 +102,7 @@ class CareerBuilderPortal(JobPortal):
             logger.info(f"Found {len(jobs)} jobs on CareerBuilder")
             return jobs
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def apply_to_job(
         self,
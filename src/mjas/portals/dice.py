@@ -1,6 +1,5 @@
 """Dice job portal - tech-focused."""
 
-import asyncio
 import hashlib
 import logging
 from typing import List, Tuple, Optional
@@ -10,6 +9,8 @@ from mjas.portals.base import (
     JobPortal, PortalConfig, JobListing, JobQuery,
     CandidateProfile, ApplicationResult
 )
+from mjas.portals.extraction import ExtractionSpec, FieldSpec, fields
+from mjas.portals.session_check import SessionCheck
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +30,17 @@ class DicePortal(JobPortal):
             "login_password": "input[type='password']",
             "search_keywords": "input[id='typeaheadInput']",
             "search_location": "input[id='google-location-search']",
-            "job_card": "[data-cy='search-result']",
             "apply_button": "button[data-cy='apply-button']",
-        }
+        },
+        extraction=ExtractionSpec(
+            card_selector="[data-cy='search-result']",
+            fields=fields(
+                title=FieldSpec("a"),
+                href=FieldSpec("a", "href"),
+            ),
+            limit=20,
+        ),
+        session_check=SessionCheck(probe_url="https://www.dice.com/dashboard"),
     )
 
     def __init__(self, credentials: Optional[dict] = None):
@@ -48,9 +57,9 @@ class DicePortal(JobPortal):
 
     async def is_logged_in(self, context: BrowserContext) -> bool:
         """Check if logged in to Dice."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         try:
-            await page.goto("https://www.dice.com/dashboard", wait_until="domcontentloaded")
+            await self.goto(page, "https://www.dice.com/dashboard", wait_until="domcontentloaded")
             # Check for dashboard/profile indicator
             profile_indicator = await page.query_selector("[data-cy='profile-menu']") or \
                                await page.query_selector(".user-profile") or \
@@ -59,11 +68,11 @@ class DicePortal(JobPortal):
         except:
             return False
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def search_jobs(self, context: BrowserContext, query: JobQuery) -> List[JobListing]:
         """Search Dice jobs."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         jobs = []
 
         try:
@@ -71,17 +80,14 @@ class DicePortal(JobPortal):
             url = f"https://www.dice.com/jobs?q={keywords}&countryCode=US&radius=30&radiusUnit=mi&page=1&pageSize=20&language=en"
 
             logger.info(f"Searching Dice: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.goto(page, url, wait_until="domcontentloaded")
+            await self.wait_for_step(page, "results", 2)
 
-            cards = await page.query_selector_all(self.config.selectors["job_card"])
-
-            for card in cards[:20]:
+            for card in await self.extract_cards(page):
                 try:
-                    title_elem = await card.query_selector("a")
-                    if title_elem:
-                        title = await title_elem.inner_text()
-                        href = await title_elem.get_attribute("href")
+                    if card["title"] is not None:
+                        title = card["title"]
+                        href = card["href"]
                         job_id = hashlib.md5((title + href).encode()).hexdigest()[:12] if href else hashlib.md5(title.encode()).hexdigest()[:12]
 
                         jobs.append(JobListing(
@@ -98,7 +104,7 @@ class DicePortal(JobPortal):
             logger.info(f"Found {len(jobs)} jobs on Dice")
             return jobs
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def apply_to_job(
         self,
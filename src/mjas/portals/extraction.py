@@ -0,0 +1,61 @@
+"""Declarative job-card extraction in a single browser round trip.
+
+Walking result cards with ``query_selector``/``inner_text``/``get_attribute``
+costs one IPC round trip per field per card. An :class:`ExtractionSpec`
+describes the card and its fields instead, and :func:`extract_cards` reads
+every card on the page with one ``page.evaluate`` call.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """One value read from a card.
+
+    ``selector`` is relative to the card (``None`` means the card itself);
+    the value is the element's ``innerText``, or ``attribute`` when given.
+    Missing elements yield ``None``.
+    """
+    selector: Optional[str]
+    attribute: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ExtractionSpec:
+    """Where a portal's result cards are and which fields to read."""
+    card_selector: str
+    fields: Tuple[Tuple[str, FieldSpec], ...]
+    limit: int = 25
+
+
+# Runs in the page. Receives [cardSelector, [[name, selector, attribute], ...], limit].
+EXTRACT_CARDS_JS = """
+([cardSelector, fields, limit]) => {
+    const cards = Array.from(document.querySelectorAll(cardSelector)).slice(0, limit);
+    return cards.map((card) => {
+        const values = {};
+        for (const [name, selector, attribute] of fields) {
+            const el = selector ? card.querySelector(selector) : card;
+            values[name] = el ? (attribute ? el.getAttribute(attribute) : el.innerText) : null;
+        }
+        return values;
+    });
+}
+"""
+
+
+def fields(**specs: FieldSpec) -> Tuple[Tuple[str, FieldSpec], ...]:
+    """Keyword shorthand for :attr:`ExtractionSpec.fields`."""
+    return tuple(specs.items())
+
+
+async def extract_cards(page: Any, spec: ExtractionSpec) -> List[Dict[str, Optional[str]]]:
+    """Read every card matching ``spec`` in one ``page.evaluate`` call."""
+    args = [
+        spec.card_selector,
+        [[name, field.selector, field.attribute] for name, field in spec.fields],
+        spec.limit,
+    ]
+    return await page.evaluate(EXTRACT_CARDS_JS, args)
@@ -1,6 +1,5 @@
 """Glassdoor job portal implementation."""
 
-import asyncio
 import hashlib
 import logging
 from typing import List, Tuple, Optional
@@ -10,6 +9,8 @@ from mjas.portals.base import (
     JobPortal, PortalConfig, JobListing, JobQuery,
     CandidateProfile, ApplicationResult
 )
+from mjas.portals.extraction import ExtractionSpec, FieldSpec, fields
+from mjas.portals.session_check import SessionCheck
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +30,17 @@ class GlassdoorPortal(JobPortal):
             "login_password": "input[type='password']",
             "search_keywords": "input[data-test='search-bar-keyword-input']",
             "search_location": "input[data-test='search-bar-location-input']",
-            "job_card": "[data-test='jobListing']",
             "apply_button": "button[data-test='apply-button']",
-        }
+        },
+        extraction=ExtractionSpec(
+            card_selector="[data-test='jobListing']",
+            fields=fields(
+                title=FieldSpec("a.jobLink"),
+                href=FieldSpec("a.jobLink", "href"),
+            ),
+            limit=15,
+        ),
+        session_check=SessionCheck(probe_url="https://www.glassdoor.com/member/profile"),
     )
 
     def __init__(self, credentials: Optional[dict] = None):
@@ -48,18 +57,18 @@ class GlassdoorPortal(JobPortal):
 
     async def is_logged_in(self, context: BrowserContext) -> bool:
         """Check if logged in."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         try:
-            await page.goto("https://www.glassdoor.com/member/profile")
+            await self.goto(page, "https://www.glassdoor.com/member/profile")
             return "login" not in page.url
         except:
             return False
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def search_jobs(self, context: BrowserContext, query: JobQuery) -> List[JobListing]:
         """Search Glassdoor jobs."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         jobs = []
 
         try:
@@ -68,17 +77,14 @@ class GlassdoorPortal(JobPortal):
             url = f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={keywords}&locT=C&locId=1147401"
 
             logger.info(f"Searching Glassdoor: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.goto(page, url, wait_until="domcontentloaded")
+            await self.wait_for_step(page, "results", 2)
 
-            cards = await page.query_selector_all(self.config.selectors["job_card"])
-
-            for card in cards[:15]:
+            for card in await self.extract_cards(page):
                 try:
-                    title_elem = await card.query_selector("a.jobLink")
-                    if title_elem:
-                        title = await title_elem.inner_text()
-                        href = await title_elem.get_attribute("href")
+                    if card["title"] is not None:
+                        title = card["title"]
+                        href = card["href"]
                         job_id = hashlib.md5(href.encode()).hexdigest()[:12] if href else hashlib.md5(title.encode()).hexdigest()[:12]
 
                         jobs.append(JobListing(
@@ -95,7 +101,7 @@ class GlassdoorPortal(JobPortal):
             logger.info(f"Found {len(jobs)} jobs on Glassdoor")
             return jobs
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def apply_to_job(
         self,
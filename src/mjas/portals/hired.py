@@ -1,6 +1,5 @@
 """Hired job portal - reverse job board."""
 
-import asyncio
 import hashlib
 import logging
 from typing import List, Tuple, Optional
@@ -8,8 +7,9 @@ from playwright.async_api import BrowserContext
 
 from mjas.portals.base import (
     JobPortal, PortalConfig, JobListing, JobQuery,
-    CandidateProfile, ApplicationResult
+    CandidateProfile, ApplicationResult, Cadence
 )
+from mjas.portals.extraction import ExtractionSpec, FieldSpec, fields
 
 logger = logging.getLogger(__name__)
 
@@ -22,14 +22,19 @@ class HiredPortal(JobPortal):
         base_url="https://hired.com",
         max_applications_per_day=15,
         rate_limit_delay_seconds=(60, 120),
+        cadence=Cadence(search_minutes=360),  # Few new roles; 15 applications a day
         requires_login=True,
         supports_easy_apply=True,
         selectors={
             "login_email": "input[type='email']",
             "login_password": "input[type='password']",
-            "job_card": ".opportunity-card",
             "apply_button": "button.interested",
-        }
+        },
+        extraction=ExtractionSpec(
+            card_selector=".opportunity-card",
+            fields=fields(title=FieldSpec("h3")),
+            limit=15,
+        ),
     )
 
     def __init__(self, credentials: Optional[dict] = None):
@@ -46,9 +51,9 @@ class HiredPortal(JobPortal):
 
     async def is_logged_in(self, context: BrowserContext) -> bool:
         """Check if logged in to Hired."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         try:
-            await page.goto("https://hired.com/opportunities", wait_until="domcontentloaded")
+            await self.goto(page, "https://hired.com/opportunities", wait_until="domcontentloaded")
             # Check for opportunities page or user menu
             logged_in_indicator = await page.query_selector(".opportunity-card") or \
                                  await page.query_selector("[data-testid='user-menu']") or \
@@ -58,11 +63,11 @@ class HiredPortal(JobPortal):
         except:
             return False
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def search_jobs(self, context: BrowserContext, query: JobQuery) -> List[JobListing]:
         """Get job opportunities from Hired."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         jobs = []
 
         try:
@@ -70,16 +75,13 @@ class HiredPortal(JobPortal):
             url = "https://hired.com/opportunities"
 
             logger.info(f"Fetching Hired opportunities: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.goto(page, url, wait_until="domcontentloaded")
+            await self.wait_for_step(page, "results", 2)
 
-            cards = await page.query_selector_all(self.config.selectors["job_card"])
-
-            for card in cards[:15]:
+            for card in await self.extract_cards(page):
                 try:
-                    title_elem = await card.query_selector("h3")
-                    if title_elem:
-                        title = await title_elem.inner_text()
+                    if card["title"] is not None:
+                        title = card["title"]
                         job_id = hashlib.md5(title.encode()).hexdigest()[:12]
 
                         jobs.append(JobListing(
@@ -96,7 +98,7 @@ class HiredPortal(JobPortal):
             logger.info(f"Found {len(jobs)} opportunities on Hired")
             return jobs
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def apply_to_job(
         self,
@@ -1,6 +1,5 @@
 """Indeed job portal implementation."""
 
-import asyncio
 import hashlib
 import logging
 from typing import List, Tuple, Optional
@@ -10,6 +9,8 @@ from mjas.portals.base import (
     JobPortal, PortalConfig, JobListing, JobQuery,
     CandidateProfile, ApplicationResult
 )
+from mjas.portals.extraction import ExtractionSpec, FieldSpec, fields
+from mjas.portals.waits import ForSelector, any_of
 
 logger = logging.getLogger(__name__)
 
@@ -30,18 +31,38 @@ class IndeedPortal(JobPortal):
             "login_button": "button[type='submit']",
             "search_keywords": "input[name='q']",
             "search_location": "input[name='l']",
-            "job_card": ".job_seen_beacon",
-            "job_title": "h2.jobTitle",
-            "job_company": "span.companyName",
-            "job_location": "div.companyLocation",
             "apply_button": "button[data-testid='apply-button'], .indeed-apply-button",
             "easy_apply_badge": "span[data-testid='jobs-salary']",
             "resume_upload": "input[type='file']",
             "phone_input": "input[type='tel']",
             "submit_button": "button[type='submit']",
-        }
+        },
+        extraction=ExtractionSpec(
+            card_selector=".job_seen_beacon",
+            fields=fields(
+                title=FieldSpec("h2.jobTitle"),
+                company=FieldSpec("span.companyName"),
+                location=FieldSpec("div.companyLocation"),
+                href=FieldSpec("a.jcs-JobTitle", "href"),
+            ),
+            limit=20,
+        ),
+        waits={
+            "job_page": ForSelector("button[data-testid='apply-button'], .indeed-apply-button"),
+            # The submit selector also matches the search form, so wait for the form inputs
+            "apply_dialog": any_of(
+                ForSelector("input[type='tel']"),
+                ForSelector("input[type='file']"),
+            ),
+            "submitted": any_of(
+                ForSelector("text=Application submitted"),
+                ForSelector("text=Your application has been sent"),
+            ),
+        },
     )
 
+    prefetches_job_page = True
+
     def __init__(self, credentials: Optional[dict] = None):
         super().__init__(self.DEFAULT_CONFIG, credentials)
 
@@ -56,18 +77,18 @@ class IndeedPortal(JobPortal):
 
     async def is_logged_in(self, context: BrowserContext) -> bool:
         """Check if logged in."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         try:
-            await page.goto("https://www.indeed.com/", wait_until="domcontentloaded")
+            await self.goto(page, "https://www.indeed.com/", wait_until="domcontentloaded")
             return await page.query_selector("[data-testid='user-menu']") is not None
         except:
             return False
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def search_jobs(self, context: BrowserContext, query: JobQuery) -> List[JobListing]:
         """Search Indeed jobs."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         jobs = []
 
         try:
@@ -76,14 +97,12 @@ class IndeedPortal(JobPortal):
             url = f"https://www.indeed.com/jobs?q={keywords}&l={location}&sort=date"
 
             logger.info(f"Searching Indeed: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
-
-            cards = await page.query_selector_all(self.config.selectors["job_card"])
+            await self.goto(page, url, wait_until="domcontentloaded")
+            await self.wait_for_step(page, "results", 2)
 
-            for card in cards[:20]:
+            for card in await self.extract_cards(page):
                 try:
-                    job = await self._parse_job_card(card)
+                    job = self._parse_job_card(card)
                     if job:
                         jobs.append(job)
                 except Exception as e:
@@ -93,23 +112,18 @@ class IndeedPortal(JobPortal):
             logger.info(f"Found {len(jobs)} jobs on Indeed")
             return jobs
         finally:
-            await page.close()
+            await self.release_page(page)
 
-    async def _parse_job_card(self, card) -> Optional[JobListing]:
-        """Parse a job card element."""
+    def _parse_job_card(self, card: dict) -> Optional[JobListing]:
+        """Turn extracted card fields into a JobListing."""
         try:
-            title_elem = await card.query_selector(self.config.selectors["job_title"])
-            company_elem = await card.query_selector(self.config.selectors["job_company"])
-            loc_elem = await card.query_selector(self.config.selectors["job_location"])
-            link_elem = await card.query_selector("a.jcs-JobTitle")
-
-            if not title_elem or not link_elem:
+            title = card["title"]
+            href = card["href"]
+            if title is None or href is None:
                 return None
 
-            title = await title_elem.inner_text()
-            company = await company_elem.inner_text() if company_elem else "Unknown"
-            location = await loc_elem.inner_text() if loc_elem else "Unknown"
-            href = await link_elem.get_attribute("href")
+            company = card["company"] if card["company"] is not None else "Unknown"
+            location = card["location"] if card["location"] is not None else "Unknown"
             url = f"https://www.indeed.com{href}" if href.startswith("/") else href
 
             job_id = hashlib.md5(url.encode()).hexdigest()[:12]
@@ -132,13 +146,12 @@ class IndeedPortal(JobPortal):
         profile: CandidateProfile
     ) -> Tuple[ApplicationResult, Optional[str]]:
         """Apply to Indeed job."""
-        page = await context.new_page()
+        page = await self.acquire_job_page(context, job)
 
         try:
             logger.info(f"Applying to {job.title} at {job.company} on Indeed")
 
-            await page.goto(job.url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.load_job_page(page, job)
 
             # Check for Easy Apply / Apply Now button
             apply_btn = await page.query_selector(self.config.selectors["apply_button"])
@@ -146,7 +159,7 @@ class IndeedPortal(JobPortal):
                 return ApplicationResult.SKIPPED, "Apply button not found"
 
             await apply_btn.click()
-            await asyncio.sleep(2)
+            await self.wait_for_step(page, "apply_dialog", 2)
 
             # Fill basic info
             phone_input = await page.query_selector(self.config.selectors["phone_input"])
@@ -162,7 +175,7 @@ class IndeedPortal(JobPortal):
             submit_btn = await page.query_selector(self.config.selectors["submit_button"])
             if submit_btn:
                 await submit_btn.click()
-                await asyncio.sleep(2)
+                await self.wait_for_step(page, "submitted", 2)
 
                 # Check for success
                 success = await page.query_selector("text=Application submitted") or \
@@ -177,7 +190,7 @@ class IndeedPortal(JobPortal):
             logger.error(f"Indeed application error: {e}")
             return ApplicationResult.FAILURE, str(e)
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def _detect_captcha(self, page) -> bool:
         """Detect CAPTCHA."""
@@ -1,15 +1,19 @@
 """LinkedIn job portal implementation with Easy Apply support."""
 
-import asyncio
 import hashlib
 import logging
 from typing import List, Tuple, Optional
-from playwright.async_api import Page, BrowserContext
+from playwright.async_api import Page, BrowserContext, TimeoutError as PlaywrightTimeout
 
 from mjas.portals.base import (
     JobPortal, PortalConfig, JobListing, JobQuery,
-    CandidateProfile, ApplicationResult
+    CandidateProfile, ApplicationResult, Cadence
 )
+from mjas.portals.extraction import ExtractionSpec, FieldSpec, fields
+from mjas.portals.rate_limit import RateLimit
+from mjas.portals.resource_blocking import DEFAULT_BLOCKED_URL_PATTERNS, ResourceBlocking
+from mjas.portals.session_check import SessionCheck
+from mjas.portals.waits import ForSelector, any_of
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,8 @@ class LinkedInPortal(JobPortal):
         base_url="https://www.linkedin.com",
         max_applications_per_day=50,
         rate_limit_delay_seconds=(45, 90),
+        rate_limit=RateLimit(per_minute=4, burst=2),
+        cadence=Cadence(search_minutes=60, apply_minutes=30),  # New postings appear fast
         requires_login=True,
         supports_easy_apply=True,
         captcha_frequency="medium",
@@ -37,9 +43,44 @@ class LinkedInPortal(JobPortal):
             "phone_input": "input[type='tel']",
             "resume_upload": "input[type='file']",
             "success_modal": "div.artdeco-modal__content",
-        }
+        },
+        extraction=ExtractionSpec(
+            card_selector="li.jobs-search-results__list-item",
+            fields=fields(
+                title=FieldSpec("h3.base-search-card__title"),
+                company=FieldSpec("h4.base-search-card__subtitle"),
+                location=FieldSpec("span.job-search-card__location"),
+                url=FieldSpec("a.base-card__full-link", "href"),
+            ),
+            limit=25,
+        ),
+        resource_blocking=ResourceBlocking(
+            # LinkedIn's own ad and tracking beacons
+            block_url_patterns=DEFAULT_BLOCKED_URL_PATTERNS + (
+                r"px\.ads\.linkedin\.com",
+                r"linkedin\.com/li/track",
+            )
+        ),
+        waits={
+            "job_page": ForSelector("button.jobs-apply-button"),
+            "apply_dialog": any_of(
+                ForSelector("button[aria-label='Continue to next step']"),
+                ForSelector("button[aria-label='Review your application']"),
+                ForSelector("button[aria-label='Submit application']"),
+                ForSelector("text=Application submitted"),
+            ),
+            "submitted": any_of(
+                ForSelector("text=Application sent"),
+                ForSelector("text=Your application was submitted"),
+            ),
+            # "form_step" keeps the fixed delay: the Next button of the previous
+            # step is still on the page right after the click.
+        },
+        session_check=SessionCheck(auth_cookies=("li_at",), probe_url="https://www.linkedin.com/feed/"),
     )
 
+    prefetches_job_page = True
+
     def __init__(self, credentials: Optional[dict] = None):
         super().__init__(self.DEFAULT_CONFIG, credentials)
 
@@ -54,19 +95,19 @@ class LinkedInPortal(JobPortal):
 
     async def is_logged_in(self, context: BrowserContext) -> bool:
         """Check if logged into LinkedIn."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         try:
-            await page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded")
+            await self.goto(page, "https://www.linkedin.com/feed/", wait_until="domcontentloaded")
             # Check for feed or profile indicator
             return await page.query_selector("div.feed-identity-module") is not None
         except:
             return False
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def search_jobs(self, context: BrowserContext, query: JobQuery) -> List[JobListing]:
         """Search LinkedIn jobs with filters."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         jobs = []
 
         try:
@@ -76,20 +117,18 @@ class LinkedInPortal(JobPortal):
             url = f"https://www.linkedin.com/jobs/search?keywords={keywords}&location={location}&f_AL=true"
 
             logger.info(f"Searching LinkedIn: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)  # Let JS render
+            await self.goto(page, url, wait_until="domcontentloaded")
+            await self.wait_for_step(page, "results", 2)  # Let JS render
 
             # Scroll to load more jobs
             for _ in range(3):
                 await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(1)
+                await self.wait_for_step(page, "scroll", 1)
 
-            # Extract job cards
-            job_cards = await page.query_selector_all("li.jobs-search-results__list-item")
-
-            for card in job_cards[:25]:  # Limit to 25 per search
+            # Extract job cards (limit 25 per search) in one round trip
+            for card in await self.extract_cards(page):
                 try:
-                    job = await self._parse_job_card(card)
+                    job = self._parse_job_card(card)
                     if job:
                         jobs.append(job)
                 except Exception as e:
@@ -100,23 +139,18 @@ class LinkedInPortal(JobPortal):
             return jobs
 
         finally:
-            await page.close()
+            await self.release_page(page)
 
-    async def _parse_job_card(self, card) -> Optional[JobListing]:
-        """Parse a job card element into JobListing."""
+    def _parse_job_card(self, card: dict) -> Optional[JobListing]:
+        """Turn extracted card fields into a JobListing."""
         try:
-            title_elem = await card.query_selector("h3.base-search-card__title")
-            company_elem = await card.query_selector("h4.base-search-card__subtitle")
-            loc_elem = await card.query_selector("span.job-search-card__location")
-            link_elem = await card.query_selector("a.base-card__full-link")
-
-            if not title_elem or not link_elem:
+            title = card["title"]
+            url = card["url"]
+            if title is None or not url:
                 return None
 
-            title = await title_elem.inner_text()
-            company = await company_elem.inner_text() if company_elem else "Unknown"
-            location = await loc_elem.inner_text() if loc_elem else "Unknown"
-            url = await link_elem.get_attribute("href")
+            company = card["company"] if card["company"] is not None else "Unknown"
+            location = card["location"] if card["location"] is not None else "Unknown"
 
             # Generate stable job ID from URL
             job_id = hashlib.md5(url.encode()).hexdigest()[:12]
@@ -139,14 +173,13 @@ class LinkedInPortal(JobPortal):
         profile: CandidateProfile
     ) -> Tuple[ApplicationResult, Optional[str]]:
         """Apply to a job using LinkedIn Easy Apply."""
-        page = await context.new_page()
+        page = await self.acquire_job_page(context, job)
 
         try:
             logger.info(f"Applying to {job.title} at {job.company}")
 
             # Navigate to job
-            await page.goto(job.url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.load_job_page(page, job)
 
             # Click Easy Apply button
             easy_apply = await page.query_selector(self.config.selectors["easy_apply_button"])
@@ -154,7 +187,7 @@ class LinkedInPortal(JobPortal):
                 return ApplicationResult.SKIPPED, "Easy Apply not available"
 
             await easy_apply.click()
-            await asyncio.sleep(1)
+            await self.wait_for_step(page, "apply_dialog", 1)
 
             # Check for "Already applied" state
             if await page.query_selector("text=Application submitted"):
@@ -170,7 +203,7 @@ class LinkedInPortal(JobPortal):
                 if submit_btn:
                     # Final submission
                     await submit_btn.click()
-                    await asyncio.sleep(2)
+                    await self.wait_for_step(page, "submitted", 2)
 
                     # Verify success
                     success = await page.query_selector("text=Application sent") or \
@@ -185,7 +218,7 @@ class LinkedInPortal(JobPortal):
                 next_btn = await page.query_selector(self.config.selectors["next_button"])
                 if next_btn:
                     await next_btn.click()
-                    await asyncio.sleep(1.5)
+                    await self.wait_for_step(page, "form_step", 1.5)
                 else:
                     break
 
@@ -197,7 +230,7 @@ class LinkedInPortal(JobPortal):
             logger.error(f"Application error: {e}")
             return ApplicationResult.FAILURE, str(e)
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def _fill_application_step(self, page: Page, profile: CandidateProfile) -> None:
         """Fill form fields on current step."""
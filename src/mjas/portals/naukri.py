@@ -1,6 +1,5 @@
 """Naukri.com portal for India job market."""
 
-import asyncio
 import hashlib
 import logging
 from typing import List, Tuple, Optional
@@ -10,6 +9,9 @@ from mjas.portals.base import (
     JobPortal, PortalConfig, JobListing, JobQuery,
     CandidateProfile, ApplicationResult
 )
+from mjas.portals.extraction import ExtractionSpec, FieldSpec, fields
+from mjas.portals.session_check import SessionCheck
+from mjas.portals.waits import ForSelector, any_of
 
 logger = logging.getLogger(__name__)
 
@@ -30,15 +32,35 @@ class NaukriPortal(JobPortal):
             "login_button": "button[type='submit']",
             "search_keywords": "input[name='keyword']",
             "search_location": "input[name='location']",
-            "job_card": ".jobTuple",
-            "job_title": "a.title",
-            "job_company": "a.subTitle",
-            "job_location": ".location",
             "apply_button": "button[data-job-id]",
             "resume_upload": "input[type='file']",
-        }
+        },
+        extraction=ExtractionSpec(
+            card_selector=".jobTuple",
+            fields=fields(
+                title=FieldSpec("a.title"),
+                title_attr=FieldSpec("a.title", "title"),
+                company=FieldSpec("a.subTitle"),
+                location=FieldSpec(".location"),
+                href=FieldSpec("a.title", "href"),
+            ),
+            limit=20,
+        ),
+        waits={
+            "profile": ForSelector(".edit"),
+            "profile_edit": ForSelector(".close"),
+            "popup_closed": ForSelector(".close-icon", state="detached"),
+            "job_page": ForSelector("button[data-job-id]"),
+            "submitted": any_of(
+                ForSelector("text=Applied successfully"),
+                ForSelector("text=Application sent"),
+            ),
+        },
+        session_check=SessionCheck(probe_url="https://www.naukri.com/mnjuser/profile"),
     )
 
+    prefetches_job_page = True
+
     def __init__(self, credentials: Optional[dict] = None):
         super().__init__(self.DEFAULT_CONFIG, credentials)
 
@@ -53,28 +75,28 @@ class NaukriPortal(JobPortal):
 
     async def is_logged_in(self, context: BrowserContext) -> bool:
         """Check if logged in."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         try:
-            await page.goto("https://www.naukri.com/mnjuser/profile", wait_until="domcontentloaded")
+            await self.goto(page, "https://www.naukri.com/mnjuser/profile", wait_until="domcontentloaded")
             return await page.query_selector(".user-name") is not None
         except:
             return False
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def refresh_profile(self, context: BrowserContext) -> bool:
         """Refresh Naukri profile for better visibility."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         try:
             logger.info("Refreshing Naukri profile...")
-            await page.goto("https://www.naukri.com/mnjuser/profile", wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.goto(page, "https://www.naukri.com/mnjuser/profile", wait_until="domcontentloaded")
+            await self.wait_for_step(page, "profile", 2)
 
             # Click edit on any section to update "last active"
             edit_btn = await page.query_selector(".edit")
             if edit_btn:
                 await edit_btn.click()
-                await asyncio.sleep(1)
+                await self.wait_for_step(page, "profile_edit", 1)
 
                 # Close without saving - just need activity
                 close_btn = await page.query_selector(".close")
@@ -87,11 +109,11 @@ class NaukriPortal(JobPortal):
             logger.error(f"Failed to refresh Naukri profile: {e}")
             return False
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def search_jobs(self, context: BrowserContext, query: JobQuery) -> List[JobListing]:
         """Search Naukri jobs."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         jobs = []
 
         try:
@@ -100,23 +122,21 @@ class NaukriPortal(JobPortal):
             url = f"https://www.naukri.com/{keywords}-jobs-in-{location}"
 
             logger.info(f"Searching Naukri: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.goto(page, url, wait_until="domcontentloaded")
+            await self.wait_for_step(page, "results", 2)
 
             # Handle popup if present
             try:
                 close_popup = await page.query_selector(".close-icon")
                 if close_popup:
                     await close_popup.click()
-                    await asyncio.sleep(1)
+                    await self.wait_for_step(page, "popup_closed", 1)
             except:
                 pass
 
-            cards = await page.query_selector_all(self.config.selectors["job_card"])
-
-            for card in cards[:20]:
+            for card in await self.extract_cards(page):
                 try:
-                    job = await self._parse_job_card(card)
+                    job = self._parse_job_card(card)
                     if job:
                         jobs.append(job)
                 except Exception as e:
@@ -126,23 +146,18 @@ class NaukriPortal(JobPortal):
             logger.info(f"Found {len(jobs)} jobs on Naukri")
             return jobs
         finally:
-            await page.close()
+            await self.release_page(page)
 
-    async def _parse_job_card(self, card) -> Optional[JobListing]:
-        """Parse job card."""
+    def _parse_job_card(self, card: dict) -> Optional[JobListing]:
+        """Turn extracted card fields into a JobListing."""
         try:
-            title_elem = await card.query_selector(self.config.selectors["job_title"])
-            company_elem = await card.query_selector(self.config.selectors["job_company"])
-            loc_elem = await card.query_selector(self.config.selectors["job_location"])
-            link_elem = await card.query_selector("a.title")
-
-            if not title_elem:
+            if card["title"] is None:
                 return None
 
-            title = await title_elem.get_attribute("title") or await title_elem.inner_text()
-            company = await company_elem.inner_text() if company_elem else "Company"
-            location = await loc_elem.inner_text() if loc_elem else "India"
-            url = await link_elem.get_attribute("href") if link_elem else ""
+            title = card["title_attr"] or card["title"]
+            company = card["company"] if card["company"] is not None else "Company"
+            location = card["location"] if card["location"] is not None else "India"
+            url = card["href"] or ""
 
             job_id = hashlib.md5(url.encode()).hexdigest()[:12] if url else hashlib.md5(title.encode()).hexdigest()[:12]
 
@@ -164,13 +179,12 @@ class NaukriPortal(JobPortal):
         profile: CandidateProfile
     ) -> Tuple[ApplicationResult, Optional[str]]:
         """Apply on Naukri."""
-        page = await context.new_page()
+        page = await self.acquire_job_page(context, job)
 
         try:
             logger.info(f"Applying to {job.title} at {job.company} on Naukri")
 
-            await page.goto(job.url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.load_job_page(page, job)
 
             # Find and click apply button
             apply_btn = await page.query_selector(self.config.selectors["apply_button"])
@@ -178,7 +192,7 @@ class NaukriPortal(JobPortal):
                 return ApplicationResult.SKIPPED, "Apply button not found"
 
             await apply_btn.click()
-            await asyncio.sleep(2)
+            await self.wait_for_step(page, "submitted", 2)
 
             # Check for success message
             success = await page.query_selector("text=Applied successfully") or \
@@ -193,4 +207,4 @@ class NaukriPortal(JobPortal):
             logger.error(f"Naukri application error: {e}")
             return ApplicationResult.FAILURE, str(e)
         finally:
-            await page.close()
+            await self.release_page(page)
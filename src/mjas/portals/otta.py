@@ -1,6 +1,5 @@
 """Otta job portal - curated tech jobs."""
 
-import asyncio
 import hashlib
 import logging
 from typing import List, Tuple, Optional
@@ -10,6 +9,7 @@ from mjas.portals.base import (
     JobPortal, PortalConfig, JobListing, JobQuery,
     CandidateProfile, ApplicationResult
 )
+from mjas.portals.extraction import ExtractionSpec, FieldSpec, fields
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +26,13 @@ class OttaPortal(JobPortal):
         supports_easy_apply=False,  # Uses Otta's application system
         selectors={
             "search_keywords": "input[type='search']",
-            "job_card": "[data-testid='job-card']",
             "apply_button": "button[data-testid='apply-button']",
-        }
+        },
+        extraction=ExtractionSpec(
+            card_selector="[data-testid='job-card']",
+            fields=fields(title=FieldSpec("h3")),
+            limit=15,  # Otta has fewer but higher quality listings
+        ),
     )
 
     def __init__(self, credentials: Optional[dict] = None):
@@ -45,9 +49,9 @@ class OttaPortal(JobPortal):
 
     async def is_logged_in(self, context: BrowserContext) -> bool:
         """Check if logged in to Otta."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         try:
-            await page.goto("https://app.otta.com/jobs", wait_until="domcontentloaded")
+            await self.goto(page, "https://app.otta.com/jobs", wait_until="domcontentloaded")
             # Check for jobs page indicator or user menu
             logged_in_indicator = await page.query_selector("[data-testid='user-menu']") or \
                                  await page.query_selector(".user-avatar") or \
@@ -57,11 +61,11 @@ class OttaPortal(JobPortal):
         except:
             return False
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def search_jobs(self, context: BrowserContext, query: JobQuery) -> List[JobListing]:
         """Search Otta jobs."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         jobs = []
 
         try:
@@ -69,16 +73,13 @@ class OttaPortal(JobPortal):
             url = f"https://app.otta.com/jobs?search={query.keywords.replace(' ', '+')}"
 
             logger.info(f"Searching Otta: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.goto(page, url, wait_until="domcontentloaded")
+            await self.wait_for_step(page, "results", 2)
 
-            cards = await page.query_selector_all(self.config.selectors["job_card"])
-
-            for card in cards[:15]:  # Otta has fewer but higher quality listings
+            for card in await self.extract_cards(page):
                 try:
-                    title_elem = await card.query_selector("h3")
-                    if title_elem:
-                        title = await title_elem.inner_text()
+                    if card["title"] is not None:
+                        title = card["title"]
                         job_id = hashlib.md5(title.encode()).hexdigest()[:12]
 
                         jobs.append(JobListing(
@@ -95,7 +96,7 @@ class OttaPortal(JobPortal):
             logger.info(f"Found {len(jobs)} jobs on Otta")
             return jobs
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def apply_to_job(
         self,
@@ -0,0 +1,100 @@
+"""Reusable pages for a browser context."""
+
+import asyncio
+import logging
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class PagePool:
+    """Hands out warm pages from one ``BrowserContext``.
+
+    Opening and tearing down a page per search or application costs a
+    renderer round trip each time; pooled pages are reset to
+    ``about:blank`` instead and handed to the next caller. At most
+    ``max_pages`` pages are checked out at once (further callers wait), and
+    a page is closed rather than reused after ``max_uses`` uses so leaks in
+    long-lived renderers stay bounded.
+    """
+
+    RESET_URL = "about:blank"
+
+    def __init__(self, context: Any, max_pages: int = 4, max_uses: int = 25):
+        self.context = context
+        self.max_pages = max_pages
+        self.max_uses = max_uses
+        self._idle: List[Any] = []
+        self._uses: Dict[Any, int] = {}
+        self._slots = asyncio.Semaphore(max_pages)
+        self._closed = False
+        self.created = 0
+        self.reused = 0
+        self.recycled = 0
+
+    async def acquire(self) -> Any:
+        """Take an idle page, or open one if none is available."""
+        if self._closed:
+            raise RuntimeError("Page pool is closed")
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                page = self._idle.pop()
+                if not page.is_closed():
+                    self.reused += 1
+                    return page
+                self._uses.pop(page, None)
+
+            page = await self.context.new_page()
+            # Dismiss stray alerts/confirms so they can never wedge a reused page
+            page.on("dialog", lambda dialog: asyncio.ensure_future(dialog.dismiss()))
+            self._uses[page] = 0
+            self.created += 1
+            return page
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, page: Any, discard: bool = False) -> None:
+        """Return a page, resetting it for reuse or closing it.
+
+        Args:
+            page: A page obtained from :meth:`acquire`.
+            discard: Close the page instead of reusing it, e.g. after an
+                error left it in an unknown state.
+        """
+        try:
+            uses = self._uses.get(page, 0) + 1
+            self._uses[page] = uses
+            if page.is_closed():
+                self._uses.pop(page, None)
+                return
+
+            if discard or self._closed or uses >= self.max_uses:
+                await self._close_page(page)
+                self.recycled += 1
+                return
+
+            try:
+                await page.goto(self.RESET_URL)
+            except Exception as e:
+                logger.debug(f"Page reset failed, closing it: {e}")
+                await self._close_page(page)
+                self.recycled += 1
+                return
+            self._idle.append(page)
+        finally:
+            self._slots.release()
+
+    async def _close_page(self, page: Any) -> None:
+        self._uses.pop(page, None)
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug(f"Error closing page: {e}")
+
+    async def close(self) -> None:
+        """Close idle pages; pages still checked out close on release."""
+        self._closed = True
+        while self._idle:
+            await self._close_page(self._idle.pop())
@@ -0,0 +1,92 @@
+"""Per-portal navigation pacing with a token bucket.
+
+The random pause between applications only spaces out applications from
+one worker; searches ran unpaced, so a cycle could open ten result pages
+on one portal at once. Every navigation now goes through
+:meth:`JobPortal.goto <mjas.portals.base.JobPortal.goto>`, which takes a
+token from the portal's :class:`TokenBucket` first. ``burst`` navigations
+can happen back to back; after that they are paced at ``per_minute``.
+
+The bucket also answers "how long until this portal may navigate again",
+which the task scheduler uses to hand free slots to portals that have
+tokens instead of ones that would only sit waiting for them.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """How fast a portal may be navigated."""
+    per_minute: float = 6.0  # Sustained page loads per minute
+    burst: int = 3  # Page loads allowed back to back after a quiet spell
+
+
+class TokenBucket:
+    """Token bucket holding up to ``burst`` tokens, refilled at ``rate`` per second.
+
+    Waiters in :meth:`acquire` are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.rate = max(rate, 1e-6)
+        self.burst = max(1, burst)
+        self.clock = clock
+        self.waited_seconds = 0.0  # Total time acquire() spent waiting for tokens
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_limit(cls, limit: RateLimit, clock: Callable[[], float] = time.monotonic) -> "TokenBucket":
+        return cls(limit.per_minute / 60.0, limit.burst, clock)
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def available(self) -> float:
+        """Tokens in the bucket right now."""
+        self._refill()
+        return self._tokens
+
+    def delay(self, tokens: float = 1.0) -> float:
+        """Seconds until ``tokens`` are available (0 if they are now)."""
+        self._refill()
+        return max(0.0, (tokens - self._tokens) / self.rate)
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` if available, without waiting."""
+        if self._lock.locked() or self.delay(tokens) > 0:
+            return False
+        self._tokens -= tokens
+        return True
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Wait for and take ``tokens``.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        started = self.clock()
+        async with self._lock:
+            while (wait := self.delay(tokens)) > 0:
+                await asyncio.sleep(wait)
+            self._tokens -= tokens
+        waited = self.clock() - started
+        self.waited_seconds += waited
+        return waited
+
+    def take_waited(self) -> float:
+        """Return and reset :attr:`waited_seconds`."""
+        waited, self.waited_seconds = self.waited_seconds, 0.0
+        return waited
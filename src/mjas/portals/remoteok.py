@@ -1,6 +1,5 @@
 """RemoteOK job portal - remote-only jobs."""
 
-import asyncio
 import hashlib
 import logging
 from typing import List, Tuple, Optional
@@ -10,6 +9,8 @@ from mjas.portals.base import (
     JobPortal, PortalConfig, JobListing, JobQuery,
     CandidateProfile, ApplicationResult
 )
+from mjas.portals.extraction import ExtractionSpec, FieldSpec, fields
+from mjas.portals.rate_limit import RateLimit
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +23,18 @@ class RemoteOKPortal(JobPortal):
         base_url="https://remoteok.com",
         max_applications_per_day=25,
         rate_limit_delay_seconds=(30, 60),
+        rate_limit=RateLimit(per_minute=12, burst=5),
         requires_login=False,  # No login needed!
         supports_easy_apply=False,
-        selectors={
-            "job_row": ".job",
-            "job_title": "h2 a",
-            "job_company": "h3",
-        }
+        extraction=ExtractionSpec(
+            card_selector=".job",
+            fields=fields(
+                title=FieldSpec("h2 a"),
+                href=FieldSpec("h2 a", "href"),
+                company=FieldSpec("h3"),
+            ),
+            limit=20,
+        ),
     )
 
     def __init__(self, credentials: Optional[dict] = None):
@@ -44,7 +50,7 @@ class RemoteOKPortal(JobPortal):
 
     async def search_jobs(self, context: BrowserContext, query: JobQuery) -> List[JobListing]:
         """Search RemoteOK jobs."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         jobs = []
 
         try:
@@ -53,20 +59,15 @@ class RemoteOKPortal(JobPortal):
             url = f"https://remoteok.com/remote-{tag}-jobs"
 
             logger.info(f"Searching RemoteOK: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.goto(page, url, wait_until="domcontentloaded")
+            await self.wait_for_step(page, "results", 2)
 
-            rows = await page.query_selector_all(self.config.selectors["job_row"])
-
-            for row in rows[:20]:
+            for row in await self.extract_cards(page):
                 try:
-                    title_elem = await row.query_selector(self.config.selectors["job_title"])
-                    company_elem = await row.query_selector(self.config.selectors["job_company"])
-
-                    if title_elem:
-                        title = await title_elem.inner_text()
-                        company = await company_elem.inner_text() if company_elem else "Company"
-                        href = await title_elem.get_attribute("href")
+                    if row["title"] is not None:
+                        title = row["title"]
+                        company = row["company"] if row["company"] is not None else "Company"
+                        href = row["href"]
 
                         job_id = hashlib.md5((title + company).encode()).hexdigest()[:12]
 
@@ -84,7 +85,7 @@ class RemoteOKPortal(JobPortal):
             logger.info(f"Found {len(jobs)} jobs on RemoteOK")
             return jobs
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def apply_to_job(
         self,
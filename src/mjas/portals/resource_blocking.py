@@ -0,0 +1,149 @@
+"""Request routing that drops resources the scrapers never read.
+
+Search pages pull in full-size images, web fonts, video and third-party
+trackers; none of it affects the DOM we parse. A :class:`ResourceBlocker`
+installed on a browser context aborts those requests before they leave
+the machine and keeps a running estimate of the bytes that saved.
+"""
+
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional, Pattern, Set, Tuple
+
+DEFAULT_BLOCKED_TYPES: Tuple[str, ...] = ("image", "font", "media")
+
+DEFAULT_BLOCKED_URL_PATTERNS: Tuple[str, ...] = (
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"doubleclick\.net",
+    r"connect\.facebook\.net",
+    r"hotjar\.com",
+    r"segment\.(io|com)",
+    r"scorecardresearch\.com",
+    r"newrelic\.com|nr-data\.net",
+    r"clarity\.ms",
+)
+
+# Typical transfer sizes of a blocked request by Playwright resource type.
+# Aborted requests never report a size, so savings are estimated from these.
+ESTIMATED_BYTES: Dict[str, int] = {
+    "image": 45_000,
+    "font": 35_000,
+    "media": 400_000,
+    "script": 60_000,
+    "stylesheet": 25_000,
+    "xhr": 2_000,
+    "fetch": 2_000,
+}
+DEFAULT_ESTIMATED_BYTES = 5_000
+
+# Set inside ResourceBlocker.searching(); task-local, so a concurrent
+# application on the same context is not mistaken for part of the search
+_searching: ContextVar[bool] = ContextVar("mjas_resource_blocking_searching", default=False)
+
+
+@dataclass(frozen=True)
+class ResourceBlocking:
+    """Which requests a portal's pages may skip.
+
+    A request is blocked when its resource type is in ``block_types`` or
+    its URL matches one of ``block_url_patterns`` (regular expressions),
+    unless the URL matches one of ``allow_url_patterns``.
+    """
+    enabled: bool = True
+    block_types: Tuple[str, ...] = DEFAULT_BLOCKED_TYPES
+    block_url_patterns: Tuple[str, ...] = DEFAULT_BLOCKED_URL_PATTERNS
+    allow_url_patterns: Tuple[str, ...] = ()
+    during_apply: bool = False  # Application forms may need images, e.g. captchas
+    _block_re: Pattern = field(init=False, repr=False, compare=False)
+    _allow_re: Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_block_re", _compile(self.block_url_patterns))
+        object.__setattr__(self, "_allow_re", _compile(self.allow_url_patterns))
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        if not self.enabled or self._allow_re.search(url):
+            return False
+        return resource_type in self.block_types or bool(self._block_re.search(url))
+
+
+def _compile(patterns: Tuple[str, ...]) -> Pattern:
+    # An empty alternation would match everything; use a never-matching pattern instead
+    return re.compile("|".join(f"(?:{p})" for p in patterns) if patterns else r"(?!x)x")
+
+
+class ResourceBlocker:
+    """Installs a :class:`ResourceBlocking` policy on a browser context.
+
+    The route covers the whole context, but blocking only applies to
+    requests from search pages: pages the portal acquires inside
+    :meth:`searching` (see :meth:`JobPortal.acquire_page
+    <mjas.portals.base.JobPortal.acquire_page>`). Pages of an application
+    running alongside are left alone unless the policy sets ``during_apply``.
+    """
+
+    def __init__(self, rules: ResourceBlocking):
+        self.rules = rules
+        self.search_pages: Set[Any] = set()
+        self.blocked_requests = 0
+        self.bytes_saved = 0
+        self.blocked_by_type: Dict[str, int] = {}
+
+    async def install(self, context: Any) -> None:
+        if self.rules.enabled:
+            await context.route("**/*", self._handle)
+
+    @contextmanager
+    def searching(self) -> Iterator[None]:
+        """Mark the current task as searching for the duration of the block."""
+        token = _searching.set(True)
+        try:
+            yield
+        finally:
+            _searching.reset(token)
+
+    def track_page(self, page: Any) -> None:
+        """Block on ``page`` if it was acquired by a search in progress."""
+        if _searching.get():
+            self.search_pages.add(page)
+
+    def untrack_page(self, page: Any) -> None:
+        """Stop blocking on ``page``, e.g. before it goes back to the page pool."""
+        self.search_pages.discard(page)
+
+    async def _handle(self, route: Any) -> None:
+        request = route.request
+        blocking = self.rules.during_apply or _request_page(request) in self.search_pages
+        if blocking and self.rules.should_block(request.url, request.resource_type):
+            self.blocked_requests += 1
+            self.bytes_saved += ESTIMATED_BYTES.get(request.resource_type, DEFAULT_ESTIMATED_BYTES)
+            self.blocked_by_type[request.resource_type] = (
+                self.blocked_by_type.get(request.resource_type, 0) + 1
+            )
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def take_stats(self) -> Dict[str, Any]:
+        """Return counters accumulated since the last call and reset them."""
+        stats = {
+            "blocked_requests": self.blocked_requests,
+            "bytes_saved": self.bytes_saved,
+            "blocked_by_type": dict(self.blocked_by_type),
+        }
+        self.blocked_requests = 0
+        self.bytes_saved = 0
+        self.blocked_by_type.clear()
+        return stats
+
+
+
+def _request_page(request: Any) -> Optional[Any]:
+    # Service worker requests have no frame, and so no page
+    try:
+        return request.frame.page
+    except Exception:
+        return None
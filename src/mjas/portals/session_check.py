@@ -0,0 +1,74 @@
+"""Lightweight session validity checks.
+
+``JobPortal.is_logged_in`` renders a full authenticated page to look for
+one selector. A :class:`SessionCheck` lets a portal describe cheaper
+evidence first: which cookies a logged-in session carries, and a URL that
+answers with a plain HTTP redirect to the login page when the session is
+gone. Fetching that URL through ``context.request`` shares the context's
+cookies but downloads only the document, with no rendering or subresources.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+LOGIN_URL_MARKERS: Tuple[str, ...] = ("login", "signin", "sign-in", "authwall")
+
+
+@dataclass(frozen=True)
+class SessionCheck:
+    """Cheap signals that a portal session is (in)valid."""
+    auth_cookies: Tuple[str, ...] = ()  # All must be present and unexpired
+    probe_url: Optional[str] = None  # Redirects to login when logged out (server side, not JS)
+    login_markers: Tuple[str, ...] = LOGIN_URL_MARKERS
+    timeout_seconds: float = 10.0
+
+
+def auth_cookies_valid(
+    storage_state: Dict[str, Any],
+    cookie_names: Iterable[str],
+    now: Optional[float] = None
+) -> bool:
+    """Check that every named cookie in a storage state is present and unexpired.
+
+    Session cookies (``expires`` of -1) count as unexpired.
+    """
+    now = time.time() if now is None else now
+    cookies = {c.get("name"): c for c in storage_state.get("cookies", [])}
+    for name in cookie_names:
+        cookie = cookies.get(name)
+        if cookie is None:
+            return False
+        expires = cookie.get("expires", -1)
+        if expires is not None and 0 <= expires <= now:
+            return False
+    return True
+
+
+async def probe_session(context: Any, check: SessionCheck) -> Optional[bool]:
+    """Fetch ``check.probe_url`` without following redirects.
+
+    Returns True on a 2xx answer, False on 401/403 or a redirect to a
+    login page, and None when the answer proves nothing either way (other
+    redirects, server errors, network failures).
+    """
+    try:
+        response = await context.request.get(
+            check.probe_url, max_redirects=0, timeout=check.timeout_seconds * 1000
+        )
+    except Exception:
+        return None
+
+    try:
+        status = response.status
+        if 200 <= status < 300:
+            return True
+        if status in (401, 403):
+            return False
+        if 300 <= status < 400:
+            location = response.headers.get("location", "").lower()
+            if any(marker in location for marker in check.login_markers):
+                return False
+        return None
+    finally:
+        await response.dispose()
@@ -1,6 +1,5 @@
 """SimplyHired job portal implementation."""
 
-import asyncio
 import hashlib
 import logging
 from typing import List, Tuple, Optional
@@ -10,6 +9,8 @@ from mjas.portals.base import (
     JobPortal, PortalConfig, JobListing, JobQuery,
     CandidateProfile, ApplicationResult
 )
+from mjas.portals.extraction import ExtractionSpec, FieldSpec, fields
+from mjas.portals.rate_limit import RateLimit
 
 logger = logging.getLogger(__name__)
 
@@ -22,15 +23,22 @@ class SimplyHiredPortal(JobPortal):
         base_url="https://www.simplyhired.com",
         max_applications_per_day=25,
         rate_limit_delay_seconds=(35, 70),
+        rate_limit=RateLimit(per_minute=12, burst=5),
         requires_login=False,
         supports_easy_apply=False,
         selectors={
             "search_keywords": "input[name='q']",
             "search_location": "input[name='l']",
-            "job_card": ".SerpJob",
-            "job_title": "a.SerpJob-link",
-            "job_company": ".SerpJob-company",
-        }
+        },
+        extraction=ExtractionSpec(
+            card_selector=".SerpJob",
+            fields=fields(
+                title=FieldSpec("a.SerpJob-link"),
+                href=FieldSpec("a.SerpJob-link", "href"),
+                company=FieldSpec(".SerpJob-company"),
+            ),
+            limit=20,
+        ),
     )
 
     def __init__(self, credentials: Optional[dict] = None):
@@ -46,7 +54,7 @@ class SimplyHiredPortal(JobPortal):
 
     async def search_jobs(self, context: BrowserContext, query: JobQuery) -> List[JobListing]:
         """Search SimplyHired jobs."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         jobs = []
 
         try:
@@ -55,20 +63,15 @@ class SimplyHiredPortal(JobPortal):
             url = f"https://www.simplyhired.com/search?q={keywords}&l={location}"
 
             logger.info(f"Searching SimplyHired: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.goto(page, url, wait_until="domcontentloaded")
+            await self.wait_for_step(page, "results", 2)
 
-            cards = await page.query_selector_all(self.config.selectors["job_card"])
-
-            for card in cards[:20]:
+            for card in await self.extract_cards(page):
                 try:
-                    title_elem = await card.query_selector(self.config.selectors["job_title"])
-                    company_elem = await card.query_selector(self.config.selectors["job_company"])
-
-                    if title_elem:
-                        title = await title_elem.inner_text()
-                        company = await company_elem.inner_text() if company_elem else ""
-                        href = await title_elem.get_attribute("href")
+                    if card["title"] is not None:
+                        title = card["title"]
+                        company = card["company"] if card["company"] is not None else ""
+                        href = card["href"]
 
                         job_id = hashlib.md5((title + company).encode()).hexdigest()[:12]
 
@@ -86,7 +89,7 @@ class SimplyHiredPortal(JobPortal):
             logger.info(f"Found {len(jobs)} jobs on SimplyHired")
             return jobs
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def apply_to_job(
         self,
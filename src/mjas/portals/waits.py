@@ -0,0 +1,165 @@
+"""Event-driven waits for portal flows.
+
+Portal steps used to pause for a fixed ``asyncio.sleep`` after every
+navigation and click, which is both too long when the page is already
+ready and too short when it is slow. A :class:`WaitStrategy` waits for the
+condition that actually matters (a selector, network idle, result cards
+that stopped growing) and returns as soon as it holds. The old fixed
+delays survive only as the timeout, so a step never waits longer than it
+used to.
+
+:class:`StepTimings` records how long each step really waited, so the
+wall-clock saved over the fixed delays can be reported per cycle.
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+
+class WaitStrategy(ABC):
+    """Something a page can be waited for.
+
+    :meth:`wait` returns ``True`` once the condition holds and ``False``
+    if ``timeout`` seconds pass first; it never raises on timeout.
+    """
+
+    @abstractmethod
+    async def wait(self, page: Any, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for the condition on ``page``."""
+        pass
+
+
+@dataclass(frozen=True)
+class Sleep(WaitStrategy):
+    """The fixed delay, for steps with nothing observable to wait for."""
+
+    async def wait(self, page: Any, timeout: float) -> bool:
+        await asyncio.sleep(timeout)
+        return False
+
+
+@dataclass(frozen=True)
+class ForSelector(WaitStrategy):
+    """Wait until ``selector`` reaches ``state`` (attached, visible, hidden, detached)."""
+    selector: str
+    state: str = "attached"
+
+    async def wait(self, page: Any, timeout: float) -> bool:
+        try:
+            await page.wait_for_selector(self.selector, state=self.state, timeout=timeout * 1000)
+            return True
+        except PlaywrightTimeout:
+            return False
+
+
+@dataclass(frozen=True)
+class NetworkIdle(WaitStrategy):
+    """Wait for the network to go quiet, capped at the step timeout.
+
+    Only meaningful right after a navigation; pages with long-polling or
+    analytics beacons never go idle and simply hit the cap.
+    """
+
+    async def wait(self, page: Any, timeout: float) -> bool:
+        try:
+            await page.wait_for_load_state("networkidle", timeout=timeout * 1000)
+            return True
+        except PlaywrightTimeout:
+            return False
+
+
+@dataclass(frozen=True)
+class CardCountStable(WaitStrategy):
+    """Wait until the number of ``selector`` matches stops growing.
+
+    The count is polled every ``interval`` seconds and considered stable
+    after ``settle_polls`` consecutive polls without change, e.g. once an
+    infinite-scroll page has finished appending results. Settling only
+    starts once the count has risen above its initial value; a count that
+    never grows (the scroll loaded nothing yet) runs into the timeout.
+    """
+    selector: str
+    interval: float = 0.2
+    settle_polls: int = 2
+
+    async def wait(self, page: Any, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        initial = last = await self._count(page)
+        unchanged = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(self.interval, remaining))
+            count = await self._count(page)
+            if count == last and count > initial:
+                unchanged += 1
+                if unchanged >= self.settle_polls:
+                    return True
+            else:
+                last, unchanged = count, 0
+
+    async def _count(self, page: Any) -> int:
+        return await page.evaluate(
+            "(selector) => document.querySelectorAll(selector).length", self.selector
+        )
+
+
+@dataclass(frozen=True)
+class AnyOf(WaitStrategy):
+    """Wait for whichever of several strategies is met first."""
+    strategies: Tuple[WaitStrategy, ...]
+
+    async def wait(self, page: Any, timeout: float) -> bool:
+        tasks = [asyncio.ensure_future(s.wait(page, timeout)) for s in self.strategies]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                if await next_done:
+                    return True
+            return False
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def any_of(*strategies: WaitStrategy) -> AnyOf:
+    """Positional shorthand for :class:`AnyOf`."""
+    return AnyOf(tuple(strategies))
+
+
+class StepTimings:
+    """Wall-clock spent per portal step, compared with the fixed delays."""
+
+    def __init__(self):
+        self._steps: Dict[str, Dict[str, float]] = {}
+
+    def record(self, step: str, elapsed: float, fallback: float, met: bool) -> None:
+        stats = self._steps.setdefault(step, {
+            "count": 0, "met": 0, "elapsed": 0.0, "fallback": 0.0,
+        })
+        stats["count"] += 1
+        stats["met"] += int(met)
+        stats["elapsed"] += elapsed
+        stats["fallback"] += fallback
+
+    @property
+    def seconds_saved(self) -> float:
+        return sum(max(0.0, s["fallback"] - s["elapsed"]) for s in self._steps.values())
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-step totals, with ``saved`` seconds versus the fixed delays."""
+        return {
+            step: {**stats, "saved": max(0.0, stats["fallback"] - stats["elapsed"])}
+            for step, stats in self._steps.items()
+        }
+
+    def take(self) -> Dict[str, Dict[str, float]]:
+        """Return :meth:`summary` and reset the counters."""
+        summary = self.summary()
+        self._steps.clear()
+        return summary
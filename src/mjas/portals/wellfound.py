@@ -1,6 +1,5 @@
 """Wellfound (formerly AngelList) job portal implementation."""
 
-import asyncio
 import hashlib
 import logging
 from typing import List, Tuple, Optional
@@ -10,6 +9,8 @@ from mjas.portals.base import (
     JobPortal, PortalConfig, JobListing, JobQuery,
     CandidateProfile, ApplicationResult
 )
+from mjas.portals.extraction import ExtractionSpec, FieldSpec, fields
+from mjas.portals.waits import ForSelector
 
 logger = logging.getLogger(__name__)
 
@@ -29,14 +30,27 @@ class WellfoundPortal(JobPortal):
             "login_password": "input[type='password']",
             "login_button": "button[type='submit']",
             "search_keywords": "input[name='query']",
-            "job_card": "[data-test='job-listing']",
-            "job_title": "h2",
-            "job_company": "a[href*='company']",
             "apply_button": "button[data-test='apply-button']",
             "submit_button": "button[type='submit']",
-        }
+        },
+        extraction=ExtractionSpec(
+            card_selector="[data-test='job-listing']",
+            fields=fields(
+                title=FieldSpec("h2"),
+                company=FieldSpec("a[href*='company']"),
+                href=FieldSpec("a", "href"),
+            ),
+            limit=15,  # Wellfound has fewer jobs but higher quality
+        ),
+        waits={
+            "job_page": ForSelector("button[data-test='apply-button']"),
+            "apply_dialog": ForSelector("textarea[name='note']"),
+            # "submitted" keeps the fixed delay: there is no confirmation to wait for
+        },
     )
 
+    prefetches_job_page = True
+
     def __init__(self, credentials: Optional[dict] = None):
         super().__init__(self.DEFAULT_CONFIG, credentials)
 
@@ -51,18 +65,18 @@ class WellfoundPortal(JobPortal):
 
     async def is_logged_in(self, context: BrowserContext) -> bool:
         """Check if logged in."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         try:
-            await page.goto("https://wellfound.com/jobs", wait_until="domcontentloaded")
+            await self.goto(page, "https://wellfound.com/jobs", wait_until="domcontentloaded")
             return await page.query_selector("[data-test='user-menu']") is not None
         except:
             return False
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def search_jobs(self, context: BrowserContext, query: JobQuery) -> List[JobListing]:
         """Search Wellfound jobs."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         jobs = []
 
         try:
@@ -70,19 +84,17 @@ class WellfoundPortal(JobPortal):
             url = f"https://wellfound.com/jobs?q={keywords}&remote=true"
 
             logger.info(f"Searching Wellfound: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.goto(page, url, wait_until="domcontentloaded")
+            await self.wait_for_step(page, "results", 2)
 
             # Scroll to load more
             for _ in range(3):
                 await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(1)
-
-            cards = await page.query_selector_all(self.config.selectors["job_card"])
+                await self.wait_for_step(page, "scroll", 1)
 
-            for card in cards[:15]:  # Wellfound has fewer jobs but higher quality
+            for card in await self.extract_cards(page):
                 try:
-                    job = await self._parse_job_card(card)
+                    job = self._parse_job_card(card)
                     if job:
                         jobs.append(job)
                 except Exception as e:
@@ -92,21 +104,17 @@ class WellfoundPortal(JobPortal):
             logger.info(f"Found {len(jobs)} jobs on Wellfound")
             return jobs
         finally:
-            await page.close()
+            await self.release_page(page)
 
-    async def _parse_job_card(self, card) -> Optional[JobListing]:
-        """Parse job card."""
+    def _parse_job_card(self, card: dict) -> Optional[JobListing]:
+        """Turn extracted card fields into a JobListing."""
         try:
-            title_elem = await card.query_selector(self.config.selectors["job_title"])
-            company_elem = await card.query_selector(self.config.selectors["job_company"])
-            link_elem = await card.query_selector("a")
-
-            if not title_elem:
+            title = card["title"]
+            if title is None:
                 return None
 
-            title = await title_elem.inner_text()
-            company = await company_elem.inner_text() if company_elem else "Startup"
-            url = await link_elem.get_attribute("href") if link_elem else ""
+            company = card["company"] if card["company"] is not None else "Startup"
+            url = card["href"] or ""
 
             if url and not url.startswith("http"):
                 url = f"https://wellfound.com{url}"
@@ -131,13 +139,12 @@ class WellfoundPortal(JobPortal):
         profile: CandidateProfile
     ) -> Tuple[ApplicationResult, Optional[str]]:
         """Apply on Wellfound."""
-        page = await context.new_page()
+        page = await self.acquire_job_page(context, job)
 
         try:
             logger.info(f"Applying to {job.title} at {job.company} on Wellfound")
 
-            await page.goto(job.url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.load_job_page(page, job)
 
             # Click apply
             apply_btn = await page.query_selector(self.config.selectors["apply_button"])
@@ -145,7 +152,7 @@ class WellfoundPortal(JobPortal):
                 return ApplicationResult.SKIPPED, "Apply button not found"
 
             await apply_btn.click()
-            await asyncio.sleep(2)
+            await self.wait_for_step(page, "apply_dialog", 2)
 
             # Wellfound often has a note field
             note_field = await page.query_selector("textarea[name='note']")
@@ -157,7 +164,7 @@ class WellfoundPortal(JobPortal):
             submit_btn = await page.query_selector(self.config.selectors["submit_button"])
             if submit_btn:
                 await submit_btn.click()
-                await asyncio.sleep(2)
+                await self.wait_for_step(page, "submitted", 2)
 
                 return ApplicationResult.SUCCESS, None
 
@@ -167,4 +174,4 @@ class WellfoundPortal(JobPortal):
             logger.error(f"Wellfound application error: {e}")
             return ApplicationResult.FAILURE, str(e)
         finally:
-            await page.close()
+            await self.release_page(page)
@@ -1,6 +1,5 @@
 """We Work Remotely job portal."""
 
-import asyncio
 import hashlib
 import logging
 from typing import List, Tuple, Optional
@@ -10,6 +9,8 @@ from mjas.portals.base import (
     JobPortal, PortalConfig, JobListing, JobQuery,
     CandidateProfile, ApplicationResult
 )
+from mjas.portals.extraction import ExtractionSpec, FieldSpec, fields
+from mjas.portals.rate_limit import RateLimit
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +23,19 @@ class WeWorkRemotelyPortal(JobPortal):
         base_url="https://weworkremotely.com",
         max_applications_per_day=20,
         rate_limit_delay_seconds=(40, 80),
+        rate_limit=RateLimit(per_minute=12, burst=5),
         requires_login=False,  # No login required
         supports_easy_apply=False,
-        selectors={
-            "job_listing": ".job",
-            "job_title": "h4",
-            "job_company": ".company",
-        }
+        extraction=ExtractionSpec(
+            card_selector=".job",
+            fields=fields(
+                title=FieldSpec("h4"),
+                company=FieldSpec(".company"),
+                link=FieldSpec("a"),
+                href=FieldSpec("a", "href"),
+            ),
+            limit=15,
+        ),
     )
 
     def __init__(self, credentials: Optional[dict] = None):
@@ -44,7 +51,7 @@ class WeWorkRemotelyPortal(JobPortal):
 
     async def search_jobs(self, context: BrowserContext, query: JobQuery) -> List[JobListing]:
         """Search WWR jobs."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         jobs = []
 
         try:
@@ -58,21 +65,15 @@ class WeWorkRemotelyPortal(JobPortal):
             url = f"https://weworkremotely.com/remote-jobs/{category}"
 
             logger.info(f"Searching We Work Remotely: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.goto(page, url, wait_until="domcontentloaded")
+            await self.wait_for_step(page, "results", 2)
 
-            listings = await page.query_selector_all(self.config.selectors["job_listing"])
-
-            for listing in listings[:15]:
+            for listing in await self.extract_cards(page):
                 try:
-                    title_elem = await listing.query_selector(self.config.selectors["job_title"])
-                    company_elem = await listing.query_selector(self.config.selectors["job_company"])
-                    link_elem = await listing.query_selector("a")
-
-                    if title_elem and link_elem:
-                        title = await title_elem.inner_text()
-                        company = await company_elem.inner_text() if company_elem else "Company"
-                        href = await link_elem.get_attribute("href")
+                    if listing["title"] is not None and listing["link"] is not None:
+                        title = listing["title"]
+                        company = listing["company"] if listing["company"] is not None else "Company"
+                        href = listing["href"]
 
                         job_id = hashlib.md5((title + company).encode()).hexdigest()[:12]
 
@@ -90,7 +91,7 @@ class WeWorkRemotelyPortal(JobPortal):
             logger.info(f"Found {len(jobs)} jobs on We Work Remotely")
             return jobs
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def apply_to_job(
         self,
@@ -1,6 +1,5 @@
 """ZipRecruiter job portal implementation."""
 
-import asyncio
 import hashlib
 import logging
 from typing import List, Tuple, Optional
@@ -10,6 +9,8 @@ from mjas.portals.base import (
     JobPortal, PortalConfig, JobListing, JobQuery,
     CandidateProfile, ApplicationResult
 )
+from mjas.portals.extraction import ExtractionSpec, FieldSpec, fields
+from mjas.portals.session_check import SessionCheck
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +28,14 @@ class ZipRecruiterPortal(JobPortal):
         selectors={
             "search_keywords": "input[name='search']",
             "search_location": "input[name='location']",
-            "job_card": ".job_content",
             "apply_button": "button.one-click-apply",
-        }
+        },
+        extraction=ExtractionSpec(
+            card_selector=".job_content",
+            fields=fields(title=FieldSpec("h2")),
+            limit=20,
+        ),
+        session_check=SessionCheck(probe_url="https://www.ziprecruiter.com/candidate/dashboard"),
     )
 
     def __init__(self, credentials: Optional[dict] = None):
@@ -46,9 +52,9 @@ class ZipRecruiterPortal(JobPortal):
 
     async def is_logged_in(self, context: BrowserContext) -> bool:
         """Check if logged in to ZipRecruiter."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         try:
-            await page.goto("https://www.ziprecruiter.com/candidate/dashboard", wait_until="domcontentloaded")
+            await self.goto(page, "https://www.ziprecruiter.com/candidate/dashboard", wait_until="domcontentloaded")
             # Check for dashboard indicator (logged in) vs login page
             dashboard_indicator = await page.query_selector("[data-testid='dashboard-header']") or \
                                  await page.query_selector(".dashboard-container") or \
@@ -57,11 +63,11 @@ class ZipRecruiterPortal(JobPortal):
         except:
             return False
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def search_jobs(self, context: BrowserContext, query: JobQuery) -> List[JobListing]:
         """Search ZipRecruiter jobs."""
-        page = await context.new_page()
+        page = await self.acquire_page(context)
         jobs = []
 
         try:
@@ -69,16 +75,13 @@ class ZipRecruiterPortal(JobPortal):
             url = f"https://www.ziprecruiter.com/candidate/search?search={keywords}&location=Remote"
 
             logger.info(f"Searching ZipRecruiter: {url}")
-            await page.goto(url, wait_until="domcontentloaded")
-            await asyncio.sleep(2)
+            await self.goto(page, url, wait_until="domcontentloaded")
+            await self.wait_for_step(page, "results", 2)
 
-            cards = await page.query_selector_all(self.config.selectors["job_card"])
-
-            for card in cards[:20]:
+            for card in await self.extract_cards(page):
                 try:
-                    title_elem = await card.query_selector("h2")
-                    if title_elem:
-                        title = await title_elem.inner_text()
+                    if card["title"] is not None:
+                        title = card["title"]
                         job_id = hashlib.md5(title.encode()).hexdigest()[:12]
 
                         jobs.append(JobListing(
@@ -95,7 +98,7 @@ class ZipRecruiterPortal(JobPortal):
             logger.info(f"Found {len(jobs)} jobs on ZipRecruiter")
             return jobs
         finally:
-            await page.close()
+            await self.release_page(page)
 
     async def apply_to_job(
         self,
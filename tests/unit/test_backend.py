@@ -0,0 +1,181 @@
+"""Unit tests for queue backends, node assignment and the queue server."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from mjas.core.backend import BackendError, assign_portals, keep_alive
+from mjas.core.database import Database, JobStatus
+from mjas.core.queue_server import serve
+from mjas.core.remote_backend import RemoteBackend
+from mjas.portals.base import JobListing
+
+PORTALS = ["linkedin", "indeed", "wellfound", "naukri", "glassdoor", "dice"]
+
+
+def make_listing(job_id: str, portal: str = "linkedin") -> JobListing:
+    return JobListing(
+        job_id=job_id, title=f"AI Engineer {job_id}", company="TestCo", location="Remote",
+        url=f"https://example.com/jobs/{job_id}", portal=portal, score=80,
+    )
+
+
+@pytest.fixture
+async def local_db(tmp_path):
+    db = Database(tmp_path / "queue.db")
+    await db.init()
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+async def queue_url(local_db):
+    """A stand-in queue server on an ephemeral local port."""
+    runner = await serve(local_db, port=0, token="secret")
+    host, port = runner.addresses[0][:2]
+    yield f"http://{host}:{port}"
+    await runner.cleanup()
+
+
+@pytest.fixture
+async def remote_nodes(queue_url):
+    nodes = [RemoteBackend(queue_url, token="secret") for _ in range(2)]
+    for node in nodes:
+        await node.init()
+    yield nodes
+    for node in nodes:
+        await node.close()
+
+
+class TestAssignPortals:
+    """Tests for rendezvous portal assignment."""
+
+    def test_each_portal_has_one_owner(self):
+        """Test that every requested portal goes to exactly one node."""
+        assignment = assign_portals({"a": PORTALS, "b": PORTALS, "c": PORTALS[:3]})
+
+        owned = [portal for portals in assignment.values() for portal in portals]
+        assert sorted(owned) == sorted(PORTALS)
+
+    def test_only_nodes_that_asked(self):
+        """Test that a portal is never given to a node that cannot run it."""
+        assignment = assign_portals({"a": ["linkedin"], "b": ["indeed"]})
+        assert assignment == {"a": ["linkedin"], "b": ["indeed"]}
+
+    def test_leaving_node_only_moves_its_portals(self):
+        """Test that removing a node leaves the other nodes' portals in place."""
+        before = assign_portals({"a": PORTALS, "b": PORTALS, "c": PORTALS})
+        after = assign_portals({"a": PORTALS, "b": PORTALS})
+
+        for node in ("a", "b"):
+            assert set(before[node]) <= set(after[node])
+
+
+class TestNodeRegistry:
+    """Tests for node registration in the SQLite backend."""
+
+    async def test_stale_nodes_lose_their_portals(self, local_db):
+        """Test that only nodes seen within the TTL take part in assignment."""
+        await local_db.register_node("a", PORTALS)
+        await local_db.register_node("b", PORTALS)
+        assert set(await local_db.active_nodes()) == {"a", "b"}
+
+        later = datetime.now() + timedelta(seconds=600)
+        assert await local_db.active_nodes(ttl_seconds=300, now=later) == {}
+
+        await local_db.deregister_node("b")
+        assert await local_db.portal_assignment("a") == PORTALS
+        assert not await local_db.heartbeat_node("b")
+
+
+    async def test_keep_alive_reports_new_assignment(self, local_db):
+        """Test that the heartbeat hands a changed assignment to its callback."""
+        await local_db.register_node("a", PORTALS)
+        changes = []
+
+        async def on_change(portals):
+            changes.append(portals)
+
+        heartbeat = asyncio.create_task(
+            keep_alive(local_db, "a", PORTALS, interval_seconds=0.01, on_change=on_change)
+        )
+        await asyncio.sleep(0.05)
+        await local_db.register_node("b", PORTALS)
+        await asyncio.sleep(0.05)
+        heartbeat.cancel()
+
+        assert changes == [await local_db.portal_assignment("a")]
+        assert 0 < len(changes[0]) < len(PORTALS)
+
+
+    async def test_keep_alive_reports_change_made_before_it_started(self, local_db):
+        """Test that a change made while workers were starting is applied on the first beat."""
+        await local_db.register_node("a", PORTALS)
+        started_with = await local_db.portal_assignment("a")
+        await local_db.register_node("b", PORTALS)  # Joins during startup
+        changes = []
+
+        async def on_change(portals):
+            changes.append(portals)
+
+        heartbeat = asyncio.create_task(keep_alive(
+            local_db, "a", PORTALS, interval_seconds=0.01, on_change=on_change,
+            assigned=started_with
+        ))
+        await asyncio.sleep(0.05)
+        heartbeat.cancel()
+
+        assert changes == [await local_db.portal_assignment("a")]
+
+
+class TestRemoteBackend:
+    """Tests for nodes sharing a queue through the queue server."""
+
+    async def test_nodes_never_claim_the_same_job(self, local_db, remote_nodes):
+        """Test that concurrent claims from two nodes are disjoint and complete."""
+        first, second = remote_nodes
+        new_ids = await first.insert_jobs_bulk(
+            [make_listing(f"job-{i}") for i in range(20)], status=JobStatus.QUEUED
+        )
+        assert len(new_ids) == 20
+
+        claims = await asyncio.gather(*(
+            node.claim_jobs("linkedin", 3, lease_seconds=60, owner=f"node-{i % 2}")
+            for i, node in enumerate(remote_nodes * 5)
+        ))
+        claimed = [job["job_id"] for batch in claims for job in batch]
+        assert len(claimed) == len(set(claimed)) == 20
+
+        job_id = claimed[0]
+        await second.update_job_status(job_id, JobStatus.APPLIED)
+        await second.log_application_attempt(job_id, success=True, response_time_ms=900)
+        assert (await local_db.get_job(job_id))["status"] == "applied"
+        assert (await first.get_stats())["applied"] == 1
+
+    async def test_release_requires_the_lease_owner(self, remote_nodes):
+        """Test that one node cannot release another node's claim."""
+        first, second = remote_nodes
+        await first.insert_jobs_bulk([make_listing("job-1")], status=JobStatus.QUEUED)
+        [job] = await first.claim_jobs("linkedin", 1, lease_seconds=60, owner="node-a")
+
+        assert await second.release_jobs([job["job_id"]], owner="node-b") == 0
+        assert await first.release_jobs([job["job_id"]], owner="node-a") == 1
+
+    async def test_registration_and_assignment(self, remote_nodes):
+        """Test that nodes split the portals through the server."""
+        first, second = remote_nodes
+        await first.register_node("node-a", PORTALS)
+        await second.register_node("node-b", PORTALS)
+
+        mine = await first.portal_assignment("node-a")
+        theirs = await second.portal_assignment("node-b")
+        assert sorted(mine + theirs) == sorted(PORTALS)
+        assert await first.heartbeat_node("node-a")
+
+    async def test_wrong_token_is_rejected(self, queue_url):
+        """Test that the server refuses callers without the shared token."""
+        node = RemoteBackend(queue_url, token="wrong")
+        with pytest.raises(BackendError, match="unauthorized"):
+            await node.init()
+        await node.close()
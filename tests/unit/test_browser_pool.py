@@ -0,0 +1,96 @@
+"""Unit tests for the shared BrowserPool."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mjas.core.browser_pool import BrowserPool
+
+
+def fake_browser():
+    """A Browser stand-in whose contexts record their close handlers."""
+    browser = MagicMock()
+    browser.is_connected.return_value = True
+
+    async def new_context(**options):
+        context = MagicMock()
+        context.options = options
+        context.handlers = []
+        context.on.side_effect = lambda event, handler: context.handlers.append(handler)
+        return context
+
+    browser.new_context = AsyncMock(side_effect=new_context)
+    browser.close = AsyncMock()
+    return browser
+
+
+@pytest.fixture
+def playwright():
+    """Patch the Playwright driver with one that launches fake browsers."""
+    driver = MagicMock()
+    driver.chromium.launch = AsyncMock(side_effect=lambda **kwargs: fake_browser())
+    driver.stop = AsyncMock()
+    starter = MagicMock()
+    starter.return_value.start = AsyncMock(return_value=driver)
+    with patch("mjas.core.browser_pool.async_playwright", starter):
+        yield driver
+
+
+class TestBrowserPool:
+    """Tests for BrowserPool context placement."""
+
+    async def test_contexts_share_one_browser(self, playwright):
+        """Test that N contexts cost one driver and one browser launch."""
+        pool = BrowserPool(max_browsers=1)
+        contexts = [await pool.new_context(storage_state={"cookies": []}) for _ in range(6)]
+
+        assert playwright.chromium.launch.await_count == 1
+        assert pool.context_count == 6
+        assert contexts[0].options == {"storage_state": {"cookies": []}}
+        await pool.close()
+        playwright.stop.assert_awaited_once()
+
+    async def test_spreads_contexts_across_browsers(self, playwright):
+        """Test that a full browser triggers another launch up to the cap."""
+        pool = BrowserPool(max_browsers=2, contexts_per_browser=2)
+        for _ in range(5):
+            await pool.new_context()
+
+        assert pool.browser_count == 2
+        assert pool.context_count == 5
+
+    async def test_closed_contexts_free_capacity(self, playwright):
+        """Test that closing a context lets the next one reuse its browser."""
+        pool = BrowserPool(max_browsers=2, contexts_per_browser=1)
+        context = await pool.new_context()
+        for handler in context.handlers:
+            handler(context)
+
+        await pool.new_context()
+        assert pool.browser_count == 1
+        assert pool.context_count == 1
+
+    async def test_disconnected_browser_is_replaced(self, playwright):
+        """Test that a crashed browser frees its slot so a replacement launches."""
+        pool = BrowserPool(max_browsers=1)
+        await pool.new_context()
+        [crashed] = pool._browsers
+        crashed.is_connected.return_value = False
+
+        await pool.new_context()
+        assert playwright.chromium.launch.await_count == 2
+        assert pool.browser_count == 1
+        assert pool.context_count == 1
+        assert crashed not in pool._browsers
+
+    async def test_disconnected_event_drops_browser(self, playwright):
+        """Test that the disconnected event removes the browser and its contexts."""
+        pool = BrowserPool(max_browsers=1)
+        await pool.new_context()
+        [browser] = pool._browsers
+        [(event, handler)] = [call.args for call in browser.on.call_args_list]
+
+        assert event == "disconnected"
+        handler(browser)
+        assert pool.browser_count == 0
+        assert pool.context_count == 0
@@ -0,0 +1,205 @@
+"""Unit tests for per-portal cadence in continuous mode."""
+
+import asyncio
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mjas.core.cadence import CadenceScheduler, resolve_cadence
+from mjas.core.database import Database
+from mjas.core.session_manager import SessionManager
+from mjas.core.swarm import SwarmConfig, SwarmOrchestrator
+from mjas.portals.base import Cadence, CandidateProfile
+from mjas.portals.rate_limit import TokenBucket
+from mjas.portals.resource_blocking import ResourceBlocker, ResourceBlocking
+from mjas.portals.waits import StepTimings
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+@pytest.fixture
+async def temp_db(tmp_path):
+    db = Database(tmp_path / "test.db")
+    await db.init()
+    yield db
+    await db.close()
+
+
+def cadences(**minutes):
+    return {name: Cadence(m, m * 2, jitter=0.0) for name, m in minutes.items()}
+
+
+class TestCadenceScheduler:
+    """Tests for the due-time heap and its persistence."""
+
+    async def test_first_run_everything_is_due(self, temp_db):
+        """Test that portals with no saved schedule are due immediately."""
+        scheduler = CadenceScheduler(cadences(linkedin=60, indeed=120), temp_db)
+        await scheduler.load(now=NOW)
+
+        assert sorted(scheduler.pop_due(NOW)) == [
+            ("indeed", "apply"), ("indeed", "search"), ("linkedin", "apply"), ("linkedin", "search")
+        ]
+        assert scheduler.next_due() is None
+
+    async def test_restart_resumes_saved_schedule(self, temp_db):
+        """Test that a restarted scheduler keeps due times instead of re-running everything."""
+        scheduler = CadenceScheduler(cadences(linkedin=60, indeed=120), temp_db)
+        await scheduler.load(now=NOW)
+        for name, kind in scheduler.pop_due(NOW):
+            await scheduler.save(name, kind, scheduler.reschedule(name, kind, NOW))
+
+        restarted = CadenceScheduler(cadences(linkedin=60, indeed=120), temp_db)
+        await restarted.load(now=NOW + timedelta(minutes=5))
+        assert restarted.pop_due(NOW + timedelta(minutes=5)) == []
+        assert restarted.next_due() == NOW + timedelta(minutes=60)
+        assert restarted.pop_due(NOW + timedelta(minutes=60)) == [("linkedin", "search")]
+
+    async def test_shortened_interval_pulls_in_saved_time(self, temp_db):
+        """Test that a saved time beyond the new interval is capped to it."""
+        await temp_db.set_portal_schedule("linkedin", "search", NOW + timedelta(hours=10))
+        scheduler = CadenceScheduler(cadences(linkedin=30), temp_db)
+        await scheduler.load(now=NOW)
+
+        scheduler.pop_due(NOW)  # The never-saved apply run
+        assert scheduler.next_due() == NOW + timedelta(minutes=30)
+
+    async def test_jitter_stays_within_bounds(self, temp_db):
+        """Test that rescheduling spreads runs by at most the jitter fraction."""
+        scheduler = CadenceScheduler(
+            {"linkedin": Cadence(100, 100, jitter=0.2)}, temp_db, rng=random.Random(3)
+        )
+        dues = [scheduler.reschedule("linkedin", "search", NOW) for _ in range(50)]
+
+        assert all(NOW + timedelta(minutes=80) <= due <= NOW + timedelta(minutes=120) for due in dues)
+        assert len(set(dues)) > 1
+
+    async def test_failed_save_keeps_schedule(self, temp_db):
+        """Test that a save error is reported without losing the in-memory due time."""
+        backend = MagicMock()
+        backend.set_portal_schedule = AsyncMock(side_effect=OSError("disk full"))
+        scheduler = CadenceScheduler(cadences(linkedin=60), backend)
+
+        due = scheduler.reschedule("linkedin", "search", NOW)
+        assert not await scheduler.save("linkedin", "search", due)
+        assert scheduler.next_due() == due
+
+    async def test_portals_added_and_discarded(self, temp_db):
+        """Test that a portal taken over mid-run is due at once and a lost one drops out."""
+        scheduler = CadenceScheduler(cadences(linkedin=60), temp_db)
+        await scheduler.load(now=NOW)
+        scheduler.add("indeed", Cadence(30, 30, jitter=0.0), NOW)
+        scheduler.discard("linkedin")
+
+        assert sorted(scheduler.pop_due(NOW)) == [("indeed", "apply"), ("indeed", "search")]
+        assert list(scheduler.cadences) == ["indeed"]
+
+    def test_unset_intervals_use_default(self):
+        assert resolve_cadence(Cadence(search_minutes=30), 120) == Cadence(30, 120, 0.1)
+
+
+class CadenceWorker:
+    """Counts searches and applications; never touches a browser."""
+
+    def __init__(self, search_minutes: float, apply_minutes: float = 10.0, seconds: float = 0.0):
+        self.portal = SimpleNamespace(
+            config=SimpleNamespace(cadence=Cadence(search_minutes, apply_minutes, jitter=0.0)),
+            rate_limiter=TokenBucket(rate=100, burst=100),
+            step_timings=StepTimings(),
+        )
+        self.resource_blocker = ResourceBlocker(ResourceBlocking())
+        self.browser_key = None
+        self.seconds = seconds  # How long each search or apply pass takes
+        self.searches = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def _busy(self):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.seconds)
+        self.active -= 1
+
+    async def search_and_queue(self, keyword, location):
+        await self._busy()
+        self.searches += 1
+        return 1
+
+    async def run_cycle(self):
+        await self._busy()
+        return 0
+
+
+def cadence_db() -> MagicMock:
+    db = MagicMock()
+    db.get_portal_schedule = AsyncMock(return_value=[])
+    db.set_portal_schedule = AsyncMock()
+    db.get_search_yields = AsyncMock(return_value=[])
+    db.reap_expired_leases = AsyncMock(return_value=0)
+    db.get_stats = AsyncMock(return_value={"total_jobs": 0})
+    return db
+
+
+def cadence_swarm(db, tmp_path) -> SwarmOrchestrator:
+    return SwarmOrchestrator(
+        SwarmConfig(search_keywords=["ai"], search_locations=["remote"]), db,
+        CandidateProfile("A B", "a@b.c", "1", "Remote"), SessionManager(tmp_path / "sessions")
+    )
+
+
+class TestContinuousMode:
+    """Tests for portals running on independent cadences."""
+
+    async def test_fast_portal_does_not_wait_for_slow_one(self, tmp_path):
+        """Test that each portal searches at its own interval, with no global barrier."""
+        db = cadence_db()
+        swarm = cadence_swarm(db, tmp_path)
+        fast, slow = CadenceWorker(0.001), CadenceWorker(10.0)  # 60ms vs 10 minutes
+        swarm.workers = {"fast": fast, "slow": slow}
+        runs = []
+
+        loop = asyncio.ensure_future(swarm.continuous_mode(on_cycle=runs.append))
+        await asyncio.sleep(0.4)
+        swarm.stop()
+        await asyncio.wait_for(loop, timeout=1)
+
+        assert fast.searches >= 3
+        assert slow.searches == 1
+        assert {(r["portal"], r["kind"]) for r in runs} >= {("fast", "search"), ("slow", "apply")}
+        saved = {call.args[:2] for call in db.set_portal_schedule.await_args_list}
+        assert ("slow", "search") in saved
+
+    async def test_failed_saves_do_not_drop_due_runs(self, tmp_path):
+        """Test that every portal keeps running when saving due times fails."""
+        db = cadence_db()
+        db.set_portal_schedule = AsyncMock(side_effect=OSError("database is locked"))
+        swarm = cadence_swarm(db, tmp_path)
+        first, second = CadenceWorker(0.001), CadenceWorker(0.001)
+        swarm.workers = {"first": first, "second": second}
+
+        loop = asyncio.ensure_future(swarm.continuous_mode())
+        await asyncio.sleep(0.4)
+        swarm.stop()
+        await asyncio.wait_for(loop, timeout=1)
+
+        assert first.searches >= 3
+        assert second.searches >= 3
+
+    async def test_search_and_apply_take_turns(self, tmp_path):
+        """Test that a portal's search and apply runs never share its context at once."""
+        swarm = cadence_swarm(cadence_db(), tmp_path)
+        worker = CadenceWorker(0.001, 0.001, seconds=0.05)
+        swarm.workers = {"linkedin": worker}
+        runs = []
+
+        loop = asyncio.ensure_future(swarm.continuous_mode(on_cycle=runs.append))
+        await asyncio.sleep(0.4)
+        swarm.stop()
+        await asyncio.wait_for(loop, timeout=1)
+
+        assert worker.max_active == 1
+        assert {r["kind"] for r in runs} == {"search", "apply"}
+        assert all("rate_limit_wait_seconds" in r and "bytes_saved" in r for r in runs)
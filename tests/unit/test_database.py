@@ -0,0 +1,515 @@
+"""Unit tests for the Database class."""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from mjas.core.database import (
+    ApplicationRecord,
+    Database,
+    JobRow,
+    JobStatus,
+    PRIORITY_QUEUE_SQL,
+    PRODUCTION_STORAGE,
+    jobs_by_status_query,
+)
+from mjas.portals.base import JobListing
+
+
+@pytest.fixture
+async def temp_db(tmp_path):
+    """Create a temporary database for testing."""
+    db = Database(tmp_path / "test.db")
+    await db.init()
+    yield db
+    await db.close()
+
+
+def make_listing(job_id: str, portal: str = "linkedin", score: int = 80) -> JobListing:
+    """Build a scored listing for insertion."""
+    return JobListing(
+        job_id=job_id,
+        title=f"AI Engineer {job_id}",
+        company="TestCo",
+        location="Remote",
+        url=f"https://example.com/jobs/{job_id}",
+        portal=portal,
+        score=score,
+        priority="HIGH" if score >= 85 else "MEDIUM",
+    )
+
+
+class TestInsertJobsBulk:
+    """Tests for insert_jobs_bulk method."""
+
+    async def test_inserts_with_initial_status(self, temp_db):
+        """Test that rows are written with the requested status."""
+        listings = [make_listing("a"), make_listing("b", score=90)]
+        new_ids = await temp_db.insert_jobs_bulk(listings)
+
+        assert new_ids == ["a", "b"]
+        queued = await temp_db.get_jobs_by_status(JobStatus.QUEUED)
+        assert {job["job_id"] for job in queued} == {"a", "b"}
+        assert (await temp_db.get_job("b"))["priority"] == "HIGH"
+
+    async def test_custom_status(self, temp_db):
+        """Test that a non-default status can be used."""
+        await temp_db.insert_jobs_bulk([make_listing("a")], status=JobStatus.DISCOVERED)
+        assert (await temp_db.get_job("a"))["status"] == "discovered"
+
+    async def test_returns_only_new_rows(self, temp_db):
+        """Test that already-known jobs are skipped and not reported."""
+        await temp_db.insert_jobs_bulk([make_listing("a")])
+        await temp_db.update_job_status("a", JobStatus.APPLIED)
+
+        new_ids = await temp_db.insert_jobs_bulk([make_listing("a"), make_listing("c")])
+
+        assert new_ids == ["c"]
+        assert (await temp_db.get_job("a"))["status"] == "applied"
+
+    async def test_deduplicates_within_batch(self, temp_db):
+        """Test that repeated IDs in one batch are inserted once."""
+        new_ids = await temp_db.insert_jobs_bulk([make_listing("a"), make_listing("a")])
+        assert new_ids == ["a"]
+        assert (await temp_db.get_stats())["total_jobs"] == 1
+
+    async def test_empty_batch(self, temp_db):
+        """Test that an empty batch is a no-op."""
+        assert await temp_db.insert_jobs_bulk([]) == []
+
+    async def test_large_batch_in_input_order(self, temp_db):
+        """Test that a batch spanning several statements reports new ids in input order."""
+        job_ids = [f"job-{i:03d}" for i in reversed(range(250))]
+        await temp_db.insert_jobs_bulk([make_listing("job-100")])
+
+        new_ids = await temp_db.insert_jobs_bulk([make_listing(job_id) for job_id in job_ids])
+        assert new_ids == [job_id for job_id in job_ids if job_id != "job-100"]
+
+    async def test_overlapping_writers_report_disjoint_ids(self, tmp_path):
+        """Test that two connections inserting the same ids each report only their own rows."""
+        writers = [Database(tmp_path / "shared.db", storage=PRODUCTION_STORAGE) for _ in range(2)]
+        for db in writers:
+            await db.init()
+        try:
+            batches = await asyncio.gather(*(
+                db.insert_jobs_bulk([make_listing(f"job-{i}") for i in range(offset, offset + 60)])
+                for db in writers for offset in (0, 30)
+            ))
+        finally:
+            for db in writers:
+                await db.close()
+
+        reported = [job_id for batch in batches for job_id in batch]
+        assert len(reported) == len(set(reported)) == 90
+
+
+class TestProductionStorage:
+    """Tests for the production storage profile and writer queue."""
+
+    @pytest.fixture
+    async def production_db(self, tmp_path):
+        """Create a database using the production profile."""
+        db = Database(tmp_path / "prod.db", storage=PRODUCTION_STORAGE)
+        await db.init()
+        yield db
+        await db.close()
+
+    async def test_pragmas_applied(self, production_db):
+        """Test that WAL journaling and synchronous=NORMAL are active."""
+        async with production_db._conn.execute("PRAGMA journal_mode") as cursor:
+            assert (await cursor.fetchone())[0] == "wal"
+        async with production_db._conn.execute("PRAGMA synchronous") as cursor:
+            assert (await cursor.fetchone())[0] == 1  # NORMAL
+
+    async def test_concurrent_writes_are_committed(self, production_db):
+        """Test that writes queued by concurrent callers all land."""
+        await asyncio.gather(*[
+            production_db.insert_jobs_bulk([make_listing(f"job-{i}")])
+            for i in range(20)
+        ])
+        await asyncio.gather(*[
+            production_db.update_job_status(f"job-{i}", JobStatus.APPLIED)
+            for i in range(20)
+        ])
+
+        stats = await production_db.get_stats()
+        assert stats["total_jobs"] == 20
+        assert stats["applied"] == 20
+
+    async def test_failed_write_does_not_abort_batch(self, production_db):
+        """Test that one failing write is isolated from the rest of its batch."""
+        async def broken(conn):
+            await conn.execute("INSERT INTO missing_table VALUES (1)")
+
+        results = await asyncio.gather(
+            production_db.insert_jobs_bulk([make_listing("a")]),
+            production_db._write(broken),
+            production_db.insert_jobs_bulk([make_listing("b")]),
+            return_exceptions=True,
+        )
+
+        assert results[0] == ["a"]
+        assert isinstance(results[1], Exception)
+        assert results[2] == ["b"]
+
+    async def test_close_flushes_pending_writes(self, tmp_path):
+        """Test that close waits for queued writes to commit."""
+        db = Database(tmp_path / "flush.db", storage=PRODUCTION_STORAGE)
+        await db.init()
+        pending = asyncio.ensure_future(db.insert_jobs_bulk([make_listing("a")]))
+        await asyncio.sleep(0)
+        await db.close()
+        assert await pending == ["a"]
+
+        reopened = Database(tmp_path / "flush.db")
+        await reopened.init()
+        assert await reopened.get_job("a") is not None
+        await reopened.close()
+
+    async def test_read_only_reader_sees_live_data(self, production_db):
+        """Test that a read-only connection reads while the writer is open."""
+        await production_db.insert_jobs_bulk([make_listing("a")])
+
+        reader = Database(production_db.db_path, read_only=True)
+        await reader.init()
+        try:
+            assert (await reader.get_stats())["total_jobs"] == 1
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                await reader.insert_job("b", "t", "c", "linkedin", "https://x")
+        finally:
+            await reader.close()
+
+
+class TestClaimJobs:
+    """Tests for lease-based job claiming."""
+
+    async def test_claims_best_jobs_first(self, temp_db):
+        """Test that claims follow queue order and mark jobs APPLYING."""
+        await temp_db.insert_jobs_bulk([
+            make_listing("low", score=70),
+            make_listing("high", score=95),
+            make_listing("mid", score=80),
+            make_listing("other", portal="indeed", score=99),
+        ])
+
+        claimed = await temp_db.claim_jobs("linkedin", 2, lease_seconds=60, owner="w1")
+
+        assert [job["job_id"] for job in claimed] == ["high", "mid"]
+        assert all(job["status"] == "applying" for job in claimed)
+        assert all(job["lease_owner"] == "w1" for job in claimed)
+        assert (await temp_db.get_job("low"))["status"] == "queued"
+
+    async def test_claims_only_given_ids(self, temp_db):
+        """Test that job_ids restricts the claim to those jobs, skipping taken ones."""
+        await temp_db.insert_jobs_bulk([
+            make_listing("a", score=95), make_listing("b"), make_listing("c"),
+            make_listing("d", portal="indeed"),
+        ])
+        await temp_db.claim_jobs("linkedin", 1, lease_seconds=60, owner="w0", job_ids=["c"])
+
+        claimed = await temp_db.claim_jobs(
+            "linkedin", 10, lease_seconds=60, owner="w1", job_ids=["b", "c", "d"]
+        )
+
+        assert [job["job_id"] for job in claimed] == ["b"]
+        assert (await temp_db.get_job("a"))["status"] == "queued"
+        assert await temp_db.claim_jobs("linkedin", 10, lease_seconds=60, job_ids=[]) == []
+
+    async def test_concurrent_claims_do_not_overlap(self, temp_db):
+        """Test that parallel claimers never receive the same job."""
+        await temp_db.insert_jobs_bulk([make_listing(f"job-{i}") for i in range(10)])
+
+        batches = await asyncio.gather(*[
+            temp_db.claim_jobs("linkedin", 3, lease_seconds=60, owner=f"w{i}")
+            for i in range(5)
+        ])
+
+        claimed = [job["job_id"] for batch in batches for job in batch]
+        assert len(claimed) == 10
+        assert len(set(claimed)) == 10
+
+    async def test_status_update_clears_lease(self, temp_db):
+        """Test that finishing a job drops its lease."""
+        await temp_db.insert_jobs_bulk([make_listing("a")])
+        await temp_db.claim_jobs("linkedin", 1, lease_seconds=60, owner="w1")
+        await temp_db.update_job_status("a", JobStatus.APPLIED)
+
+        job = await temp_db.get_job("a")
+        assert job["lease_owner"] is None
+        assert job["lease_expires_at"] is None
+
+    async def test_release_only_own_jobs(self, temp_db):
+        """Test that release_jobs re-queues jobs held by the given owner."""
+        await temp_db.insert_jobs_bulk([make_listing("a"), make_listing("b")])
+        await temp_db.claim_jobs("linkedin", 1, lease_seconds=60, owner="w1")
+        await temp_db.claim_jobs("linkedin", 1, lease_seconds=60, owner="w2")
+
+        released = await temp_db.release_jobs(["a", "b"], owner="w1")
+
+        assert released == 1
+        statuses = {job["job_id"]: job["status"] for job in
+                    [await temp_db.get_job("a"), await temp_db.get_job("b")]}
+        assert sorted(statuses.values()) == ["applying", "queued"]
+
+    async def test_reaper_requeues_expired_leases(self, temp_db):
+        """Test that expired leases are returned to the queue."""
+        await temp_db.insert_jobs_bulk([make_listing("a"), make_listing("b", score=60)])
+        await temp_db.claim_jobs("linkedin", 1, lease_seconds=-1, owner="dead")
+        await temp_db.claim_jobs("linkedin", 1, lease_seconds=600, owner="alive")
+
+        assert await temp_db.reap_expired_leases() == 1
+        assert (await temp_db.get_job("a"))["status"] == "queued"
+        assert (await temp_db.get_job("b"))["status"] == "applying"
+
+
+class TestQueueIndexes:
+    """Tests that queue reads are served by index order."""
+
+    async def explain(self, db, sql, params):
+        """Return the EXPLAIN QUERY PLAN detail lines for a query."""
+        async with db._conn.execute(f"EXPLAIN QUERY PLAN {sql}", params) as cursor:
+            return [row["detail"] for row in await cursor.fetchall()]
+
+    @pytest.fixture
+    async def filled_db(self, temp_db):
+        """Database with a spread of portals, statuses and priorities."""
+        listings = [
+            make_listing(f"job-{i}", portal=("linkedin", "indeed")[i % 2], score=60 + i % 40)
+            for i in range(200)
+        ]
+        await temp_db.insert_jobs_bulk(listings)
+        for i in range(0, 200, 3):
+            await temp_db.update_job_status(f"job-{i}", JobStatus.APPLIED)
+        await temp_db._conn.execute("ANALYZE")
+        return temp_db
+
+    async def test_priority_queue_uses_index_without_sort(self, filled_db):
+        """Test that get_priority_queue needs no temp B-tree."""
+        plan = await self.explain(filled_db, PRIORITY_QUEUE_SQL, (65, 50))
+        assert any("idx_jobs_priority" in line for line in plan), plan
+        assert not any("TEMP B-TREE" in line for line in plan), plan
+
+    @pytest.mark.parametrize("portal", [None, "linkedin"])
+    async def test_jobs_by_status_uses_index_without_sort(self, filled_db, portal):
+        """Test that get_jobs_by_status needs no temp B-tree."""
+        sql, params = jobs_by_status_query(JobStatus.QUEUED, 10, portal)
+        plan = await self.explain(filled_db, sql, params)
+        assert any("idx_jobs_" in line for line in plan), plan
+        assert not any("TEMP B-TREE" in line for line in plan), plan
+
+    async def test_priority_queue_order(self, temp_db):
+        """Test that rank outranks score, then score, then age."""
+        await temp_db.insert_jobs_bulk([
+            make_listing("medium-high-score", score=84),
+            make_listing("high", score=85),
+            make_listing("medium-low-score", score=70),
+        ])
+        await temp_db.insert_job("low", "t", "c", "linkedin", "https://x", score=99, priority="LOW")
+        await temp_db.update_job_status("low", JobStatus.QUEUED)
+
+        queue = await temp_db.get_priority_queue()
+        assert [job["job_id"] for job in queue] == [
+            "high", "medium-high-score", "medium-low-score", "low"
+        ]
+
+
+class TestSearchJobs:
+    """Tests for full-text search."""
+
+    @pytest.fixture
+    async def search_db(self, temp_db):
+        """Database with a few described jobs."""
+        await temp_db.insert_job(
+            "lg", "LangGraph Engineer", "AgentCo", "linkedin", "https://x/1",
+            description="Build multi-agent systems, fully remote team",
+        )
+        await temp_db.insert_job(
+            "py", "Python Backend Engineer", "WebCo", "indeed", "https://x/2",
+            description="FastAPI services; experience with LangGraph is a plus",
+        )
+        await temp_db.insert_job(
+            "fe", "Frontend Developer", "UICo", "linkedin", "https://x/3",
+            description="React and Next.js",
+        )
+        await temp_db.update_job_status("py", JobStatus.QUEUED)
+        return temp_db
+
+    async def test_matches_all_words(self, search_db):
+        """Test that every word must match somewhere in the job."""
+        results = await search_db.search_jobs("langgraph remote")
+        assert [job["job_id"] for job in results] == ["lg"]
+
+    async def test_title_match_ranks_first(self, search_db):
+        """Test that BM25 weights title hits above description hits."""
+        results = await search_db.search_jobs("langgraph")
+        assert [job["job_id"] for job in results] == ["lg", "py"]
+
+    async def test_stemming_and_prefix(self, search_db):
+        """Test porter stemming and trailing-star prefix queries."""
+        assert {j["job_id"] for j in await search_db.search_jobs("engineers")} == {"lg", "py"}
+        assert [j["job_id"] for j in await search_db.search_jobs("front*")] == ["fe"]
+
+    async def test_filters(self, search_db):
+        """Test status and portal filters."""
+        queued = await search_db.search_jobs("langgraph", status=JobStatus.QUEUED)
+        assert [job["job_id"] for job in queued] == ["py"]
+        on_linkedin = await search_db.search_jobs("engineer", portal="linkedin")
+        assert [job["job_id"] for job in on_linkedin] == ["lg"]
+
+    async def test_operator_characters_are_literal(self, search_db):
+        """Test that FTS syntax in user input does not raise."""
+        assert await search_db.search_jobs('"next.js" OR (react') == []
+        assert await search_db.search_jobs("  ** ") == []
+
+    async def test_index_follows_updates_and_deletes(self, search_db):
+        """Test that triggers keep the index in sync with the jobs table."""
+        await search_db._write(lambda conn: conn.execute(
+            "UPDATE jobs SET title = 'Rust Developer' WHERE job_id = 'fe'"
+        ))
+        assert [j["job_id"] for j in await search_db.search_jobs("rust")] == ["fe"]
+        assert await search_db.search_jobs("frontend") == []
+
+        await search_db._write(lambda conn: conn.execute("DELETE FROM jobs WHERE job_id = 'fe'"))
+        assert await search_db.search_jobs("rust") == []
+
+
+class TestIterJobs:
+    """Tests for the streaming iter_jobs method."""
+
+    @pytest.fixture
+    async def many_db(self, temp_db):
+        """25 jobs split across two portals and two statuses."""
+        listings = [make_listing(f"j{i:02d}", portal="linkedin" if i % 2 else "indeed")
+                    for i in range(25)]
+        await temp_db.insert_jobs_bulk(listings[:20], status=JobStatus.QUEUED)
+        await temp_db.insert_jobs_bulk(listings[20:], status=JobStatus.DISCOVERED)
+        return temp_db
+
+    async def test_streams_every_row_across_batches(self, many_db):
+        """Test that small batches still visit each job exactly once."""
+        ids = [job["job_id"] async for job in many_db.iter_jobs(batch_size=4)]
+        assert sorted(ids) == [f"j{i:02d}" for i in range(25)]
+
+    async def test_filters_by_status_and_portal(self, many_db):
+        """Test that status and portal filters combine."""
+        jobs = [job async for job in many_db.iter_jobs(
+            status=JobStatus.QUEUED, portal="linkedin", batch_size=3
+        )]
+        assert len(jobs) == 10
+        assert {(j["status"], j["portal"]) for j in jobs} == {("queued", "linkedin")}
+
+    async def test_yields_requested_record_type(self, many_db):
+        """Test tuple, namedtuple and column-subset output."""
+        rows = [row async for row in many_db.iter_jobs(record=JobRow, batch_size=10)]
+        assert isinstance(rows[0], JobRow)
+        assert rows[0].title.startswith("AI Engineer")
+
+        pairs = [row async for row in many_db.iter_jobs(
+            columns=("job_id", "score"), record=tuple
+        )]
+        assert pairs[0] == ("j00", 80)
+
+    async def test_rejects_unknown_columns(self, temp_db):
+        """Test that column names are validated before being interpolated."""
+        with pytest.raises(ValueError):
+            async for _ in temp_db.iter_jobs(columns=("job_id; DROP TABLE jobs",)):
+                pass
+
+
+class TestRecordConversion:
+    """Tests for converting slotted records to and from jobs rows."""
+
+    async def test_listing_round_trips_through_database(self, temp_db):
+        """Test that a stored listing reads back equal via from_row."""
+        listing = make_listing("a", score=90)
+        listing.description = "Build agents"
+        await temp_db.insert_jobs_bulk([listing])
+
+        assert JobListing.from_row(await temp_db.get_job("a")) == listing
+
+    async def test_application_record_from_row(self, temp_db):
+        """Test that from_row parses status and timestamps."""
+        await temp_db.insert_jobs_bulk([make_listing("a")])
+        await temp_db.update_job_status("a", JobStatus.APPLIED)
+
+        record = ApplicationRecord.from_row(await temp_db.get_job("a"))
+        assert record.status is JobStatus.APPLIED
+        assert record.applied_at is not None and record.applied_at.year >= 2024
+        assert record.to_row()["status"] == "applied"
+        with pytest.raises(AttributeError):
+            record.notes = "changed"
+
+    def test_listing_is_slotted_with_lazy_metadata(self):
+        """Test that listings have no __dict__ and allocate metadata on demand."""
+        listing = make_listing("a")
+        assert not hasattr(listing, "__dict__")
+        assert JobListing.metadata.slot.__get__(listing) is None
+
+        listing.metadata["source"] = "feed"
+        assert listing.metadata == {"source": "feed"}
+        assert make_listing("b", portal="".join(["link", "edin"])).portal is listing.portal
+
+
+class TestPortalStatsCounters:
+    """Tests for the trigger-maintained portal_stats counters."""
+
+    async def grouped_stats(self, db):
+        """The per-portal numbers computed the slow way, for comparison."""
+        async with db._conn.execute("""
+            SELECT portal, COUNT(*) as total,
+                   SUM(status = 'applied') as applied,
+                   SUM(status = 'failed') as failed,
+                   SUM(status = 'queued') as queued
+            FROM jobs GROUP BY portal ORDER BY portal
+        """) as cursor:
+            return [dict(row) for row in await cursor.fetchall()]
+
+    async def counter_stats(self, db):
+        """The per-portal numbers as get_portal_stats reports them."""
+        rows = await db.get_portal_stats()
+        keys = ("portal", "total", "applied", "failed", "queued")
+        return sorted(({k: row[k] for k in keys} for row in rows), key=lambda r: r["portal"])
+
+    async def test_counters_follow_status_changes(self, temp_db):
+        """Test that inserts, transitions and deletes keep counters exact."""
+        await temp_db.insert_jobs_bulk(
+            [make_listing("a"), make_listing("b", score=90), make_listing("c", portal="indeed")],
+            status=JobStatus.QUEUED,
+        )
+        await temp_db.update_job_status("a", JobStatus.APPLIED)
+        await temp_db.update_job_status("a", JobStatus.APPLIED)
+        await temp_db.update_job_status("c", JobStatus.FAILED)
+        await temp_db._write(lambda conn: conn.execute("DELETE FROM jobs WHERE job_id = 'b'"))
+
+        assert await self.counter_stats(temp_db) == await self.grouped_stats(temp_db)
+        stats = await temp_db.get_stats()
+        assert stats == {
+            "total_jobs": 2, "applied": 1, "failed": 1, "queued": 0, "avg_score": 80.0,
+        }
+
+    async def test_attempts_track_response_time(self, temp_db):
+        """Test that application attempts update counts and the average latency."""
+        await temp_db.insert_jobs_bulk([make_listing("a")], status=JobStatus.QUEUED)
+        await temp_db.log_application_attempt("a", True, response_time_ms=1000)
+        await temp_db.log_application_attempt("a", False, "timeout", response_time_ms=2001)
+        await temp_db.log_application_attempt("a", False, "no timing")
+
+        (linkedin,) = await temp_db.get_portal_stats()
+        assert linkedin["total_attempts"] == 3
+        assert linkedin["successful_applications"] == 1
+        assert linkedin["failed_applications"] == 2
+        assert linkedin["avg_response_time_ms"] == 1500
+
+    async def test_rebuild_repairs_drift(self, temp_db):
+        """Test that rebuild_stats recomputes counters that were tampered with."""
+        await temp_db.insert_jobs_bulk([make_listing("a"), make_listing("b")], status=JobStatus.QUEUED)
+        await temp_db.log_application_attempt("a", True, response_time_ms=400)
+        before = await temp_db.get_portal_stats()
+
+        await temp_db._write(lambda conn: conn.execute(
+            "UPDATE portal_stats SET jobs_total = 99, total_attempts = 0, avg_response_time_ms = NULL"
+        ))
+        await temp_db.rebuild_stats()
+
+        assert await temp_db.get_portal_stats() == before
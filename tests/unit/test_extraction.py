@@ -0,0 +1,80 @@
+"""Unit tests for declarative job-card extraction."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mjas.portals.extraction import EXTRACT_CARDS_JS, extract_cards
+from mjas.portals.indeed import IndeedPortal
+from mjas.portals.linkedin import LinkedInPortal
+from mjas.portals.naukri import NaukriPortal
+from mjas.portals.registry import get_portal, list_portals
+
+FIXTURE = Path(__file__).resolve().parents[1] / "fixtures" / "linkedin_search.html"
+
+
+class TestExtractionSpecs:
+    """Tests for the per-portal extraction specs."""
+
+    @pytest.mark.parametrize("name", list_portals())
+    def test_every_portal_declares_a_spec(self, name):
+        """Test that every registered portal parses results from a spec."""
+        spec = get_portal(name, {}).config.extraction
+        assert spec is not None
+        assert "title" in dict(spec.fields)
+
+    def test_fixture_matches_linkedin_spec(self):
+        """Test that the benchmark fixture uses the selectors LinkedIn declares."""
+        html = FIXTURE.read_text()
+        spec = LinkedInPortal.DEFAULT_CONFIG.extraction
+        assert html.count(spec.card_selector.split(".", 1)[1]) == 25
+        for _, field in spec.fields:
+            assert field.selector.split(".", 1)[1] in html
+
+    async def test_extract_cards_is_one_evaluate(self):
+        """Test that all cards are read with a single page.evaluate call."""
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=[{"title": "AI Engineer"}])
+        spec = LinkedInPortal.DEFAULT_CONFIG.extraction
+
+        assert await extract_cards(page, spec) == [{"title": "AI Engineer"}]
+        page.evaluate.assert_awaited_once()
+        script, (card_selector, fields, limit) = page.evaluate.await_args.args
+        assert script == EXTRACT_CARDS_JS
+        assert card_selector == spec.card_selector
+        assert ["url", "a.base-card__full-link", "href"] in fields
+        assert limit == 25
+
+
+class TestParseJobCard:
+    """Tests for turning extracted fields into listings."""
+
+    def test_linkedin_card(self):
+        """Test that text is stripped and tracking params dropped."""
+        job = LinkedInPortal()._parse_job_card({
+            "title": "\n  AI Engineer  ", "company": "Acme", "location": None,
+            "url": "https://www.linkedin.com/jobs/view/1/?refId=x",
+        })
+        assert job.title == "AI Engineer"
+        assert job.location == "Unknown"
+        assert job.url == "https://www.linkedin.com/jobs/view/1/"
+        assert job.job_id.startswith("li-")
+
+    def test_missing_link_is_skipped(self):
+        """Test that a card without a link yields no listing."""
+        card = {"title": "AI Engineer", "company": None, "location": None, "href": None}
+        assert IndeedPortal()._parse_job_card(card) is None
+
+    def test_relative_indeed_link(self):
+        """Test that relative hrefs are made absolute."""
+        card = {"title": "AI Engineer", "company": "A", "location": "Remote", "href": "/rc/clk?jk=1"}
+        assert IndeedPortal()._parse_job_card(card).url == "https://www.indeed.com/rc/clk?jk=1"
+
+    def test_naukri_prefers_title_attribute(self):
+        """Test that Naukri's full title attribute wins over truncated text."""
+        card = {"title": "AI Eng...", "title_attr": "AI Engineer (LLM)", "company": None,
+                "location": None, "href": None}
+        job = NaukriPortal()._parse_job_card(card)
+        assert job.title == "AI Engineer (LLM)"
+        assert (job.company, job.location, job.url) == ("Company", "India", "")
@@ -0,0 +1,150 @@
+"""Unit tests for the schema migration engine."""
+
+import sqlite3
+
+import aiosqlite
+import pytest
+
+from mjas.core import migrations
+from mjas.core.database import Database
+from mjas.core.migrations import MIGRATIONS, Migration, split_statements
+
+LATEST = MIGRATIONS[-1].version
+
+
+@pytest.fixture
+def legacy_db_path(tmp_path):
+    """A database created by v3.0, before schema versioning existed."""
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE jobs (
+            job_id TEXT PRIMARY KEY, title TEXT NOT NULL, company TEXT NOT NULL,
+            portal TEXT NOT NULL, url TEXT NOT NULL, location TEXT,
+            salary_range TEXT, description TEXT, score INTEGER DEFAULT 0,
+            priority TEXT DEFAULT 'MEDIUM', status TEXT DEFAULT 'discovered',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            applied_at TIMESTAMP, notes TEXT, screenshot_path TEXT
+        );
+        CREATE INDEX idx_jobs_status ON jobs(status);
+        INSERT INTO jobs (job_id, title, company, portal, url, priority, status)
+        VALUES ('h', 'AI Engineer', 'A', 'linkedin', 'u1', 'HIGH', 'queued'),
+               ('m', 'ML Engineer', 'B', 'indeed', 'u2', 'MEDIUM', 'queued');
+    """)
+    conn.close()
+    return path
+
+
+class TestSplitStatements:
+    """Tests for split_statements."""
+
+    def test_splits_simple_statements(self):
+        """Test that plain statements are split on semicolons."""
+        assert split_statements("SELECT 1;\nSELECT 2;\n") == ["SELECT 1;", "SELECT 2;"]
+
+    def test_keeps_trigger_bodies_whole(self):
+        """Test that a trigger body containing semicolons stays intact."""
+        script = """
+            CREATE TRIGGER t AFTER INSERT ON jobs BEGIN
+                UPDATE a SET x = 1;
+                UPDATE b SET y = 2;
+            END;
+            SELECT 1;
+        """
+        statements = split_statements(script)
+        assert len(statements) == 2
+        assert statements[0].startswith("CREATE TRIGGER")
+        assert statements[0].endswith("END;")
+
+
+class TestApplyMigrations:
+    """Tests for applying migrations through Database.init."""
+
+    async def test_fresh_database_is_at_latest_version(self, tmp_path):
+        """Test that a new database gets every migration."""
+        db = Database(tmp_path / "new.db")
+        await db.init()
+        try:
+            assert await db.schema_version() == LATEST
+            assert await db.migrate(dry_run=True) == []
+        finally:
+            await db.close()
+
+    async def test_upgrades_legacy_database_in_place(self, legacy_db_path):
+        """Test that an unversioned database keeps its rows and gains new columns."""
+        db = Database(legacy_db_path)
+        await db.init()
+        try:
+            assert await db.schema_version() == LATEST
+            job = await db.get_job("h")
+            assert job["title"] == "AI Engineer"
+            assert job["priority_rank"] == 3
+            assert job["lease_owner"] is None
+            assert (await db.get_stats())["queued"] == 2
+        finally:
+            await db.close()
+
+    async def test_dry_run_lists_without_applying(self, legacy_db_path):
+        """Test that a dry run reports pending steps and changes nothing."""
+        db = Database(legacy_db_path)
+        await db.init(migrate=False)
+        try:
+            pending = await db.migrate(dry_run=True)
+            assert [m.version for m in pending] == [m.version for m in MIGRATIONS]
+            assert await db.schema_version() == 0
+        finally:
+            await db.close()
+
+    async def test_reports_progress(self, legacy_db_path):
+        """Test that the progress callback receives per-step messages."""
+        messages = []
+        db = Database(legacy_db_path)
+        await db.init(progress=messages.append)
+        await db.close()
+
+        assert any("priority_rank" in message for message in messages)
+        assert any("2/2 rows" in message for message in messages)
+
+    async def test_failed_step_rolls_back(self, tmp_path, monkeypatch):
+        """Test that a failing step leaves neither changes nor a version row."""
+        async def broken(conn, progress):
+            await conn.execute("CREATE TABLE half_done (x INTEGER)")
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(
+            migrations, "MIGRATIONS", MIGRATIONS + [Migration(LATEST + 1, "broken", broken)]
+        )
+
+        db = Database(tmp_path / "broken.db")
+        with pytest.raises(RuntimeError):
+            await db.init()
+        await db.close()
+
+        async with aiosqlite.connect(tmp_path / "broken.db") as conn:
+            assert await migrations.current_version(conn) == LATEST
+            async with conn.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'half_done'"
+            ) as cursor:
+                assert await cursor.fetchone() is None
+
+    async def test_steps_applied_meanwhile_are_skipped(self, tmp_path, monkeypatch):
+        """Test that steps another process applies after the plan is made are not re-run."""
+        path = tmp_path / "race.db"
+        find_pending = migrations.pending_migrations
+
+        async def pending_then_raced(conn):
+            pending = await find_pending(conn)
+            # Another process migrates before our first step
+            monkeypatch.setattr(migrations, "pending_migrations", find_pending)
+            other = Database(path)
+            await other.init()
+            await other.close()
+            return pending
+
+        monkeypatch.setattr(migrations, "pending_migrations", pending_then_raced)
+        async with aiosqlite.connect(path) as conn:
+            assert await migrations.apply_migrations(conn) == []
+            assert await migrations.current_version(conn) == LATEST
+            async with conn.execute("SELECT COUNT(*) FROM schema_version") as cursor:
+                assert (await cursor.fetchone())[0] == len(MIGRATIONS)
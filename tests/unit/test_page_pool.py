@@ -0,0 +1,87 @@
+"""Unit tests for PagePool."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mjas.portals.page_pool import PagePool
+
+
+def fake_context():
+    """A BrowserContext stand-in producing closable fake pages."""
+    context = MagicMock()
+
+    async def new_page():
+        page = MagicMock()
+        page.closed = False
+        page.is_closed.side_effect = lambda: page.closed
+        page.goto = AsyncMock()
+
+        async def close():
+            page.closed = True
+
+        page.close = AsyncMock(side_effect=close)
+        return page
+
+    context.new_page = AsyncMock(side_effect=new_page)
+    return context
+
+
+class TestPagePool:
+    """Tests for page reuse, caps and recycling."""
+
+    async def test_reuses_and_resets_pages(self):
+        """Test that a released page is reset and handed out again."""
+        pool = PagePool(fake_context())
+        page = await pool.acquire()
+        await pool.release(page)
+
+        assert await pool.acquire() is page
+        page.goto.assert_awaited_with("about:blank")
+        assert (pool.created, pool.reused) == (1, 1)
+
+    async def test_caps_open_pages(self):
+        """Test that callers beyond max_pages wait for a release."""
+        pool = PagePool(fake_context(), max_pages=2)
+        first = await pool.acquire()
+        await pool.acquire()
+
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await pool.release(first)
+        assert await asyncio.wait_for(waiter, 1) is first
+
+    async def test_recycles_after_max_uses(self):
+        """Test that a page is closed once it reaches max_uses."""
+        pool = PagePool(fake_context(), max_uses=2)
+        page = await pool.acquire()
+        await pool.release(page)
+        await pool.release(await pool.acquire())
+
+        assert page.closed
+        assert await pool.acquire() is not page
+        assert pool.recycled == 1
+
+    async def test_failed_reset_discards_page(self):
+        """Test that a page whose reset navigation fails is not reused."""
+        pool = PagePool(fake_context())
+        page = await pool.acquire()
+        page.goto.side_effect = RuntimeError("crashed")
+        await pool.release(page)
+
+        assert page.closed
+        assert await pool.acquire() is not page
+
+    async def test_close_rejects_new_acquires(self):
+        """Test that closing the pool closes idle pages."""
+        pool = PagePool(fake_context())
+        page = await pool.acquire()
+        await pool.release(page)
+        await pool.close()
+
+        assert page.closed
+        with pytest.raises(RuntimeError):
+            await pool.acquire()
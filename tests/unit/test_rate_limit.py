@@ -0,0 +1,108 @@
+"""Unit tests for per-portal token-bucket rate limiting."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+from mjas.core.scheduler import TaskScheduler
+from mjas.portals.base import PortalConfig
+from mjas.portals.rate_limit import RateLimit, TokenBucket
+from mjas.portals.remoteok import RemoteOKPortal
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for burst and refill arithmetic."""
+
+    def test_burst_then_refill(self):
+        """Test that a full bucket allows a burst, then refills at the rate."""
+        clock = FakeClock()
+        bucket = TokenBucket.from_limit(RateLimit(per_minute=6, burst=3), clock)
+
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+        assert bucket.delay() == 10.0
+
+        clock.now = 10.0
+        assert bucket.try_acquire()
+        clock.now = 1000.0
+        assert bucket.available() == 3  # Never more than the burst
+
+    async def test_acquire_waits_for_refill(self):
+        """Test that acquire paces calls past the burst and records the wait."""
+        bucket = TokenBucket(rate=50, burst=2)
+        started = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        elapsed = time.monotonic() - started
+
+        assert 0.03 <= elapsed < 0.2  # Two refills at 20ms each
+        assert bucket.take_waited() > 0.03
+        assert bucket.waited_seconds == 0
+
+
+class TestPortalNavigation:
+    """Tests for navigation going through the portal's bucket."""
+
+    async def test_goto_takes_a_token(self):
+        """Test that JobPortal.goto spends a token before navigating."""
+        portal = RemoteOKPortal()
+        page = MagicMock()
+        page.goto = AsyncMock()
+        before = portal.rate_limiter.available()
+
+        await portal.goto(page, "https://remoteok.com/", wait_until="domcontentloaded")
+
+        page.goto.assert_awaited_once_with("https://remoteok.com/", wait_until="domcontentloaded")
+        assert portal.rate_limiter.available() < before
+
+    def test_limit_comes_from_config(self):
+        assert PortalConfig(name="x", base_url="").rate_limit == RateLimit()
+        portal = RemoteOKPortal()
+        assert portal.rate_limiter.burst == 5
+        assert portal.rate_limiter.rate == 0.2
+
+
+class TestTokenAwareScheduling:
+    """Tests for the scheduler preferring portals with tokens."""
+
+    async def test_slot_goes_to_portal_with_tokens(self):
+        """Test that an exhausted portal does not take a slot another portal can use."""
+        buckets = {"empty": TokenBucket(rate=20, burst=1), "full": TokenBucket(rate=20, burst=5)}
+        buckets["empty"].try_acquire()
+        scheduler = TaskScheduler(
+            max_concurrent=1, per_portal=1, portal_delay=lambda p: buckets[p].delay()
+        )
+        order = []
+
+        def task(portal):
+            async def run():
+                order.append(portal)
+                buckets[portal].try_acquire()
+            return run
+
+        await scheduler.run_all([
+            ("empty", task("empty"), None),
+            ("full", task("full"), None),
+            ("full", task("full"), None),
+        ])
+
+        assert order == ["full", "full", "empty"]
+
+    async def test_dispatch_resumes_after_refill(self):
+        """Test that waiting work starts once its portal refills, with no other trigger."""
+        bucket = TokenBucket(rate=20, burst=1)
+        bucket.try_acquire()
+        scheduler = TaskScheduler(portal_delay=lambda p: bucket.delay())
+
+        async def noop():
+            return "done"
+
+        result = await asyncio.wait_for(scheduler.run("p", noop), timeout=1)
+        assert result == "done"
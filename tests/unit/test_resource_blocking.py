@@ -0,0 +1,119 @@
+"""Unit tests for resource blocking rules and the route handler."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from mjas.portals.linkedin import LinkedInPortal
+from mjas.portals.resource_blocking import ESTIMATED_BYTES, ResourceBlocker, ResourceBlocking
+
+
+def fake_route(url: str, resource_type: str, page=None):
+    """A Playwright Route stand-in for a request made by ``page``."""
+    route = MagicMock()
+    route.request.url = url
+    route.request.resource_type = resource_type
+    route.request.frame.page = page
+    route.abort = AsyncMock()
+    route.continue_ = AsyncMock()
+    return route
+
+
+class TestResourceBlocking:
+    """Tests for ResourceBlocking rules."""
+
+    def test_blocks_by_type_and_tracker_url(self):
+        """Test that heavy types and analytics hosts are blocked, documents are not."""
+        rules = ResourceBlocking()
+        assert rules.should_block("https://x.com/logo.png", "image")
+        assert rules.should_block("https://www.google-analytics.com/g/collect", "script")
+        assert not rules.should_block("https://www.indeed.com/jobs?q=ai", "document")
+
+    def test_allow_list_wins(self):
+        """Test that an allow pattern overrides type and URL blocks."""
+        rules = ResourceBlocking(allow_url_patterns=(r"/captcha/",))
+        assert not rules.should_block("https://x.com/captcha/challenge.png", "image")
+
+    def test_disabled_blocks_nothing(self):
+        """Test that a disabled policy lets everything through."""
+        assert not ResourceBlocking(enabled=False).should_block("https://x.com/a.png", "image")
+
+    def test_portal_specific_patterns(self):
+        """Test that LinkedIn adds its own tracking endpoints to the defaults."""
+        rules = LinkedInPortal.DEFAULT_CONFIG.resource_blocking
+        assert rules.should_block("https://px.ads.linkedin.com/collect", "xhr")
+        assert rules.should_block("https://www.googletagmanager.com/gtm.js", "script")
+
+
+class TestResourceBlocker:
+    """Tests for the ResourceBlocker route handler."""
+
+    async def test_blocks_only_on_search_pages(self):
+        """Test that requests pass outside searches and are aborted on search pages."""
+        blocker = ResourceBlocker(ResourceBlocking())
+        search_page = object()
+
+        outside = fake_route("https://x.com/a.png", "image", search_page)
+        await blocker._handle(outside)
+        outside.continue_.assert_awaited_once()
+
+        with blocker.searching():
+            blocker.track_page(search_page)
+        inside = fake_route("https://x.com/a.png", "image", search_page)
+        await blocker._handle(inside)
+        document = fake_route("https://x.com/jobs", "document", search_page)
+        await blocker._handle(document)
+
+        inside.abort.assert_awaited_once()
+        document.continue_.assert_awaited_once()
+
+        blocker.untrack_page(search_page)
+        released = fake_route("https://x.com/a.png", "image", search_page)
+        await blocker._handle(released)
+        released.continue_.assert_awaited_once()
+
+        stats = blocker.take_stats()
+        assert stats == {
+            "blocked_requests": 1,
+            "bytes_saved": ESTIMATED_BYTES["image"],
+            "blocked_by_type": {"image": 1},
+        }
+        assert blocker.take_stats()["blocked_requests"] == 0
+
+    async def test_concurrent_application_is_not_blocked(self):
+        """Test that an application page opened while a search runs keeps its images."""
+        portal = LinkedInPortal()
+        blocker = portal.resource_blocker = ResourceBlocker(portal.config.resource_blocking)
+        context = MagicMock()
+        context.new_page = AsyncMock(side_effect=lambda: MagicMock(close=AsyncMock()))
+        searched = asyncio.Event()
+
+        async def search():
+            with blocker.searching():
+                page = await portal.acquire_page(context)
+                searched.set()
+                await asyncio.sleep(0.01)
+            return page
+
+        async def apply():
+            await searched.wait()
+            return await portal.acquire_page(context)
+
+        search_page, apply_page = await asyncio.gather(search(), apply())
+
+        captcha = fake_route("https://x.com/captcha.png", "image", apply_page)
+        await blocker._handle(captcha)
+        captcha.continue_.assert_awaited_once()
+        image = fake_route("https://x.com/logo.png", "image", search_page)
+        await blocker._handle(image)
+        image.abort.assert_awaited_once()
+
+        await portal.release_page(search_page)
+        assert blocker.search_pages == set()
+
+    async def test_install_routes_context(self):
+        """Test that install registers a catch-all route only when enabled."""
+        context = MagicMock()
+        context.route = AsyncMock()
+        await ResourceBlocker(ResourceBlocking()).install(context)
+        await ResourceBlocker(ResourceBlocking(enabled=False)).install(context)
+        context.route.assert_awaited_once()
@@ -0,0 +1,130 @@
+"""Unit tests for archiving and compaction."""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from mjas.core.database import Database, JobStatus
+from mjas.core.retention import ArchiveStore, RetentionPolicy, pack, unpack
+from mjas.portals.base import JobListing
+
+
+def make_listing(job_id: str) -> JobListing:
+    """Build a listing with a description large enough to matter on disk."""
+    return JobListing(
+        job_id=job_id,
+        title=f"AI Engineer {job_id}",
+        company="TestCo",
+        location="Remote",
+        url=f"https://example.com/jobs/{job_id}",
+        portal="linkedin",
+        description="Build agents. " * 200,
+        score=80,
+    )
+
+
+@pytest.fixture
+async def temp_db(tmp_path):
+    """Create a temporary database for testing."""
+    db = Database(tmp_path / "test.db")
+    await db.init()
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+async def archive(tmp_path):
+    """Open a temporary archive store."""
+    async with ArchiveStore(tmp_path / "archive.db") as store:
+        yield store
+
+
+async def age(db: Database, table: str, column: str, days: int) -> None:
+    """Backdate every row of a table."""
+    stamp = datetime.now() - timedelta(days=days)
+    await db._write(lambda conn: conn.execute(f"UPDATE {table} SET {column} = ?", (stamp,)))
+
+
+class TestArchiveExpired:
+    """Tests for Database.archive_expired."""
+
+    def test_pack_round_trips(self):
+        """Test that payloads compress and restore a row."""
+        row = {"job_id": "a", "description": "x" * 1000}
+        payload = pack(row)
+        assert len(payload) < 100
+        assert unpack(payload) == row
+
+    async def test_archives_old_failed_jobs_with_attempts(self, temp_db, archive):
+        """Test that only expired FAILED/SKIPPED jobs move, taking their attempts along."""
+        await temp_db.insert_jobs_bulk(
+            [make_listing("old-failed"), make_listing("old-queued"), make_listing("new-failed")]
+        )
+        await temp_db.update_job_status("old-failed", JobStatus.FAILED)
+        await temp_db.log_application_attempt("old-failed", False, "timeout")
+        await age(temp_db, "jobs", "updated_at", days=45)
+        await temp_db.update_job_status("new-failed", JobStatus.FAILED)
+
+        report = await temp_db.archive_expired(archive, RetentionPolicy(job_days=30, batch_size=1))
+
+        assert report.jobs_archived == 1
+        assert report.applications_archived == 1
+        assert await temp_db.get_job("old-failed") is None
+        assert await temp_db.get_job("old-queued") is not None
+        assert await temp_db.get_job("new-failed") is not None
+
+        archived = await archive.get_job("old-failed")
+        assert archived["status"] == "failed"
+        assert archived["applications"][0]["error_message"] == "timeout"
+
+        stats = await temp_db.get_stats()
+        assert stats["total_jobs"] == 2 and stats["failed"] == 1
+
+    async def test_archives_old_attempts_only(self, temp_db, archive):
+        """Test that attempts past the horizon move while their job stays."""
+        await temp_db.insert_jobs_bulk([make_listing("a")])
+        await temp_db.log_application_attempt("a", True)
+        await age(temp_db, "applications", "applied_at", days=120)
+        await temp_db.log_application_attempt("a", False)
+
+        report = await temp_db.archive_expired(archive, RetentionPolicy(application_days=90))
+
+        assert report.applications_archived == 1
+        assert (await archive.counts())["applications"] == 1
+        (linkedin,) = await temp_db.get_portal_stats()
+        assert linkedin["total_attempts"] == 1
+
+
+class TestCompact:
+    """Tests for Database.compact."""
+
+    async def test_new_database_compacts_incrementally(self, temp_db, archive):
+        """Test that archiving then compacting shrinks the file without a full VACUUM."""
+        await temp_db.insert_jobs_bulk([make_listing(f"j{i}") for i in range(300)])
+        for i in range(300):
+            await temp_db.update_job_status(f"j{i}", JobStatus.SKIPPED)
+        await age(temp_db, "jobs", "updated_at", days=60)
+        await temp_db.archive_expired(archive)
+
+        report = await temp_db.compact()
+
+        assert not report.full_vacuum
+        assert report.bytes_reclaimed > 0
+
+    async def test_legacy_database_gets_one_full_vacuum(self, tmp_path):
+        """Test that a non-incremental file is converted and FTS still matches."""
+        path = tmp_path / "legacy.db"
+        sqlite3.connect(path).execute("CREATE TABLE placeholder (x)").connection.close()
+
+        db = Database(path)
+        await db.init()
+        try:
+            await db.insert_jobs_bulk([make_listing("a")])
+            first = await db.compact()
+            second = await db.compact()
+
+            assert first.full_vacuum and not second.full_vacuum
+            assert [job["job_id"] for job in await db.search_jobs("agents")] == ["a"]
+        finally:
+            await db.close()
@@ -0,0 +1,81 @@
+"""Unit tests for TaskScheduler."""
+
+import asyncio
+
+import pytest
+
+from mjas.core.scheduler import SchedulerClosedError, TaskScheduler
+
+
+def recorder(scheduler, log, name, delay=0.01):
+    """A task factory that logs its start and samples the scheduler's load."""
+    async def task():
+        log.append((name, scheduler.active))
+        await asyncio.sleep(delay)
+        return name
+    return task
+
+
+class TestTaskScheduler:
+    """Tests for limits, fairness and cancellation."""
+
+    async def test_global_limit(self):
+        """Test that no more than max_concurrent tasks run at once."""
+        scheduler = TaskScheduler(max_concurrent=3, per_portal=10)
+        log = []
+        results = await scheduler.run_all(
+            ("p", recorder(scheduler, log, i), None) for i in range(12)
+        )
+
+        assert results == list(range(12))
+        assert scheduler.peak_active == 3
+        assert scheduler.active == 0
+
+    async def test_per_portal_limit(self):
+        """Test that one portal cannot take more than per_portal slots."""
+        scheduler = TaskScheduler(max_concurrent=8, per_portal=2)
+        log = []
+        await scheduler.run_all(("p", recorder(scheduler, log, i), None) for i in range(6))
+
+        assert scheduler.peak_active == 2
+
+    async def test_per_browser_limit(self):
+        """Test that tasks on one browser are capped across portals."""
+        scheduler = TaskScheduler(max_concurrent=8, per_portal=8, per_browser=2)
+        log = []
+        await scheduler.run_all(
+            (portal, recorder(scheduler, log, portal), "browser-1")
+            for portal in ("a", "b", "c", "d")
+        )
+
+        assert scheduler.peak_active == 2
+
+    async def test_round_robin_between_portals(self):
+        """Test that a portal with a long queue does not starve the others."""
+        scheduler = TaskScheduler(max_concurrent=1, per_portal=1)
+        log = []
+        tasks = [("busy", recorder(scheduler, log, f"busy{i}", 0), None) for i in range(4)]
+        tasks += [("quiet", recorder(scheduler, log, "quiet", 0), None)]
+        await scheduler.run_all(tasks)
+
+        # busy0 starts on arrival; after that the portals alternate
+        order = [name for name, _ in log]
+        assert order == ["busy0", "busy1", "quiet", "busy2", "busy3"]
+
+    async def test_close_cancels_queued_and_running(self):
+        """Test that closing cancels queued and running work promptly."""
+        scheduler = TaskScheduler(max_concurrent=1)
+        log = []
+        gathered = asyncio.ensure_future(scheduler.run_all(
+            ("p", recorder(scheduler, log, i, delay=10), None) for i in range(3)
+        ))
+        await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(scheduler.close(), timeout=1)
+        results = await gathered
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+        assert len(log) == 1
+
+        with pytest.raises(SchedulerClosedError):
+            async with scheduler.slot("p"):
+                pass
@@ -0,0 +1,96 @@
+"""Unit tests for yield tracking and the search planner."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from mjas.core.database import Database
+from mjas.core.search_planner import SearchPlanner
+
+KEYWORDS = ["AI Engineer", "LLM Engineer"]
+LOCATIONS = ["Remote", "India"]
+CANDIDATES = [
+    (portal, keyword, location)
+    for portal in ("linkedin", "indeed")
+    for keyword in KEYWORDS
+    for location in LOCATIONS
+]
+
+
+def row(key, recent_yield, empty_streak=0):
+    portal, keyword, location = key
+    return {"portal": portal, "keyword": keyword, "location": location,
+            "recent_yield": recent_yield, "empty_streak": empty_streak}
+
+
+@pytest.fixture
+async def temp_db(tmp_path):
+    db = Database(tmp_path / "test.db")
+    await db.init()
+    yield db
+    await db.close()
+
+
+class TestSearchPlanner:
+    """Tests for choosing searches by recent yield."""
+
+    def test_unseen_combinations_are_always_searched(self):
+        """Test that the first cycle searches everything."""
+        planner = SearchPlanner(yield_threshold=100.0)
+        assert planner.plan(CANDIDATES, []) == CANDIDATES
+
+    def test_productive_combinations_always_run(self):
+        """Test that every combination at or above the threshold runs, best first."""
+        recent = {key: float(i) for i, key in enumerate(CANDIDATES)}
+        history = [row(key, recent_yield, empty_streak=20) for key, recent_yield in recent.items()]
+        planner = SearchPlanner(yield_threshold=3.0, rng=random.Random(1))
+
+        for _ in range(50):
+            plan = planner.plan(CANDIDATES, history)
+            assert {key for key in CANDIDATES if recent[key] >= 3.0} <= set(plan)
+            yields = [recent[key] for key in plan]
+            assert yields == sorted(yields, reverse=True)
+
+    def test_no_fixed_budget(self):
+        """Test that the number of searches follows yield rather than a fixed share."""
+        planner = SearchPlanner(yield_threshold=2.0, rng=random.Random(5))
+        productive = [row(key, 5.0) for key in CANDIDATES]
+        dead = [row(key, 0.0, empty_streak=10) for key in CANDIDATES]
+
+        assert planner.plan(CANDIDATES, productive) == CANDIDATES
+        assert len(planner.plan(CANDIDATES, dead)) < len(CANDIDATES) // 2
+
+    def test_searches_follow_yield_and_decay(self):
+        """Test that productive combinations dominate and dead ones fade but survive."""
+        productive, stale, dead = CANDIDATES[0], CANDIDATES[1], CANDIDATES[2]
+        history = [row(productive, 8.0), row(stale, 0.0, empty_streak=1),
+                   row(dead, 0.0, empty_streak=8)]
+        planner = SearchPlanner(yield_threshold=2.0, rng=random.Random(7))
+
+        counts = Counter()
+        for _ in range(2000):
+            counts.update(planner.plan(CANDIDATES[:3], history))
+
+        assert counts[productive] == 2000
+        assert counts[stale] > counts[dead] > 0
+
+
+class TestSearchYield:
+    """Tests for recording yield in the database."""
+
+    async def test_moving_average_and_empty_streak(self, temp_db):
+        """Test that yield is smoothed and empty searches are counted in a row."""
+        for new_jobs in (10, 0, 0):
+            await temp_db.record_search_yield("linkedin", "AI Engineer", "Remote", new_jobs)
+
+        [stats] = await temp_db.get_search_yields(["linkedin"])
+        assert stats["searches"] == 3
+        assert stats["new_jobs"] == 10
+        assert stats["recent_yield"] == pytest.approx(10 * 0.7 * 0.7)
+        assert stats["empty_streak"] == 2
+
+        await temp_db.record_search_yield("linkedin", "AI Engineer", "Remote", 3)
+        [stats] = await temp_db.get_search_yields()
+        assert stats["empty_streak"] == 0
+        assert await temp_db.get_search_yields(["indeed"]) == []
@@ -0,0 +1,95 @@
+"""Unit tests for tiered session validation."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from mjas.portals.linkedin import LinkedInPortal
+from mjas.portals.session_check import SessionCheck, auth_cookies_valid, probe_session
+
+NOW = 1_800_000_000
+
+
+def state(**cookies):
+    return {"cookies": [{"name": name, "expires": expires} for name, expires in cookies.items()]}
+
+
+def context_with_response(status: int, location: str = ""):
+    context = MagicMock()
+    response = MagicMock()
+    response.status = status
+    response.headers = {"location": location} if location else {}
+    response.dispose = AsyncMock()
+    context.request.get = AsyncMock(return_value=response)
+    return context
+
+
+class TestAuthCookies:
+    """Tests for the cookie tier."""
+
+    def test_present_and_unexpired(self):
+        assert auth_cookies_valid(state(li_at=NOW + 3600), ["li_at"], now=NOW)
+
+    def test_session_cookie_counts_as_valid(self):
+        assert auth_cookies_valid(state(li_at=-1), ["li_at"], now=NOW)
+
+    def test_expired(self):
+        assert not auth_cookies_valid(state(li_at=NOW - 1), ["li_at"], now=NOW)
+
+    def test_missing(self):
+        assert not auth_cookies_valid(state(other=NOW + 3600), ["li_at"], now=NOW)
+
+
+class TestProbe:
+    """Tests for the HTTP probe tier."""
+
+    CHECK = SessionCheck(probe_url="https://example.com/account")
+
+    async def test_ok_means_logged_in(self):
+        context = context_with_response(200)
+        assert await probe_session(context, self.CHECK) is True
+        context.request.get.assert_awaited_once_with(
+            "https://example.com/account", max_redirects=0, timeout=10000
+        )
+
+    async def test_login_redirect_means_logged_out(self):
+        context = context_with_response(302, "https://example.com/login?next=/account")
+        assert await probe_session(context, self.CHECK) is False
+
+    async def test_other_answers_are_inconclusive(self):
+        assert await probe_session(context_with_response(302, "/elsewhere"), self.CHECK) is None
+        assert await probe_session(context_with_response(503), self.CHECK) is None
+
+        context = MagicMock()
+        context.request.get = AsyncMock(side_effect=OSError("network down"))
+        assert await probe_session(context, self.CHECK) is None
+
+
+class TestCheckSession:
+    """Tests for the tier order in JobPortal.check_session."""
+
+    async def test_expired_cookie_skips_network(self):
+        """Test that a missing auth cookie answers without any request."""
+        portal = LinkedInPortal()
+        portal.is_logged_in = AsyncMock(return_value=True)
+        context = context_with_response(200)
+
+        assert await portal.check_session(context, state(li_at=1)) is False
+        context.request.get.assert_not_awaited()
+        portal.is_logged_in.assert_not_awaited()
+
+    async def test_probe_avoids_page_load(self):
+        """Test that a conclusive probe skips the full page check."""
+        portal = LinkedInPortal()
+        portal.is_logged_in = AsyncMock(return_value=False)
+        context = context_with_response(200)
+
+        assert await portal.check_session(context, state(li_at=-1)) is True
+        portal.is_logged_in.assert_not_awaited()
+
+    async def test_inconclusive_probe_falls_back_to_page(self):
+        """Test that the DOM check still decides when the probe cannot."""
+        portal = LinkedInPortal()
+        portal.is_logged_in = AsyncMock(return_value=True)
+        context = context_with_response(500)
+
+        assert await portal.check_session(context, state(li_at=-1)) is True
+        portal.is_logged_in.assert_awaited_once()
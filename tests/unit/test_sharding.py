@@ -0,0 +1,88 @@
+"""Unit tests for multi-process sharding."""
+
+from unittest.mock import MagicMock
+
+from mjas.core.database import DEFAULT_STORAGE, PRODUCTION_STORAGE
+from mjas.core.sharding import ShardSpec, ShardSupervisor, shard_portals, shared_storage
+from mjas.core.swarm import SwarmConfig
+from mjas.portals.base import CandidateProfile
+
+
+def make_spec(shard_id: int) -> ShardSpec:
+    return ShardSpec(
+        shard_id=shard_id,
+        portals=[f"portal{shard_id}"],
+        config=SwarmConfig(),
+        profile=CandidateProfile("A B", "a@b.c", "1", "Remote"),
+        storage=DEFAULT_STORAGE,
+    )
+
+
+def fake_process(alive: bool, exitcode=None):
+    process = MagicMock()
+    process.is_alive.return_value = alive
+    process.exitcode = exitcode
+    return process
+
+
+class TestShardPortals:
+    """Tests for splitting portals into shards."""
+
+    def test_round_robin(self):
+        groups = shard_portals(["a", "b", "c", "d", "e"], 2)
+        assert groups == [["a", "c", "e"], ["b", "d"]]
+
+    def test_no_empty_shards(self):
+        assert shard_portals(["a", "b"], 8) == [["a"], ["b"]]
+
+    def test_shared_storage_is_safe_for_processes(self):
+        storage = shared_storage(DEFAULT_STORAGE)
+        assert storage.journal_mode == "WAL"
+        assert storage.busy_timeout_ms == 30_000
+        assert shared_storage(PRODUCTION_STORAGE) == PRODUCTION_STORAGE
+
+
+class TestShardSupervisor:
+    """Tests for crash handling and stats aggregation."""
+
+    def make_supervisor(self, **kwargs):
+        supervisor = ShardSupervisor([make_spec(0), make_spec(1)], restart_delay_seconds=0, **kwargs)
+        supervisor._start = MagicMock()
+        return supervisor
+
+    def test_crashed_shard_is_restarted(self):
+        """Test that a non-zero exit schedules a restart and a clean exit is final."""
+        supervisor = self.make_supervisor()
+        crashed, done = supervisor.shards
+        crashed.process = fake_process(False, exitcode=1)
+        done.process = fake_process(False, exitcode=0)
+
+        supervisor._check_processes()
+        assert done.finished and not crashed.finished
+        assert crashed.restarts == 1
+
+        supervisor._check_processes()
+        supervisor._start.assert_called_once_with(crashed)
+
+    def test_gives_up_after_max_restarts(self):
+        """Test that a shard crashing repeatedly is eventually abandoned."""
+        supervisor = self.make_supervisor(max_restarts=1)
+        shard = supervisor.shards[0]
+        shard.process = fake_process(False, exitcode=-9)
+
+        supervisor._check_processes()
+        supervisor._check_processes()  # Restarted...
+        supervisor._check_processes()  # ...and crashed again
+        assert shard.finished
+        assert shard.restarts == 1
+
+    def test_totals(self):
+        """Test that cycle stats from all shards are summed."""
+        supervisor = self.make_supervisor()
+        supervisor.events = MagicMock()
+        supervisor.shards[0].cycles = [{"research": 5, "applied": 2, "total_jobs": 40}]
+        supervisor.shards[1].cycles = [{"research": 3, "applied": 1, "total_jobs": 42}]
+
+        totals = supervisor.totals()
+        assert (totals["research"], totals["applied"], totals["cycles"]) == (8, 3, 2)
+        assert totals["total_jobs"] == 42
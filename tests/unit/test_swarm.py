@@ -0,0 +1,171 @@
+"""Unit tests for SwarmOrchestrator startup and cycle modes."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from mjas.core.session_manager import SessionManager
+from mjas.core.swarm import SwarmConfig, SwarmOrchestrator
+from mjas.core.worker import PortalWorker
+from mjas.portals.base import CandidateProfile
+from mjas.portals.rate_limit import TokenBucket
+
+
+def make_swarm(tmp_path, **config):
+    return SwarmOrchestrator(
+        SwarmConfig(**config), MagicMock(),
+        CandidateProfile("A B", "a@b.c", "1", "Remote"),
+        SessionManager(tmp_path / "sessions")
+    )
+
+
+# Per-portal startup behaviour: (seconds to start, result)
+STARTUP = {
+    "linkedin": (0.1, True),
+    "indeed": (0.1, True),
+    "wellfound": (0.0, False),
+    "naukri": (10.0, True),  # Hangs past the timeout
+}
+
+
+async def fake_start(self):
+    delay, result = STARTUP[self.portal.config.name]
+    await asyncio.sleep(delay)
+    return result
+
+
+class TestInitializeWorkers:
+    """Tests for concurrent worker startup."""
+
+    async def test_concurrent_startup_report(self, tmp_path):
+        """Test that workers start together and failures are reported, not waited on."""
+        swarm = make_swarm(tmp_path, startup_concurrency=4, worker_start_timeout_seconds=0.3)
+
+        started = time.monotonic()
+        with patch.object(PortalWorker, "start", fake_start):
+            report = await swarm.initialize_workers(list(STARTUP))
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.6  # Bounded by the timeout, not the sum of startups
+        assert list(swarm.workers) == ["linkedin", "indeed"]
+        by_portal = {s.portal: s for s in report}
+        assert by_portal["linkedin"].started and by_portal["linkedin"].seconds >= 0.1
+        assert by_portal["wellfound"].error == "start failed"
+        assert "timed out" in by_portal["naukri"].error
+        assert swarm.startup_report == report
+
+    async def test_concurrency_bound(self, tmp_path):
+        """Test that at most startup_concurrency workers start at once."""
+        swarm = make_swarm(tmp_path, startup_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def counting_start(self):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return True
+
+        with patch.object(PortalWorker, "start", counting_start):
+            await swarm.initialize_workers(["linkedin", "indeed", "wellfound", "naukri"])
+
+        assert peak == 2
+        assert len(swarm.workers) == 4
+
+
+class TestPortalAssignment:
+    """Tests for following a multi-node portal assignment."""
+
+    async def test_gained_and_lost_portals(self, tmp_path):
+        """Test that lost portals stop and are not searched, and gained ones start."""
+        swarm = make_swarm(tmp_path, search_keywords=["ai"], search_locations=["remote"])
+        swarm.db.get_search_yields = AsyncMock(return_value=[])
+        with patch.object(PortalWorker, "start", AsyncMock(return_value=True)), \
+                patch.object(PortalWorker, "stop", AsyncMock()) as stop:
+            await swarm.apply_assignment(["linkedin", "indeed"])
+            lost = swarm.workers["indeed"]
+            await swarm.apply_assignment(["linkedin", "wellfound"])
+
+        assert sorted(swarm.workers) == ["linkedin", "wellfound"]
+        assert stop.await_count == 1 and lost not in swarm.workers.values()
+        assert [name for name, _, _ in await swarm.plan_searches(["linkedin", "indeed"])] == ["linkedin"]
+
+
+class FakePipelineWorker:
+    """Searches after ``search_delay`` and records when each job reaches the applier."""
+
+    def __init__(self, search_delay: float):
+        self.search_delay = search_delay
+        self.portal = SimpleNamespace(rate_limiter=TokenBucket(rate=100, burst=100))
+        self.browser_key = None
+        self.received = []
+        self.first_attempt_at = None
+
+    async def search_and_queue_ids(self, keyword, location):
+        await asyncio.sleep(self.search_delay)
+        return [f"{keyword}-{location}"]
+
+    async def apply_stream(self, channel):
+        while (job_id := await channel.get()) is not None:
+            self.received.append((job_id, time.monotonic()))
+        return len(self.received)
+
+    async def run_cycle(self):
+        return 0
+
+
+class TestPipelinedPhase:
+    """Tests for streaming research into applications."""
+
+    async def test_fast_portal_applies_before_slow_research_ends(self, tmp_path):
+        """Test that there is no barrier between one portal's searches and another's applier."""
+        swarm = make_swarm(
+            tmp_path, search_keywords=["ai"], search_locations=["remote", "india"],
+            max_concurrent_workers=8
+        )
+        swarm.db.reap_expired_leases = AsyncMock(return_value=0)
+        swarm.db.get_search_yields = AsyncMock(return_value=[])
+        fast, slow = FakePipelineWorker(0.01), FakePipelineWorker(0.2)
+        swarm.workers = {"fast": fast, "slow": slow}
+
+        started = time.monotonic()
+        found, applied = await swarm.run_pipelined_phase()
+
+        assert (found, applied) == (4, 4)
+        assert all(at - started < 0.1 for _, at in fast.received)
+        assert sorted(job_id for job_id, _ in slow.received) == ["ai-india", "ai-remote"]
+
+    async def test_full_buffer_holds_back_searches(self, tmp_path):
+        """Test that searches stall while the applier has not drained the buffer."""
+        swarm = make_swarm(
+            tmp_path, search_keywords=[f"k{i}" for i in range(12)], search_locations=["remote"],
+            max_concurrent_workers=8, max_tasks_per_portal=2, pipeline_buffer=1
+        )
+        swarm.db.reap_expired_leases = AsyncMock(return_value=0)
+        swarm.db.get_search_yields = AsyncMock(return_value=[])
+        worker = FakePipelineWorker(0.0)
+        searched = []
+        seen_at_receipt = []
+
+        async def search(keyword, location):
+            searched.append(keyword)
+            return [keyword]
+
+        async def slow_apply(channel):
+            while await channel.get() is not None:
+                seen_at_receipt.append(len(searched))
+                await asyncio.sleep(0.01)
+            return len(seen_at_receipt)
+
+        worker.search_and_queue_ids = search
+        worker.apply_stream = slow_apply
+        swarm.workers = {"slow": worker}
+
+        found, applied = await swarm.run_pipelined_phase()
+
+        assert (found, applied) == (12, 12)
+        # By the applier's second id, only the searches the buffer and lanes allow have run
+        assert seen_at_receipt[1] <= 4
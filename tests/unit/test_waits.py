@@ -0,0 +1,159 @@
+"""Unit tests for portal wait strategies."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from mjas.portals.indeed import IndeedPortal
+from mjas.portals.waits import (
+    CardCountStable, ForSelector, NetworkIdle, Sleep, StepTimings, WaitStrategy, any_of
+)
+
+
+def page_with_selectors(ready_after: dict):
+    """A page whose selectors appear after the given delays (seconds)."""
+    page = MagicMock()
+
+    async def wait_for_selector(selector, state="attached", timeout=30000):
+        delay = ready_after.get(selector)
+        if delay is None or delay * 1000 > timeout:
+            await asyncio.sleep(timeout / 1000)
+            raise PlaywrightTimeout(f"Timeout waiting for {selector}")
+        await asyncio.sleep(delay)
+
+    page.wait_for_selector = AsyncMock(side_effect=wait_for_selector)
+    return page
+
+
+class TestStrategies:
+    """Tests for the individual wait strategies."""
+
+    async def test_for_selector_returns_when_ready(self):
+        """Test that a selector wait ends when the element appears."""
+        page = page_with_selectors({".card": 0.01})
+        started = time.monotonic()
+
+        assert await ForSelector(".card").wait(page, 1) is True
+        assert time.monotonic() - started < 0.5
+        page.wait_for_selector.assert_awaited_with(".card", state="attached", timeout=1000)
+
+    async def test_for_selector_times_out_quietly(self):
+        """Test that a missing selector returns False instead of raising."""
+        page = page_with_selectors({})
+        assert await ForSelector(".card").wait(page, 0.05) is False
+
+    async def test_network_idle_capped(self):
+        """Test that network idle passes the step timeout through."""
+        page = MagicMock()
+        page.wait_for_load_state = AsyncMock(side_effect=PlaywrightTimeout("busy"))
+
+        assert await NetworkIdle().wait(page, 0.5) is False
+        page.wait_for_load_state.assert_awaited_with("networkidle", timeout=500)
+
+    async def test_card_count_stable(self):
+        """Test that the count wait ends once cards stop being appended."""
+        page = MagicMock()
+        page.evaluate = AsyncMock(side_effect=[10, 15, 20, 20, 20, 20])
+
+        strategy = CardCountStable(".card", interval=0.01, settle_polls=2)
+        assert await strategy.wait(page, 1) is True
+        assert page.evaluate.await_count == 5
+
+    async def test_card_count_still_growing(self):
+        """Test that a count that keeps growing runs into the timeout."""
+        page = MagicMock()
+        counter = iter(range(1000))
+        page.evaluate = AsyncMock(side_effect=lambda *args: next(counter))
+
+        strategy = CardCountStable(".card", interval=0.01)
+        assert await strategy.wait(page, 0.05) is False
+
+    async def test_card_count_waits_for_delayed_growth(self):
+        """Test that a count that only grows after a delay is not mistaken for settled."""
+        page = MagicMock()
+        grows_at = time.monotonic() + 0.1
+        page.evaluate = AsyncMock(side_effect=lambda *args: 25 if time.monotonic() >= grows_at else 10)
+
+        strategy = CardCountStable(".card", interval=0.01, settle_polls=2)
+        assert await strategy.wait(page, 1) is True
+        assert time.monotonic() >= grows_at
+
+    async def test_card_count_never_grows(self):
+        """Test that a count stuck at its initial value runs into the timeout."""
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=10)
+        started = time.monotonic()
+
+        strategy = CardCountStable(".card", interval=0.01, settle_polls=2)
+        assert await strategy.wait(page, 0.05) is False
+        assert time.monotonic() - started >= 0.05
+
+    async def test_any_of_first_match_wins(self):
+        """Test that AnyOf returns on the first met strategy and cancels the rest."""
+        page = page_with_selectors({"text=Sent": 0.01})
+        started = time.monotonic()
+
+        strategy = any_of(ForSelector("text=Missing"), ForSelector("text=Sent"))
+        assert await strategy.wait(page, 1) is True
+        assert time.monotonic() - started < 0.5
+
+    def test_strategy_without_wait_fails_on_creation(self):
+        """Test that an incomplete strategy cannot be instantiated."""
+        class Incomplete(WaitStrategy):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    async def test_sleep_waits_full_delay(self):
+        """Test that the fallback strategy sleeps for the whole timeout."""
+        started = time.monotonic()
+        assert await Sleep().wait(MagicMock(), 0.05) is False
+        assert time.monotonic() - started >= 0.05
+
+
+class TestStepTimings:
+    """Tests for per-step timing."""
+
+    def test_saved_against_fallback(self):
+        """Test that savings are the fixed delays minus the actual waits."""
+        timings = StepTimings()
+        timings.record("results", 0.5, 2, True)
+        timings.record("results", 2.0, 2, False)
+        timings.record("scroll", 0.4, 1, True)
+
+        summary = timings.take()
+        assert summary["results"]["count"] == 2
+        assert summary["results"]["met"] == 1
+        assert summary["results"]["saved"] == 1.5
+        assert timings.summary() == {}
+
+
+class TestPortalSteps:
+    """Tests for JobPortal.wait_for_step."""
+
+    async def test_default_results_wait_uses_card_selector(self):
+        """Test that search results wait for the extraction card selector."""
+        portal = IndeedPortal()
+        page = page_with_selectors({".job_seen_beacon": 0.01})
+
+        assert await portal.wait_for_step(page, "results", 2) is True
+        stats = portal.step_timings.summary()["results"]
+        assert stats["met"] == 1
+        assert stats["saved"] > 1.5
+
+    async def test_declared_wait(self):
+        """Test that a step declared in config.waits uses that strategy."""
+        portal = IndeedPortal()
+        page = page_with_selectors({"input[type='tel']": 0.01})
+
+        assert await portal.wait_for_step(page, "apply_dialog", 2) is True
+
+    async def test_undeclared_step_falls_back_to_sleep(self):
+        """Test that unknown steps keep the fixed delay."""
+        portal = IndeedPortal()
+        assert isinstance(portal.wait_strategy("unknown"), Sleep)
+        assert isinstance(portal.wait_strategy("scroll"), CardCountStable)
@@ -0,0 +1,233 @@
+"""Unit tests for PortalWorker scheduling."""
+
+import asyncio
+import time
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock
+
+from mjas.core.scheduler import TaskScheduler
+from mjas.core.worker import PortalWorker
+from mjas.portals.base import CandidateProfile, JobListing
+from mjas.portals.linkedin import LinkedInPortal
+
+
+def job_row(job_id: str) -> dict:
+    return {
+        "job_id": job_id, "portal": "linkedin", "title": "AI Engineer",
+        "company": "Acme", "location": "Remote",
+        "url": f"https://www.linkedin.com/jobs/view/{job_id}",
+        "description": None, "salary_range": None, "score": 80, "priority": "MEDIUM",
+    }
+
+
+def fake_page():
+    page = MagicMock()
+    page.is_closed.return_value = False
+    page.goto = AsyncMock()
+    page.close = AsyncMock()
+    page.wait_for_selector = AsyncMock()
+    return page
+
+
+class TestPrefetch:
+    """Tests for loading the next job page during the rate-limit pause."""
+
+    def make_worker(self, prefetch: bool = True):
+        portal = LinkedInPortal()
+        worker = PortalWorker(
+            portal, MagicMock(), CandidateProfile("A B", "a@b.c", "1", "Remote"),
+            prefetch=prefetch
+        )
+        worker.context = MagicMock()
+        worker.context.new_page = AsyncMock(side_effect=lambda: fake_page())
+        return worker
+
+    async def test_prefetched_page_is_used_by_apply(self):
+        """Test that the next job's page loads during the pause and is not reloaded."""
+        worker = self.make_worker()
+        started = time.monotonic()
+        await worker._rate_limit_pause(0.05, job_row("j2"))
+        assert time.monotonic() - started >= 0.05
+
+        job = JobListing.from_row(job_row("j2"))
+        page = await worker.portal.acquire_job_page(worker.context, job)
+        page.goto.assert_awaited_once_with(job.url, wait_until="domcontentloaded")
+
+        await worker.portal.load_job_page(page, job)
+        assert page.goto.await_count == 1
+
+    async def test_pause_keeps_spacing_when_load_is_slow(self):
+        """Test that a slow prefetch never shortens the pause."""
+        worker = self.make_worker()
+
+        async def slow_goto(*args, **kwargs):
+            await asyncio.sleep(0.1)
+
+        page = fake_page()
+        page.goto = AsyncMock(side_effect=slow_goto)
+        worker.context.new_page = AsyncMock(return_value=page)
+
+        started = time.monotonic()
+        await worker._rate_limit_pause(0.02, job_row("j2"))
+        assert time.monotonic() - started >= 0.1
+        assert "j2" in worker.portal._prefetched
+
+    async def test_unused_prefetch_is_released(self):
+        """Test that a page prefetched for a job never applied to is closed."""
+        worker = self.make_worker()
+        await worker._rate_limit_pause(0, job_row("j2"))
+        page = worker.portal._prefetched["j2"]
+
+        await worker.portal.discard_prefetched()
+        page.close.assert_awaited_once()
+        assert worker.portal._prefetched == {}
+
+    async def test_disabled(self):
+        """Test that prefetch=False only sleeps."""
+        worker = self.make_worker(prefetch=False)
+        await worker._rate_limit_pause(0, job_row("j2"))
+        worker.context.new_page.assert_not_awaited()
+
+
+class TestSessionCache:
+    """Tests for the worker's cached session check."""
+
+    async def test_result_cached_until_ttl(self):
+        """Test that repeated checks within the TTL do not hit the portal."""
+        worker = PortalWorker(
+            LinkedInPortal(), MagicMock(), CandidateProfile("A B", "a@b.c", "1", "Remote")
+        )
+        worker.portal.check_session = AsyncMock(return_value=True)
+
+        assert await worker.session_valid()
+        assert await worker.session_valid()
+        assert worker.portal.check_session.await_count == 1
+
+        worker.invalidate_session()
+        assert await worker.session_valid()
+        assert worker.portal.check_session.await_count == 2
+
+
+    async def test_expired_session_logs_in_once(self):
+        """Test that a cycle on an expired session re-logs in before claiming, once per TTL."""
+        db = MagicMock()
+        db.claim_jobs = AsyncMock(return_value=[])
+        worker = PortalWorker(
+            LinkedInPortal(), db, CandidateProfile("A B", "a@b.c", "1", "Remote")
+        )
+        worker.portal.check_session = AsyncMock(return_value=False)
+        worker.portal.login = AsyncMock(return_value=True)
+
+        assert await worker.run_cycle() == 0
+        worker.portal.login.assert_awaited_once()
+        db.claim_jobs.assert_awaited_once()
+        assert await worker.portal.before_search(worker.context, worker.ensure_session)
+        assert worker.portal.check_session.await_count == 1  # Cached since the login
+
+    async def test_failed_relogin_skips_cycle(self):
+        """Test that a failed re-login skips the cycle without claiming or retrying."""
+        db = MagicMock()
+        db.claim_jobs = AsyncMock(return_value=[])
+        worker = PortalWorker(
+            LinkedInPortal(), db, CandidateProfile("A B", "a@b.c", "1", "Remote")
+        )
+        worker.portal.check_session = AsyncMock(return_value=False)
+        worker.portal.login = AsyncMock(return_value=False)
+
+        assert await worker.run_cycle() == 0
+        assert await worker.run_cycle() == 0
+        worker.portal.login.assert_awaited_once()
+        db.claim_jobs.assert_not_awaited()
+
+
+    async def test_concurrent_callers_log_in_once(self):
+        """Test that callers racing on an expired session share one check and re-login."""
+        worker = PortalWorker(
+            LinkedInPortal(), MagicMock(), CandidateProfile("A B", "a@b.c", "1", "Remote")
+        )
+
+        async def slow_login(context):
+            await asyncio.sleep(0.02)
+            return True
+
+        worker.portal.check_session = AsyncMock(return_value=False)
+        worker.portal.login = AsyncMock(side_effect=slow_login)
+
+        assert await asyncio.gather(*(worker.ensure_session() for _ in range(5))) == [True] * 5
+        worker.portal.check_session.assert_awaited_once()
+        worker.portal.login.assert_awaited_once()
+
+
+    async def test_check_before_claiming_takes_a_slot(self):
+        """Test that the session check waits for a free scheduler slot like other page work."""
+        scheduler = TaskScheduler(max_concurrent=1, per_portal=1)
+        db = MagicMock()
+        db.claim_jobs = AsyncMock(return_value=[])
+        worker = PortalWorker(
+            LinkedInPortal(), db, CandidateProfile("A B", "a@b.c", "1", "Remote"),
+            scheduler=scheduler
+        )
+        worker.portal.check_session = AsyncMock(return_value=True)
+
+        async with scheduler.slot("linkedin"):
+            cycle = asyncio.ensure_future(worker.run_cycle())
+            await asyncio.sleep(0.02)
+            worker.portal.check_session.assert_not_awaited()
+        assert await cycle == 0
+        worker.portal.check_session.assert_awaited_once()
+
+
+class TestSearchAndQueue:
+    """Tests for queueing search results."""
+
+    async def test_yield_failure_keeps_queued_ids(self):
+        """Test that a failed yield write still returns the ids already inserted."""
+        portal = LinkedInPortal()
+        portal.config = replace(portal.config, requires_login=False)
+        portal.search_jobs = AsyncMock(return_value=[JobListing(
+            job_id="a", title="AI Engineer", company="Acme", location="Remote",
+            url="https://www.linkedin.com/jobs/view/a", portal="linkedin",
+        )])
+        db = MagicMock()
+        db.insert_jobs_bulk = AsyncMock(return_value=["a"])
+        db.record_search_yield = AsyncMock(side_effect=OSError("database is locked"))
+        worker = PortalWorker(portal, db, CandidateProfile("A B", "a@b.c", "1", "Remote"))
+
+        assert await worker.search_and_queue_ids("AI Engineer", "Remote") == ["a"]
+        db.record_search_yield.assert_awaited_once()
+
+
+class TestApplyStream:
+    """Tests for consuming newly queued job ids from a channel."""
+
+    def make_worker(self):
+        portal = LinkedInPortal()
+        portal.config = replace(portal.config, requires_login=False)
+        worker = PortalWorker(portal, MagicMock(), CandidateProfile("A B", "a@b.c", "1", "Remote"))
+        worker._claim_and_apply = AsyncMock(side_effect=lambda job_ids: len(job_ids))
+        return worker
+
+    async def test_batches_ready_ids(self):
+        """Test that ids already waiting are claimed together, up to the batch size."""
+        worker = self.make_worker()
+        worker.CLAIM_BATCH_SIZE = 3
+        channel = asyncio.Queue()
+        for job_id in ["a", "b", "c", "d", None]:
+            channel.put_nowait(job_id)
+
+        assert await worker.apply_stream(channel) == 4
+        batches = [call.args[0] for call in worker._claim_and_apply.await_args_list]
+        assert batches == [["a", "b", "c"], ["d"]]
+
+    async def test_consumes_as_ids_arrive(self):
+        """Test that the applier starts before the producer is finished."""
+        worker = self.make_worker()
+        channel = asyncio.Queue(maxsize=1)
+        consumer = asyncio.ensure_future(worker.apply_stream(channel))
+
+        await channel.put("a")
+        await asyncio.sleep(0)
+        await channel.put("b")  # Would block forever without a consumer
+        await channel.put(None)
+
+        assert await asyncio.wait_for(consumer, timeout=1) == 2